@@ -0,0 +1 @@
+"""Hexabyte benchmark suite."""
@@ -0,0 +1,299 @@
+"""Hexabyte Benchmark Suite.
+
+Measures cold start import time, and data source and rendering performance on generated
+files, and compares results against a stored baseline.
+
+    python -m benchmarks.bench                      # run and print results
+    python -m benchmarks.bench --compare            # fail if slower than the baseline
+    python -m benchmarks.bench --save               # store results as the new baseline
+    python -m benchmarks.bench --sizes 1M,1G,4G     # choose generated file sizes
+
+Every case runs in a fresh process so peak memory is reported per data source and size.
+Peak memory is not reported on platforms without the resource module, such as Windows.
+Import, read, search and render timings report the best of several repeats to reduce noise.
+
+Baselines depend on the machine. The stored baseline was recorded on a single development
+machine, so regenerate it with --save on the machine used for comparisons before using
+--compare.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from multiprocessing import get_context
+from pathlib import Path
+from time import perf_counter
+
+from rich.console import Console
+
+from hexabyte.config import DEFAULT_SETTINGS
+from hexabyte.constants import DisplayMode
+from hexabyte.constants.sizes import KB, MB
+from hexabyte.data_sources import DataSource, MmapDataSource, PagedDataSource, SimpleDataSource
+from hexabyte.view_components import ByteView
+
+try:
+    import resource
+except ImportError:
+    resource = None  # type: ignore[assignment]
+
+BASELINE_FILEPATH = Path(__file__).parent / "baseline.json"
+DEFAULT_SIZES = "1M,16M,128M"
+DEFAULT_TOLERANCE = 0.5
+SIMPLE_MAX_SIZE = 1024 * MB
+SIZE_SUFFIXES = {"K": KB, "M": MB, "G": 1024 * MB}
+
+EDIT_COUNT = 100
+EDIT_SIZE = 16
+FIND_NEEDLE = b"\xde\xad\xbe\xef\x00hexabyte-needle\x00"
+# Modules imported on startup by the entry point and by the interactive application
+IMPORT_MODULES = ("hexabyte.__main__", "hexabyte.hexabyte_app")
+LINE_COUNT = 2000
+RANDOM_READ_COUNT = 1000
+RANDOM_READ_SIZE = 4 * KB
+REPEATS = 5
+SEED = 0x4B1D
+SEQUENTIAL_READ_SIZE = 64 * KB
+
+SOURCES: dict[str, Callable[[Path], DataSource]] = {
+    "simple": SimpleDataSource,
+    "paged": lambda filepath: PagedDataSource(filepath, 64 * KB),
+    "mmap": MmapDataSource,
+}
+
+
+@dataclass
+class Measurement:
+    """A single benchmark result.
+
+    Params
+    ------
+    name - Unique name of the measurement.
+    value - Measured value.
+    unit - Unit of value.
+    higher_is_better - True for throughputs, False for latencies and memory.
+    """
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool = False
+
+    def regressed(self, baseline: float, tolerance: float) -> bool:
+        """Return True if the value is worse than the baseline by more than tolerance."""
+        if self.higher_is_better:
+            return self.value < baseline * (1 - tolerance)
+        return self.value > baseline * (1 + tolerance)
+
+
+def parse_size(size: str) -> int:
+    """Return the number of bytes of a size such as 512K, 16M or 2G."""
+    size = size.strip().upper()
+    if size[-1:] in SIZE_SUFFIXES:
+        return int(float(size[:-1]) * SIZE_SUFFIXES[size[-1]])
+    return int(size)
+
+
+def generate_file(workdir: Path, size: int) -> Path:
+    """Return a generated file of size bytes, creating it if required.
+
+    Data alternates between random and zeroed megabytes, with a needle near the end for searches.
+    """
+    filepath = workdir / f"bench-{size}.bin"
+    if filepath.exists() and filepath.stat().st_size == size:
+        return filepath
+    rand = random.Random(SEED)
+    with filepath.open("wb") as data_file:
+        remaining = size
+        chunk = 0
+        while remaining > 0:
+            length = min(MB, remaining)
+            data_file.write(rand.randbytes(length) if chunk % 2 == 0 else bytes(length))
+            remaining -= length
+            chunk += 1
+        if size > len(FIND_NEEDLE):
+            data_file.seek(size - len(FIND_NEEDLE) - 1)
+            data_file.write(FIND_NEEDLE)
+    return filepath
+
+
+def timed(func: Callable[[], object], repeats: int = 1) -> float:
+    """Return the shortest time taken to call func in seconds."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def bench_source(source_name: str, filepath: Path, label: str) -> list[Measurement]:
+    """Measure a data source. Runs in a dedicated process."""
+    size = filepath.stat().st_size
+    rand = random.Random(SEED)
+    prefix = f"{source_name}/{label}"
+    megabytes = size / MB
+    results = []
+
+    start = perf_counter()
+    source = SOURCES[source_name](filepath)
+    results.append(Measurement(f"{prefix}/open", (perf_counter() - start) * 1000, "ms"))
+
+    def read_sequential() -> None:
+        for offset in range(0, size, SEQUENTIAL_READ_SIZE):
+            source.read(offset, SEQUENTIAL_READ_SIZE)
+
+    elapsed = timed(read_sequential)
+    results.append(Measurement(f"{prefix}/read_sequential", megabytes / elapsed, "MB/s", True))
+
+    offsets = [rand.randrange(max(1, size - RANDOM_READ_SIZE)) for _ in range(RANDOM_READ_COUNT)]
+    elapsed = timed(lambda: [source.read(offset, RANDOM_READ_SIZE) for offset in offsets], REPEATS)
+    results.append(Measurement(f"{prefix}/read_random", elapsed / RANDOM_READ_COUNT * 1e6, "us"))
+
+    elapsed = timed(lambda: source.find(FIND_NEEDLE), REPEATS)
+    results.append(Measurement(f"{prefix}/find", megabytes / elapsed, "MB/s", True))
+
+    edits = [rand.randrange(max(1, size)) for _ in range(EDIT_COUNT)]
+    elapsed = timed(lambda: [source.write(offset, b"\xaa" * EDIT_SIZE, insert=True) for offset in edits])
+    results.append(Measurement(f"{prefix}/insert", elapsed / EDIT_COUNT * 1e6, "us"))
+    elapsed = timed(lambda: [source.replace(offset, EDIT_SIZE, b"") for offset in reversed(edits)])
+    results.append(Measurement(f"{prefix}/delete", elapsed / EDIT_COUNT * 1e6, "us"))
+
+    with tempfile.TemporaryDirectory() as save_dir:
+        elapsed = timed(lambda: source.save(Path(save_dir) / filepath.name))
+        results.append(Measurement(f"{prefix}/save", megabytes / elapsed, "MB/s", True))
+
+    peak = peak_rss()
+    if peak is not None:
+        results.append(Measurement(f"{prefix}/peak_rss", peak, "MB"))
+    return results
+
+
+def peak_rss() -> float | None:
+    """Return the peak resident set size of the process in MB, or None if it is not available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes on Linux and BSD
+    return peak / MB if sys.platform == "darwin" else peak / KB
+
+
+def bench_import() -> list[Measurement]:
+    """Measure the cumulative time a fresh interpreter takes to import each startup module."""
+    results = []
+    for module in IMPORT_MODULES:
+        best = min(import_time(module) for _ in range(REPEATS))
+        results.append(Measurement(f"import/{module}", best / 1000, "ms"))
+    return results
+
+
+def import_time(module: str) -> int:
+    """Return the cumulative import time of module in a fresh interpreter in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, check=True, text=True
+    )
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        # Lines are formatted as "import time: self [us] | cumulative | imported package"
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise ValueError(f"Import time of {module} not reported")
+
+
+def bench_render() -> list[Measurement]:
+    """Measure ByteView line generation for each display mode."""
+    with open(os.devnull, "w", encoding="utf8") as devnull:
+        return _bench_render(Console(file=devnull, width=400))
+
+
+def _bench_render(console: Console) -> list[Measurement]:
+    """Measure ByteView line generation for each display mode, rendering to console."""
+    data = random.Random(SEED).randbytes(4 * KB)
+    results = []
+    for mode in DisplayMode:
+        settings = DEFAULT_SETTINGS.normal[mode.value]
+        view = ByteView.from_data(
+            data,
+            view_mode=mode,
+            column_count=settings["column-count"],
+            column_size=settings["column-size"],
+            offsets=True,
+        )
+        line_length = view.line_byte_length
+
+        def render(view: ByteView = view, line_length: int = line_length) -> None:
+            for line in range(LINE_COUNT):
+                offset = line * line_length % max(1, len(data) - line_length)
+                list(view.generate_line(console, offset, data[offset : offset + line_length], []))
+
+        elapsed = timed(render, REPEATS)
+        results.append(Measurement(f"render/{mode.value}/generate_line", elapsed / LINE_COUNT * 1e6, "us"))
+    return results
+
+
+def run_cases(sizes: list[str], workdir: Path) -> Iterator[Measurement]:
+    """Run each benchmark case in a fresh process."""
+    yield from bench_import()
+    mp_context = get_context("spawn")
+    with mp_context.Pool(1) as pool:
+        yield from pool.apply(bench_render)
+    for label in sizes:
+        filepath = generate_file(workdir, parse_size(label))
+        for source_name in SOURCES:
+            if source_name == "simple" and parse_size(label) > SIMPLE_MAX_SIZE:
+                continue
+            with mp_context.Pool(1) as pool:
+                yield from pool.apply(bench_source, (source_name, filepath, label))
+
+
+def main() -> int:
+    """Run benchmarks and return the process exit status."""
+    parser = argparse.ArgumentParser(prog="benchmarks.bench", description="Hexabyte benchmark suite.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Generated file sizes. Default: {DEFAULT_SIZES}")
+    parser.add_argument("--workdir", type=Path, help="Directory for generated files. Default: a temporary directory")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILEPATH, help="Baseline results file.")
+    parser.add_argument("--compare", action="store_true", help="Fail if results regress from the baseline.")
+    parser.add_argument("--save", action="store_true", help="Store results as the new baseline.")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed regression. Default: %(default)s"
+    )
+    args = parser.parse_args()
+    sizes = [size.strip() for size in args.sizes.split(",") if size.strip()]
+    baseline = json.loads(args.baseline.read_text()) if args.compare and args.baseline.exists() else {}
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workdir = args.workdir or Path(tmp_dir)
+        workdir.mkdir(parents=True, exist_ok=True)
+        results = []
+        regressions = []
+        for result in run_cases(sizes, workdir):
+            results.append(result)
+            status = ""
+            if result.name in baseline:
+                base_value = baseline[result.name]["value"]
+                status = f"baseline {base_value:12.2f}"
+                if result.regressed(base_value, args.tolerance):
+                    regressions.append(result.name)
+                    status += "  REGRESSION"
+            print(f"{result.name:40} {result.value:12.2f} {result.unit:5} {status}")
+
+    if args.save:
+        args.baseline.write_text(json.dumps({result.name: asdict(result) for result in results}, indent=2) + "\n")
+        print(f"Baseline saved to {args.baseline}")
+    if regressions:
+        print(f"{len(regressions)} regressions beyond {args.tolerance:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""Hexabyte Trace Replay Benchmark.
+
+Replays the api commands of an exported action trace against a copy of a file and reports
+the latency of each command.
+
+    python -m benchmarks.replay trace.jsonl firmware.bin
+    python -m benchmarks.replay trace.jsonl firmware.bin --repeat 5
+
+Export traces from the TUI with `trace on`, then `trace export FILEPATH`.
+"""
+from __future__ import annotations
+
+import argparse
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+from hexabyte.config import Config
+from hexabyte.context import context
+from hexabyte.tracing import load_trace, replay
+
+
+def main() -> int:
+    """Replay a trace and return the process exit status."""
+    parser = argparse.ArgumentParser(prog="benchmarks.replay", description="Replay an exported action trace.")
+    parser.add_argument("trace", type=Path, help="Exported trace file.")
+    parser.add_argument("file", type=Path, help="File the trace is replayed against. The file is not modified.")
+    parser.add_argument("--repeat", type=int, default=1, help="Number of replays. Default: %(default)s")
+    args = parser.parse_args()
+    context.config = Config()
+    records = load_trace(args.trace)
+
+    summary: dict[str, dict[str, float]] = {}
+    errors = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for _ in range(max(1, args.repeat)):
+            filepath = Path(tmp_dir) / args.file.name
+            shutil.copyfile(args.file, filepath)
+            replay_tracer = replay(records, filepath)
+            errors += sum(record.error is not None for record in replay_tracer)
+            for name, stats in replay_tracer.summary().items():
+                totals = summary.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "bytes_touched": 0})
+                totals["count"] += stats["count"]
+                totals["total"] += stats["total"]
+                totals["max"] = max(totals["max"], stats["max"])
+                totals["bytes_touched"] += stats["bytes_touched"]
+
+    print(f"{'command':20} {'count':>8} {'mean us':>12} {'max us':>12} {'bytes':>14}")
+    for name, stats in sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True):
+        mean = stats["total"] / stats["count"] * 1e6
+        print(
+            f"{name:20} {stats['count']:8.0f} {mean:12.1f} {stats['max'] * 1e6:12.1f} {stats['bytes_touched']:14,.0f}"
+        )
+    if errors:
+        print(f"{errors} replayed actions failed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
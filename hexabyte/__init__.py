@@ -1,4 +1,14 @@
 """Hexabyte App Package."""
-from .hexabyte_app import HexabyteApp
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    """Import the application class on first access."""
+    if name == "HexabyteApp":
+        from .hexabyte_app import HexabyteApp  # pylint: disable=import-outside-toplevel
+
+        return HexabyteApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["HexabyteApp"]
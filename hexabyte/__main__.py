@@ -1,15 +1,17 @@
-"""Haxabyte Package Main."""
+"""Haxabyte Package Main.
+
+Only lightweight modules are imported at module level so argument handling, `--help` and
+`--version` do not pay for importing the application.
+"""
 
 import argparse
+import sys
 from importlib.metadata import version
 from pathlib import Path
+from typing import Union
 
-from hexabyte.config import Config
 from hexabyte.constants import FileMode
-from hexabyte.constants.generic import MAX_FILE_COUNT, MIN_FILE_COUNT
-from hexabyte.context import context
-from hexabyte.hexabyte_app import HexabyteApp
-from hexabyte.plugins import load_plugins
+from hexabyte.constants.generic import CONFIG_FILENAME, DEFAULT_CONFIG_PATH, MAX_FILE_COUNT, MIN_FILE_COUNT
 
 
 def main():
@@ -19,24 +21,47 @@ def main():
         "Hexabyte can operate in three distinct modes. "
         "Single file mode opens a single file with a single editor. "
         "Split screen mode opens a single file with a split screen view. "
-        "Diff mode opens two files side by side."
+        "Diff mode opens two files side by side. "
+        "Script and patch modes apply a command script or patch specification to any number of files without the TUI."
     )
     parser.add_argument(
         "-c",
         "--config",
         type=Path,
-        default=Config.DEFAULT_FILEPATH,
+        default=DEFAULT_CONFIG_PATH / CONFIG_FILENAME,
         metavar="CONFIG_FILEPATH",
-        help=f"Specify config location. Default: {Config.DEFAULT_FILEPATH}",
+        help=f"Specify config location. Default: {DEFAULT_CONFIG_PATH / CONFIG_FILENAME}",
     )
     parser.add_argument("-s", "--split", action="store_true", help="Display a single file in two split screen editors.")
+    batch_group = parser.add_mutually_exclusive_group()
+    batch_group.add_argument(
+        "--script",
+        type=Path,
+        metavar="SCRIPT_FILEPATH",
+        help="Apply the commands of a script to each file without starting the TUI.",
+    )
+    batch_group.add_argument(
+        "--patch",
+        type=Path,
+        metavar="PATCH_FILEPATH",
+        help="Apply the patches of a TOML patch specification to each file without starting the TUI.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="JOBS",
+        help="Number of files processed in parallel in script and patch mode. Default: CPU count",
+    )
     parser.add_argument("-v", "--version", action="version", version=f"%(prog)s {version('hexabyte')}")
-    parser.add_argument("files", type=Path, nargs="*", help="Specify 1 or 2 filenames")
+    parser.add_argument(
+        "files", type=Path, nargs="*", help="Specify 1 or 2 filenames, or any number in script and patch mode"
+    )
     try:
         args = parser.parse_args()
         if len(args.files) < MIN_FILE_COUNT:
             raise ValueError("Must specify at least one filename")
-        if len(args.files) > MAX_FILE_COUNT:
+        if len(args.files) > MAX_FILE_COUNT and args.script is None and args.patch is None:
             raise ValueError("Must not specify more than two filenames")
         expanded_files = []
         for filename in args.files:
@@ -44,8 +69,22 @@ def main():
             if not expanded_filename.exists():
                 raise FileNotFoundError(f"File not found: {expanded_filename}")
             expanded_files.append(expanded_filename)
+        if args.jobs is not None and args.jobs < 1:
+            raise ValueError("Must specify at least one job")
+        # pylint: disable=import-outside-toplevel
+        from hexabyte.config import Config
+        from hexabyte.context import context
+        from hexabyte.plugins import load_plugins
+
         context.config = Config.from_file(args.config)
         load_plugins()
+        if args.script is not None:
+            sys.exit(run_script_mode(args.script.expanduser(), expanded_files, args.jobs))
+        if args.patch is not None:
+            sys.exit(run_patch_mode(args.patch.expanduser(), expanded_files, args.jobs))
+
+        from hexabyte.hexabyte_app import HexabyteApp
+
         if len(args.files) > 1:
             file_mode = FileMode.DIFF
         elif args.split:
@@ -62,5 +101,31 @@ def main():
         parser.print_help()
 
 
+def run_patch_mode(patch_filepath: Path, files: list[Path], jobs: Union[int, None]) -> int:
+    """Apply a patch specification to files and return the process exit status."""
+    from hexabyte.patch import load_patches, patch_files  # pylint: disable=import-outside-toplevel
+
+    if not patch_filepath.exists():
+        raise FileNotFoundError(f"Patch not found: {patch_filepath}")
+    failed = False
+    for result in patch_files(load_patches(patch_filepath), files, jobs):
+        print(result)
+        failed = failed or result.error is not None
+    return 1 if failed else 0
+
+
+def run_script_mode(script_filepath: Path, files: list[Path], jobs: Union[int, None]) -> int:
+    """Apply a command script to files and return the process exit status."""
+    from hexabyte.script import read_script, run_scripts  # pylint: disable=import-outside-toplevel
+
+    if not script_filepath.exists():
+        raise FileNotFoundError(f"Script not found: {script_filepath}")
+    failed = False
+    for result in run_scripts(read_script(script_filepath), files, jobs):
+        print(result)
+        failed = failed or result.error is not None
+    return 1 if failed else 0
+
+
 if __name__ == "__main__":
     main()  # pylint: disable=no-value-for-parameter
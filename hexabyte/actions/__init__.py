@@ -1,10 +1,23 @@
 """Actions Package."""
-from ._action import Action, ActionError, HandlerAction, RedoError, ReversibleAction, UndoError
+from ._action import (
+    Action,
+    ActionError,
+    CancelError,
+    HandlerAction,
+    LongRunningAction,
+    Progress,
+    RedoError,
+    ReversibleAction,
+    UndoError,
+)
 
 __all__ = [
     "Action",
+    "CancelError",
     "ActionError",
     "HandlerAction",
+    "LongRunningAction",
+    "Progress",
     "RedoError",
     "ReversibleAction",
     "UndoError",
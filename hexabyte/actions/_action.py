@@ -1,6 +1,8 @@
 """Action Event Module."""
 
+import sys
 from abc import ABC, abstractmethod
+from threading import Event
 from typing import Any, Union
 
 
@@ -8,6 +10,10 @@ class ActionError(Exception):
     """Raised when an action fails to execute."""
 
 
+class CancelError(ActionError):
+    """Raised in the worker thread of a long running action when it is cancelled."""
+
+
 class RedoError(ActionError):
     """Raised during a failed redo operation."""
 
@@ -63,6 +69,47 @@ class Action(ABC):
         self._target = target
 
 
+class Progress:
+    """Progress of a long running action.
+
+    Advanced by the worker thread running the action and read or cancelled from the UI thread.
+
+    Params
+    ------
+    total - Amount of work to complete.
+    """
+
+    def __init__(self, total: int = 0) -> None:
+        """Initialize progress."""
+        self.total = total
+        self.done = 0
+        self._cancelled = Event()
+
+    def __str__(self) -> str:
+        """Return the completed percentage."""
+        return f"{self.percent}%"
+
+    @property
+    def cancelled(self) -> bool:
+        """Return True if cancellation was requested."""
+        return self._cancelled.is_set()
+
+    @property
+    def percent(self) -> int:
+        """Return the completed percentage of work."""
+        return min(100, self.done * 100 // self.total) if self.total else 0
+
+    def advance(self, amount: int) -> None:
+        """Record completed work and raise CancelError if cancellation was requested."""
+        self.done += amount
+        if self._cancelled.is_set():
+            raise CancelError("Cancelled")
+
+    def cancel(self) -> None:
+        """Request cancellation. The worker stops the next time it advances."""
+        self._cancelled.set()
+
+
 class HandlerAction(Action):
     """Handler Action Abstract Class.
 
@@ -76,6 +123,11 @@ class ReversibleAction(Action):
     An action that can be undone.
     """
 
+    @property
+    def undo_size(self) -> int:
+        """Return the estimated memory retained to undo the action in bytes."""
+        return sys.getsizeof(self) + sum(sys.getsizeof(value) for value in vars(self).values())
+
     def redo(self) -> None:
         """Alias for self.do()."""
         self.do()
@@ -84,3 +136,32 @@ class ReversibleAction(Action):
     def undo(self) -> None:
         """Reverse all changes performed by the action."""
         raise NotImplementedError
+
+
+class LongRunningAction(ReversibleAction):
+    """Long Running Action Abstract Class.
+
+    A reversible action whose result is prepared away from the UI thread. `start` captures a
+    snapshot of the target on the UI thread, `run` prepares the result from the snapshot in a
+    worker thread, and `do` applies the prepared result at once. Actions set `prepared` once
+    `run` completes, and are run synchronously if performed unprepared.
+    """
+
+    def __init__(self, argv: tuple[str, ...]) -> None:
+        """Initialize LongRunningAction."""
+        super().__init__(argv)
+        self.progress = Progress()
+        self.prepared = False
+
+    @abstractmethod
+    def run(self) -> None:
+        """Prepare the result of the action from the snapshot. Called from a worker thread.
+
+        Implementations advance `progress` regularly so the action can be cancelled.
+        """
+        raise NotImplementedError
+
+    def start(self) -> None:
+        """Reset progress and capture a snapshot of the target. Called on the UI thread."""
+        self.progress = Progress()
+        self.prepared = False
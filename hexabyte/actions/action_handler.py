@@ -1,14 +1,22 @@
 """Action Handler Module."""
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Union
 
 from ..context import context
-from ._action import Action, HandlerAction, ReversibleAction
+from ..profiling import profiler
+from ..tracing import TraceRecord, tracer
+from ._action import Action, HandlerAction, LongRunningAction, ReversibleAction
 
 
 class ActionHandler:
     """Action Handler Class.
 
     Implements action execution and Undo/Redo functionality.
+    Operations are recorded by the action tracer while tracing is enabled.
+    Long running actions are started here, run by the caller, and applied by `do`.
     """
 
     DEFAULT_MAX_UNDO = 100
@@ -17,32 +25,86 @@ class ActionHandler:
         """Initialize the action handler."""
         self.target = target
         self.max_undo = max_undo
+        self.tracer = tracer
         self.undo_history: deque[ReversibleAction] = deque(maxlen=max_undo)
         self.redo_history: deque[ReversibleAction] = deque(maxlen=max_undo)
 
+    @property
+    def undo_memory(self) -> int:
+        """Return the estimated memory held by the undo and redo history in bytes."""
+        return sum(action.undo_size for action in self.undo_history) + sum(
+            action.undo_size for action in self.redo_history
+        )
+
+    @contextmanager
+    def _trace(self, action: Action, operation: str) -> Iterator[None]:
+        """Record the managed operation if tracing is enabled."""
+        if not self.tracer.enabled:
+            yield
+            return
+        touched = getattr(self.target, "bytes_touched", 0)
+        error: Union[str, None] = None
+        start = perf_counter()
+        try:
+            yield
+        except Exception as err:
+            error = str(err) or type(err).__name__
+            raise
+        finally:
+            duration = perf_counter() - start
+            filepath = getattr(self.target, "filepath", None)
+            self.tracer.record(
+                TraceRecord(
+                    action.CMD,
+                    action.argv,
+                    action.TARGET,
+                    operation,
+                    duration,
+                    getattr(self.target, "bytes_touched", 0) - touched,
+                    self.undo_memory,
+                    filepath.name if filepath is not None else "",
+                    error=error,
+                )
+            )
+
     def do(self, action: Action) -> None:  # pylint: disable=invalid-name
         """Process and perform action."""
         action.target = self.target
-        action.do()
-        if isinstance(action, HandlerAction):
-            return
-        if isinstance(action, ReversibleAction):
-            self.undo_history.append(action)
-        context.previous_action = action
-        self.redo_history.clear()
+        with self._trace(action, "do"):
+            if isinstance(action, LongRunningAction) and not action.prepared:
+                action.start()
+                with profiler.timer(f"action.{action.CMD}.run"):
+                    action.run()
+            with profiler.timer(f"action.{action.CMD}"):
+                action.do()
+            if isinstance(action, HandlerAction):
+                return
+            if isinstance(action, ReversibleAction):
+                self.undo_history.append(action)
+            context.previous_action = action
+            self.redo_history.clear()
 
     def redo(self) -> None:
         """Redo action."""
         if len(self.redo_history) == 0:
             return
         last_action = self.redo_history.pop()
-        last_action.redo()
-        self.undo_history.append(last_action)
+        with self._trace(last_action, "redo"):
+            with profiler.timer(f"action.{last_action.CMD}.redo"):
+                last_action.redo()
+            self.undo_history.append(last_action)
+
+    def start(self, action: LongRunningAction) -> None:
+        """Capture the snapshot a long running action is prepared from."""
+        action.target = self.target
+        action.start()
 
     def undo(self) -> None:
         """Undo action."""
         if len(self.undo_history) == 0:
             return
         last_action = self.undo_history.pop()
-        last_action.undo()
-        self.redo_history.append(last_action)
+        with self._trace(last_action, "undo"):
+            with profiler.timer(f"action.{last_action.CMD}.undo"):
+                last_action.undo()
+            self.redo_history.append(last_action)
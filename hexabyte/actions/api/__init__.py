@@ -1,52 +1,38 @@
-"""DataAPI Actions Module."""
-from __future__ import annotations
+"""DataAPI Actions Module.
 
-from typing import TYPE_CHECKING
+Actions are listed in a manifest mapping each command to the module and class implementing
+it. Modules are only imported when their command is first used.
+"""
 
-from .clear import Clear
-from .delete import Delete
-from .find import Find, FindNext, FindPrev
-from .goto import Goto
-from .highlight import Highlight
-from .insert import Insert
-from .move import Move
-from .open import Open
-from .redo import Redo
-from .replace import Replace, ReplaceNext, ReplacePrev
-from .revert import Revert
-from .save import Save
-from .save_as import SaveAs
-from .select import Select
-from .set import Set
-from .undo import Undo
-from .unhighlight import Unhighlight
-
-if TYPE_CHECKING:
-    from .._action import Action
-
-API_ACTIONS: list[type[Action]] = [
-    Clear,
-    Delete,
-    Find,
-    FindNext,
-    FindPrev,
-    Goto,
-    Highlight,
-    Insert,
-    Move,
-    Open,
-    Redo,
-    Replace,
-    ReplaceNext,
-    ReplacePrev,
-    Revert,
-    Set,
-    Save,
-    SaveAs,
-    Select,
-    Undo,
-    Unhighlight,
-]
+API_ACTIONS: dict[str, str] = {
+    "back": f"{__name__}.navigate:Back",
+    "clear": f"{__name__}.clear:Clear",
+    "delete": f"{__name__}.delete:Delete",
+    "find": f"{__name__}.find:Find",
+    "findnext": f"{__name__}.find:FindNext",
+    "findprev": f"{__name__}.find:FindPrev",
+    "forward": f"{__name__}.navigate:Forward",
+    "goto": f"{__name__}.goto:Goto",
+    "highlight": f"{__name__}.highlight:Highlight",
+    "insert": f"{__name__}.insert:Insert",
+    "move": f"{__name__}.move:Move",
+    "nextdiff": f"{__name__}.diff:NextDiff",
+    "open": f"{__name__}.open:Open",
+    "prevdiff": f"{__name__}.diff:PrevDiff",
+    "redo": f"{__name__}.redo:Redo",
+    "replace": f"{__name__}.replace:Replace",
+    "replaceall": f"{__name__}.replace:ReplaceAll",
+    "replacenext": f"{__name__}.replace:ReplaceNext",
+    "replaceprev": f"{__name__}.replace:ReplacePrev",
+    "revert": f"{__name__}.revert:Revert",
+    "set": f"{__name__}.set:Set",
+    "save": f"{__name__}.save:Save",
+    "saveas": f"{__name__}.save_as:SaveAs",
+    "select": f"{__name__}.select:Select",
+    "template": f"{__name__}.template:Template",
+    "undo": f"{__name__}.undo:Undo",
+    "unhighlight": f"{__name__}.unhighlight:Unhighlight",
+}
 
 __all__ = [
     "API_ACTIONS",
@@ -1,6 +1,6 @@
 """Api Action Event Module."""
 
-from .._action import Action, HandlerAction, ReversibleAction
+from .._action import Action, HandlerAction, LongRunningAction, ReversibleAction
 
 
 class ApiAction(Action):
@@ -28,3 +28,12 @@ class ApiHandlerAction(HandlerAction):
     """
 
     TARGET = "api"
+
+
+class LongRunningApiAction(LongRunningAction):
+    """Abstract Long Running Api Action Class.
+
+    An api action prepared from a data snapshot in a worker thread.
+    """
+
+    TARGET = "api"
@@ -0,0 +1,74 @@
+"""Diff Navigation Actions."""
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+from ...commands import InvalidCommandError
+from .._action import ActionError
+from ._api_action import ApiAction
+
+if TYPE_CHECKING:
+    from hexabyte.api import DataAPI
+
+
+class NextDiff(ApiAction):
+    """NextDiff Action.
+
+    Moves the cursor to the start of the next differing data segment.
+
+    Supports zero arguments
+
+    nextdiff
+    """
+
+    CMD = "nextdiff"
+    MIN_ARGS = 0
+    MAX_ARGS = 0
+
+    @property
+    def target(self) -> DataAPI | None:
+        """Get action target."""
+        return self._target
+
+    @target.setter
+    def target(self, target: DataAPI | None) -> None:
+        """Set action target."""
+        self._target = target
+
+    def do(self) -> None:
+        """Perform action."""
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        offsets = [diff.offset for diff in self.target.diffs]
+        idx = bisect_right(offsets, self.target.cursor.byte)
+        if idx >= len(offsets):
+            raise InvalidCommandError("No next difference")
+        self.target.cursor.byte = offsets[idx]
+        self.applied = True
+
+
+class PrevDiff(NextDiff):
+    """PrevDiff Action.
+
+    Moves the cursor to the start of the previous differing data segment.
+
+    Supports zero arguments
+
+    prevdiff
+    """
+
+    CMD = "prevdiff"
+    MIN_ARGS = 0
+    MAX_ARGS = 0
+
+    def do(self) -> None:
+        """Perform action."""
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        offsets = [diff.offset for diff in self.target.diffs]
+        idx = bisect_left(offsets, self.target.cursor.byte) - 1
+        if idx < 0:
+            raise InvalidCommandError("No previous difference")
+        self.target.cursor.byte = offsets[idx]
+        self.applied = True
@@ -6,14 +6,14 @@ from typing import TYPE_CHECKING
 from ...commands import InvalidCommandError, str_to_int
 from ...constants.enums import OffsetType
 from ...constants.sizes import BYTE_BITS
-from .._action import ActionError, UndoError
-from ._api_action import ReversibleApiAction
+from .._action import ActionError
+from ._api_action import ApiAction
 
 if TYPE_CHECKING:
     from hexabyte.api import DataAPI
 
 
-class Goto(ReversibleApiAction):
+class Goto(ApiAction):
     """Goto Action.
 
     Supports a one arg and two arg form:
@@ -23,6 +23,9 @@ class Goto(ReversibleApiAction):
     goto byte 0x1000
 
     goto bit 0x8000
+
+    Cursor movement is not recorded in the undo history. Significant jumps are recorded in
+    the navigation history instead.
     """
 
     CMD = "goto"
@@ -42,7 +45,6 @@ class Goto(ReversibleApiAction):
                     self.offset = str_to_int(argv[1]) * BYTE_BITS
                 else:
                     self.offset = str_to_int(argv[1])
-            self.previous_offset = 0
         except ValueError as err:
             raise InvalidCommandError(" ".join([self.CMD, *argv])) from err
 
@@ -60,13 +62,5 @@ class Goto(ReversibleApiAction):
         """Perform action."""
         if self.target is None:
             raise ActionError("Action target not set.")
-        self.previous_offset = self.target.cursor.bit
         self.target.cursor.bit = self.offset
         self.applied = True
-
-    def undo(self) -> None:
-        """Undo action."""
-        if self.target is None:
-            raise UndoError("Action target not set.")
-        self.target.cursor.bit = self.previous_offset
-        self.applied = False
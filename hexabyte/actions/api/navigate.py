@@ -0,0 +1,84 @@
+"""Navigation History Actions."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ...commands import InvalidCommandError, str_to_int
+from .._action import ActionError
+from ._api_action import ApiAction
+
+if TYPE_CHECKING:
+    from hexabyte.api import DataAPI
+
+
+class Back(ApiAction):
+    """Back Action.
+
+    Return the cursor to earlier positions recorded in the navigation history.
+
+    back
+
+    back 3
+    """
+
+    CMD = "back"
+    MIN_ARGS = 0
+    MAX_ARGS = 1
+
+    def __init__(self, argv: tuple[str, ...]) -> None:
+        """Initialize action."""
+        try:
+            super().__init__(argv)
+            self.count = 1 if self.argc == 0 else str_to_int(argv[0])
+        except ValueError as err:
+            raise InvalidCommandError(" ".join([self.CMD, *argv])) from err
+
+    @property
+    def target(self) -> DataAPI | None:
+        """Get action target."""
+        return self._target
+
+    @target.setter
+    def target(self, target: DataAPI | None) -> None:
+        """Set action target."""
+        self._target = target
+
+    def step(self) -> int | None:
+        """Step through the navigation history and return the new position."""
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        return self.target.navigation.back()
+
+    def do(self) -> None:
+        """Perform action."""
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        offset = None
+        for _ in range(self.count):
+            position = self.step()
+            if position is None:
+                break
+            offset = position
+        if offset is None:
+            raise ActionError("No recorded position")
+        self.target.cursor.bit = offset
+        self.applied = True
+
+
+class Forward(Back):
+    """Forward Action.
+
+    Return the cursor to later positions recorded in the navigation history.
+
+    forward
+
+    forward 3
+    """
+
+    CMD = "forward"
+
+    def step(self) -> int | None:
+        """Step through the navigation history and return the new position."""
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        return self.target.navigation.forward()
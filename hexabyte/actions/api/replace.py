@@ -2,17 +2,29 @@
 from __future__ import annotations
 
 import struct
+from array import array
 from ast import literal_eval
 from typing import TYPE_CHECKING
 
 from ...commands import InvalidCommandError, int_fmt_str
-from ...constants.sizes import BYTE_BITS
+from ...constants.sizes import BYTE_BITS, MB
 from ...context import context
 from .._action import ActionError, UndoError
-from ._api_action import ReversibleApiAction
+from ._api_action import LongRunningApiAction, ReversibleApiAction
 
 if TYPE_CHECKING:
     from hexabyte.api import DataAPI
+    from hexabyte.data_sources import DataSnapshot
+
+SCAN_CHUNK_SIZE = 1 * MB
+
+
+def parse_literal(raw_val: str) -> bytes | int | str:
+    """Return the value of a literal argument, or the argument itself if it is not a literal."""
+    try:
+        return literal_eval(raw_val)
+    except ValueError:
+        return literal_eval(f"{raw_val!r}")
 
 
 class Replace(ReversibleApiAction):
@@ -46,16 +58,8 @@ class Replace(ReversibleApiAction):
                 endian = argv[0]
                 raw_find_val = argv[1]
                 raw_replace_val = argv[2]
-            try:
-                find_val = literal_eval(raw_find_val)
-            except ValueError:
-                find_val = literal_eval(f"{raw_find_val!r}")
-            try:
-                replace_val = literal_eval(raw_replace_val)
-            except ValueError:
-                replace_val = literal_eval(f"{raw_replace_val!r}")
-            self.find_bytes = self.to_bytes(find_val, endian)
-            self.replace_bytes = self.to_bytes(replace_val, endian)
+            self.find_bytes = self.to_bytes(parse_literal(raw_find_val), endian)
+            self.replace_bytes = self.to_bytes(parse_literal(raw_replace_val), endian)
             self.previous_offset = 0
             self.offset = 0
         except ValueError as err:
@@ -161,3 +165,155 @@ class ReplacePrev(ReplaceNext):
         context.find_bytes = self.find_bytes
         context.replace_bytes = self.replace_bytes
         self.applied = True
+
+
+class ReplaceAll(LongRunningApiAction):
+    r"""ReplaceAll Action.
+
+    Replaces every occurrence in the data. Occurrences are searched and the replaced data is
+    prepared in a worker thread, then applied as a single modification once the whole data was
+    scanned. Use `cancel` to stop the search.
+
+    replaceall [ @ | < | > | ! ] FIND_VALUE REPLACE_VALUE
+        - replaceall "hello" "world"
+        - replaceall < 0xffff 0xaaaa
+    """
+
+    CMD = "replaceall"
+    MIN_ARGS = 2
+    MAX_ARGS = 3
+
+    def __init__(self, argv: tuple[str, ...]) -> None:
+        """Initialize action."""
+        try:
+            super().__init__(argv)
+            endian = "@" if self.argc == self.MIN_ARGS else argv[0]
+            self.find_bytes = Replace.to_bytes(parse_literal(argv[-2]), endian)
+            self.replace_bytes = Replace.to_bytes(parse_literal(argv[-1]), endian)
+        except ValueError as err:
+            raise InvalidCommandError(" ".join([self.CMD, *argv])) from err
+        if not self.find_bytes:
+            raise InvalidCommandError(" ".join([self.CMD, *argv]), "Nothing to find")
+        self.matches = array("q")
+        self.previous_offset = 0
+        self.snapshot: DataSnapshot | None = None
+        self.spliced: bytes | None = None
+
+    @property
+    def target(self) -> DataAPI | None:
+        """Get action target."""
+        return self._target
+
+    @target.setter
+    def target(self, target: DataAPI | None) -> None:
+        """Set action target."""
+        self._target = target
+
+    def start(self) -> None:
+        """Capture a snapshot of the data to search."""
+        super().start()
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        self.snapshot = self.target.snapshot()
+        self.matches = array("q")
+        self.spliced = None
+        self.progress.total = len(self.snapshot)
+
+    def run(self) -> None:
+        """Find the offsets of non-overlapping occurrences and splice the replaced data."""
+        if self.snapshot is None:
+            raise ActionError("Action not started.")
+        snapshot = self.snapshot
+        length = len(self.find_bytes)
+        matches = array("q")
+        offset = skip = 0
+        while offset < len(snapshot):
+            if snapshot.stale:
+                raise ActionError(f"Data was modified while {self.CMD} was running.")
+            # Chunks overlap so occurrences spanning a chunk boundary are found
+            chunk = snapshot.read(offset, SCAN_CHUNK_SIZE + length - 1)
+            pos = chunk.find(self.find_bytes, max(0, skip - offset))
+            while pos != -1 and pos < SCAN_CHUNK_SIZE:
+                matches.append(offset + pos)
+                skip = offset + pos + length
+                pos = chunk.find(self.find_bytes, pos + length)
+            self.progress.advance(min(SCAN_CHUNK_SIZE, len(snapshot) - offset))
+            offset += SCAN_CHUNK_SIZE
+        self.matches = matches
+        if matches:
+            start, end = self._span(len(self.find_bytes))
+            self.spliced = self._splice(snapshot.read(start, end - start), len(self.find_bytes), self.replace_bytes)
+        self.prepared = True
+
+    def _span(self, length: int, delta: int = 0) -> tuple[int, int]:
+        """Return the range from the first to the end of the last occurrence.
+
+        Params
+        ------
+        length - Length of each occurrence.
+        delta - Change of offset of each following occurrence.
+        """
+        return self.matches[0], self.matches[-1] + (len(self.matches) - 1) * delta + length
+
+    def _splice(self, data: bytes | bytearray, length: int, insert: bytes, delta: int = 0) -> bytes:
+        """Return the data spanned by the occurrences with each occurrence replaced.
+
+        Params
+        ------
+        data - The spanned data starting at the first occurrence.
+        length - Length of each occurrence in data.
+        insert - Bytes replacing each occurrence.
+        delta - Change of offset of each following occurrence.
+        """
+        view = memoryview(data)
+        first = self.matches[0]
+        parts: list[bytes | memoryview] = []
+        prev = 0
+        for index, match in enumerate(self.matches):
+            pos = match - first + index * delta
+            parts.append(view[prev:pos])
+            parts.append(insert)
+            prev = pos + length
+        return b"".join(parts)
+
+    def do(self) -> None:
+        """Perform action.
+
+        Occurrences are replaced with a single replace of the range spanning them.
+        """
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        if self.snapshot is not None and self.snapshot.stale:
+            raise ActionError(f"Data was modified while {self.CMD} was running.")
+        self.snapshot = None
+        if not self.matches:
+            raise InvalidCommandError(f"{self.find_bytes!r} not found")
+        api = self.target
+        self.previous_offset = api.cursor.bit
+        start, end = self._span(len(self.find_bytes))
+        spliced = self.spliced
+        if spliced is None:
+            spliced = self._splice(api.read_at(start, end - start), len(self.find_bytes), self.replace_bytes)
+        self.spliced = None
+        api.seek(start)
+        api.replace(end - start, spliced)
+        api.cursor.max_bytes = len(api)
+        api.cursor.byte = start
+        context.find_bytes = self.find_bytes
+        context.replace_bytes = self.replace_bytes
+        self.applied = True
+
+    def undo(self) -> None:
+        """Undo action."""
+        if self.target is None:
+            raise UndoError("Action target not set.")
+        api = self.target
+        delta = len(self.replace_bytes) - len(self.find_bytes)
+        start, end = self._span(len(self.replace_bytes), delta)
+        restored = self._splice(api.read_at(start, end - start), len(self.replace_bytes), self.find_bytes, delta)
+        api.cursor.max_bytes = len(api)
+        api.seek(start)
+        api.replace(end - start, restored)
+        api.cursor.max_bytes = len(api)
+        api.cursor.bit = self.previous_offset
+        self.applied = False
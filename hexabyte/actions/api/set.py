@@ -1,7 +1,7 @@
 """Set Action."""
 from __future__ import annotations
 
-from struct import pack, unpack
+from struct import pack
 from typing import TYPE_CHECKING
 
 from ...commands import InvalidCommandError, str_to_int
@@ -111,37 +111,41 @@ class Set(ReversibleApiAction):
         if self.target is None:
             raise ActionError("Action target not set.")
         api = self.target
-        if self.offset.byte == api.cursor.max_bytes:
+        offset = self.offset.byte
+        if offset == api.cursor.max_bytes:
             api.cursor.max_bytes += 1
-        api.seek(self.offset.byte)
-        current_data = api.read(1)
-        self.previous_value = unpack("@B", current_data)[0] if current_data else 0
+        self.previous_value = api.get_byte(offset) if offset < len(api) else 0
         if self.offset_type == OffsetType.BIT:
             bit_position = self.offset.remainder_bits
             if self.value == 0:
                 value = clear_bit(self.previous_value, bit_position)
             else:
                 value = set_bit(self.previous_value, bit_position)
-            api.seek(self.offset.byte)
-            api.write(pack("@B", value))
-            api.cursor.bit += BIT
+            increment = BIT
         elif self.offset_type == OffsetType.NIBBLE:
             nibble = self.offset.remainder_bits // NIBBLE_BITS
             value = set_nibble(self.previous_value, self.value, nibble)
-            api.seek(self.offset.byte)
-            api.write(pack("@B", value))
-            api.cursor.bit += NIBBLE_BITS
+            increment = NIBBLE_BITS
         else:
-            api.seek(self.offset.byte)
-            api.write(pack("@B", self.value))
-            api.cursor.byte += 1
+            value = self.value
+            increment = BYTE_BITS
+        self._set_byte(api, offset, value)
+        api.cursor.bit += increment
         self.applied = True
 
+    @staticmethod
+    def _set_byte(api: DataAPI, offset: int, value: int) -> None:
+        """Set a byte in place, appending it if offset is the end of data."""
+        if offset < len(api):
+            api.set_byte(offset, value)
+            api.seek(offset)
+        else:
+            api.seek(offset)
+            api.write(pack("@B", value))
+
     def undo(self) -> None:
         """Undo action."""
         if self.target is None:
             raise UndoError("Action target not set.")
-        api = self.target
-        api.seek(self.offset.byte)
-        api.write(pack("@B", self.previous_value))
+        self._set_byte(self.target, self.offset.byte, self.previous_value)
         self.applied = False
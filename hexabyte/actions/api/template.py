@@ -0,0 +1,53 @@
+"""Template Action."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ...commands import InvalidCommandError
+from .._action import ActionError
+from ._api_action import ApiAction
+
+if TYPE_CHECKING:
+    from hexabyte.api import DataAPI
+
+
+class Template(ApiAction):
+    """Template Action.
+
+    Overlay a registered template on the data, or remove the overlay:
+
+    template elf64
+
+    template none
+    """
+
+    CMD = "template"
+    MIN_ARGS = 1
+    MAX_ARGS = 1
+
+    def __init__(self, argv: tuple[str, ...]) -> None:
+        """Initialize action."""
+        super().__init__(argv)
+        self.name = None if argv[0].lower() == "none" else argv[0]
+
+    @property
+    def target(self) -> DataAPI | None:
+        """Get action target."""
+        return self._target
+
+    @target.setter
+    def target(self, target: DataAPI | None) -> None:
+        """Set action target."""
+        self._target = target
+
+    def do(self) -> None:
+        """Perform action."""
+        from ...templates import TemplateError  # pylint: disable=import-outside-toplevel
+
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        try:
+            self.target.apply_template(self.name)
+        except TemplateError as err:
+            raise InvalidCommandError(" ".join([self.CMD, *self.argv]), str(err)) from err
+        self.applied = True
@@ -1,4 +1,7 @@
 """App Actions Module."""
+from .cancel import Cancel
 from .exit import Exit
+from .profile import Profile
+from .trace import Trace
 
-__all__ = ["Exit"]
+__all__ = ["Cancel", "Exit", "Profile", "Trace"]
@@ -1,7 +1,15 @@
 """App Action Event Module."""
+from __future__ import annotations
 
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ...commands import InvalidCommandError
 from .._action import Action, HandlerAction, ReversibleAction
 
+if TYPE_CHECKING:
+    from ...hexabyte_app import HexabyteApp
+
 
 class AppAction(Action):
     """Abstract App Action Class.
@@ -12,6 +20,39 @@ class AppAction(Action):
     TARGET = "app"
 
 
+class ToggleAppAction(AppAction):
+    """Abstract Toggle App Action Class.
+
+    An app action switching a feature on or off. Without a subcommand the feature is toggled.
+    The file subcommand requires a filepath argument, other subcommands take no arguments.
+    """
+
+    MIN_ARGS = 0
+    MAX_ARGS = 2
+    SUBCOMMANDS: tuple[str, ...] = ("on", "off")
+    FILE_SUBCOMMAND = ""
+
+    def __init__(self, argv: tuple[str, ...]) -> None:
+        """Initialize action."""
+        super().__init__(argv)
+        self.subcommand = argv[0].lower() if self.argc else None
+        if self.subcommand is not None and self.subcommand not in self.SUBCOMMANDS:
+            raise InvalidCommandError(" ".join([self.CMD, *argv]))
+        if (self.subcommand == self.FILE_SUBCOMMAND) != (self.argc == self.MAX_ARGS):
+            raise InvalidCommandError(" ".join([self.CMD, *argv]), f"Usage: {self.CMD} {self.FILE_SUBCOMMAND} FILEPATH")
+        self.filepath = Path(argv[1]).expanduser() if self.argc == self.MAX_ARGS else None
+
+    @property
+    def target(self) -> HexabyteApp | None:
+        """Get action target."""
+        return self._target
+
+    @target.setter
+    def target(self, target: HexabyteApp | None) -> None:
+        """Set action target."""
+        self._target = target
+
+
 class ReversibleAppAction(ReversibleAction):
     """Abstract Reversible App Action Class.
 
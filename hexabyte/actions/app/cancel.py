@@ -0,0 +1,39 @@
+"""Cancel Action."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._action import ActionError
+from ._app_action import AppAction
+
+if TYPE_CHECKING:
+    from ...hexabyte_app import HexabyteApp
+
+
+class Cancel(AppAction):
+    """Cancel Action.
+
+    Cancels every running long running action.
+    """
+
+    CMD = "cancel"
+
+    @property
+    def target(self) -> HexabyteApp | None:
+        """Get action target."""
+        return self._target
+
+    @target.setter
+    def target(self, target: HexabyteApp | None) -> None:
+        """Set action target."""
+        self._target = target
+
+    def do(self) -> None:
+        """Perform action."""
+        if self.target is None:
+            raise ActionError("Action target not set.")
+        if not self.target.running_actions:
+            raise ActionError("No running action")
+        for action in self.target.running_actions:
+            action.progress.cancel()
+        self.applied = True
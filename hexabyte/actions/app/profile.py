@@ -0,0 +1,32 @@
+"""Profile Action."""
+from __future__ import annotations
+
+from ...profiling import profiler
+from .._action import ActionError
+from ._app_action import ToggleAppAction
+
+
+class Profile(ToggleAppAction):
+    """Profile Action.
+
+    Enables, disables, resets or dumps the timing histograms of instrumented operations.
+    """
+
+    CMD = "profile"
+    SUBCOMMANDS = ("on", "off", "reset", "dump")
+    FILE_SUBCOMMAND = "dump"
+
+    def do(self) -> None:
+        """Perform action."""
+        if self.subcommand == "dump" and self.filepath is not None:
+            try:
+                profiler.dump(self.filepath)
+            except OSError as err:
+                raise ActionError(f"Unable to dump profile - {err}") from err
+        elif self.subcommand == "reset":
+            profiler.reset()
+        elif self.subcommand is None:
+            profiler.enabled = not profiler.enabled
+        else:
+            profiler.enabled = self.subcommand == "on"
+        self.applied = True
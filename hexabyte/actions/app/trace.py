@@ -0,0 +1,32 @@
+"""Trace Action."""
+from __future__ import annotations
+
+from ...tracing import tracer
+from .._action import ActionError
+from ._app_action import ToggleAppAction
+
+
+class Trace(ToggleAppAction):
+    """Trace Action.
+
+    Enables, disables, clears or exports the action trace.
+    """
+
+    CMD = "trace"
+    SUBCOMMANDS = ("on", "off", "clear", "export")
+    FILE_SUBCOMMAND = "export"
+
+    def do(self) -> None:
+        """Perform action."""
+        if self.subcommand == "export" and self.filepath is not None:
+            try:
+                tracer.export(self.filepath)
+            except OSError as err:
+                raise ActionError(f"Unable to export trace - {err}") from err
+        elif self.subcommand == "clear":
+            tracer.clear()
+        elif self.subcommand is None:
+            tracer.enabled = not tracer.enabled
+        else:
+            tracer.enabled = self.subcommand == "on"
+        self.applied = True
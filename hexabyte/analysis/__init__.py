@@ -0,0 +1,34 @@
+"""Data Analysis Package.
+
+Analysis modules depend on numpy, so they are only imported when first accessed.
+"""
+from typing import TYPE_CHECKING, Any
+
+from ..utils import import_object
+
+if TYPE_CHECKING:
+    from .binary_diff import DiffEngine, DiffRange
+    from .entropy import EntropyAnalyzer
+    from .merkle_tree import MerkleTree
+    from .pyramid import Metric, OverviewPyramid
+
+_LAZY_ATTRS = {
+    "DiffEngine": f"{__name__}.binary_diff:DiffEngine",
+    "DiffRange": f"{__name__}.binary_diff:DiffRange",
+    "EntropyAnalyzer": f"{__name__}.entropy:EntropyAnalyzer",
+    "MerkleTree": f"{__name__}.merkle_tree:MerkleTree",
+    "Metric": f"{__name__}.pyramid:Metric",
+    "OverviewPyramid": f"{__name__}.pyramid:OverviewPyramid",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import analysis classes on first access."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = import_object(_LAZY_ATTRS[name])
+    globals()[name] = value
+    return value
+
+
+__all__ = ["DiffEngine", "DiffRange", "EntropyAnalyzer", "MerkleTree", "Metric", "OverviewPyramid"]
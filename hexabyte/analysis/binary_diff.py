@@ -0,0 +1,216 @@
+"""Binary Diff Module.
+
+Compares two data sources in large chunks and produces the list of differing ranges.
+
+Equal chunks are skipped with a single bytes comparison. After a mismatch, a vectorized
+rolling checksum (rsync style) of a bounded lookahead window finds the nearest point where
+both sources line up again, so inserts and deletes do not mark the rest of the data as
+different. Memory use is bounded by the chunk and lookahead sizes regardless of input size.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Union
+
+import numpy as np
+
+from ..constants.sizes import KB, MB
+from ..data_types import DataSegment
+
+DEFAULT_CHUNK_SIZE = 1 * MB
+DEFAULT_LOOKAHEAD = 64 * KB
+DEFAULT_WINDOW = 32
+MAX_RESYNC_CANDIDATES = 64
+
+Reader = Callable[[int, int], Union[bytes, bytearray]]
+
+
+@dataclass(frozen=True)
+class DiffRange:
+    """A pair of differing data ranges.
+
+    A zero length marks data that is only present in the other source.
+    """
+
+    a_offset: int
+    a_length: int
+    b_offset: int
+    b_length: int
+
+    @property
+    def a_segment(self) -> DataSegment | None:
+        """Return the differing segment of the first source."""
+        return DataSegment(self.a_offset, self.a_length) if self.a_length else None
+
+    @property
+    def b_segment(self) -> DataSegment | None:
+        """Return the differing segment of the second source."""
+        return DataSegment(self.b_offset, self.b_length) if self.b_length else None
+
+
+class DiffEngine:
+    """Binary Diff Engine Class.
+
+    Params
+    ------
+    read_a - Callable returning `length` bytes located at `offset` of the first source.
+    size_a - Size of the first source.
+    read_b - Callable returning `length` bytes located at `offset` of the second source.
+    size_b - Size of the second source.
+    chunk_size - Number of bytes compared at once while both sources are aligned.
+    lookahead - Number of bytes searched for a resync point after a mismatch.
+    window - Minimum number of matching bytes required to resync both sources.
+    """
+
+    def __init__(
+        self,
+        read_a: Reader,
+        size_a: int,
+        read_b: Reader,
+        size_b: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        lookahead: int = DEFAULT_LOOKAHEAD,
+        window: int = DEFAULT_WINDOW,
+    ) -> None:
+        """Initialize the diff engine."""
+        if chunk_size < 1 or lookahead < 1 or window < 1:
+            raise ValueError("Chunk size, lookahead and window must be greater than 0.")
+        self._read_a = read_a
+        self._read_b = read_b
+        self.size_a = size_a
+        self.size_b = size_b
+        self.chunk_size = chunk_size
+        self.lookahead = lookahead
+        self.window = window
+        self.cancelled = False
+
+    def __iter__(self) -> Iterator[DiffRange]:
+        """Generate merged differing ranges in offset order."""
+        pending: DiffRange | None = None
+        for diff_range in self._iter_ranges():
+            if (
+                pending is not None
+                and pending.a_offset + pending.a_length == diff_range.a_offset
+                and pending.b_offset + pending.b_length == diff_range.b_offset
+            ):
+                pending = DiffRange(
+                    pending.a_offset,
+                    pending.a_length + diff_range.a_length,
+                    pending.b_offset,
+                    pending.b_length + diff_range.b_length,
+                )
+                continue
+            if pending is not None:
+                yield pending
+            pending = diff_range
+        if pending is not None:
+            yield pending
+
+    def cancel(self) -> None:
+        """Stop an in-progress comparison."""
+        self.cancelled = True
+
+    def diff(self) -> list[DiffRange]:
+        """Return the list of differing ranges."""
+        return list(self)
+
+    def _iter_ranges(self) -> Iterator[DiffRange]:
+        """Generate raw differing ranges."""
+        a_offset = b_offset = 0
+        while a_offset < self.size_a and b_offset < self.size_b and not self.cancelled:
+            length = min(self.chunk_size, self.size_a - a_offset, self.size_b - b_offset)
+            a_data = bytes(self._read_a(a_offset, length))
+            b_data = bytes(self._read_b(b_offset, length))
+            if a_data == b_data:
+                a_offset += length
+                b_offset += length
+                continue
+            equal_length = first_mismatch(a_data, b_data)
+            a_offset += equal_length
+            b_offset += equal_length
+            a_skip, b_skip = self._resync(a_offset, b_offset)
+            yield DiffRange(a_offset, a_skip, b_offset, b_skip)
+            a_offset += a_skip
+            b_offset += b_skip
+        if self.cancelled:
+            return
+        if a_offset < self.size_a or b_offset < self.size_b:
+            yield DiffRange(a_offset, self.size_a - a_offset, b_offset, self.size_b - b_offset)
+
+    def _resync(self, a_offset: int, b_offset: int) -> tuple[int, int]:
+        """Return the number of bytes to skip in each source to line them up after a mismatch."""
+        a_data = bytes(self._read_a(a_offset, self.lookahead))
+        b_data = bytes(self._read_b(b_offset, self.lookahead))
+        candidates = []
+        aligned = aligned_match(a_data, b_data, self.window)
+        if aligned is not None:
+            candidates.append((aligned, aligned))
+        shifted = shifted_match(a_data, b_data, self.window)
+        if shifted is not None:
+            candidates.append(shifted)
+        if candidates:
+            return min(candidates, key=sum)
+        # No resync point nearby, treat data as substituted until both sources line up again.
+        length = min(self.chunk_size, self.size_a - a_offset, self.size_b - b_offset)
+        aligned = aligned_match(
+            bytes(self._read_a(a_offset, length)),
+            bytes(self._read_b(b_offset, length)),
+            self.window,
+        )
+        if aligned is None:
+            return length, length
+        return aligned, aligned
+
+
+def aligned_match(a_data: bytes, b_data: bytes, window: int) -> int | None:
+    """Return the first offset where both buffers contain `window` equal bytes."""
+    length = min(len(a_data), len(b_data))
+    if length < window:
+        return None
+    equal = np.frombuffer(a_data, np.uint8, length) == np.frombuffer(b_data, np.uint8, length)
+    counts = np.concatenate(([0], np.cumsum(equal, dtype=np.int64)))
+    matches = np.flatnonzero(counts[window:] - counts[:-window] == window)
+    return int(matches[0]) if matches.size else None
+
+
+def first_mismatch(a_data: bytes, b_data: bytes) -> int:
+    """Return the offset of the first differing byte of two buffers."""
+    length = min(len(a_data), len(b_data))
+    differ = np.frombuffer(a_data, np.uint8, length) != np.frombuffer(b_data, np.uint8, length)
+    mismatches = np.flatnonzero(differ)
+    return int(mismatches[0]) if mismatches.size else length
+
+
+def rolling_checksums(data: bytes, window: int) -> np.ndarray:
+    """Return the rolling checksum of every `window` sized slice of data.
+
+    Uses the two part weak checksum from rsync, computed for all windows at once from
+    cumulative sums.
+    """
+    values = np.frombuffer(data, np.uint8).astype(np.int64)
+    positions = np.arange(len(values), dtype=np.int64)
+    sums = np.concatenate(([0], np.cumsum(values)))
+    weighted_sums = np.concatenate(([0], np.cumsum(values * positions)))
+    starts = positions[: len(values) - window + 1]
+    low = sums[window:] - sums[:-window]
+    high = (starts + window) * low - (weighted_sums[window:] - weighted_sums[:-window])
+    return (high << 32) | low
+
+
+def shifted_match(a_data: bytes, b_data: bytes, window: int) -> tuple[int, int] | None:
+    """Return the closest offsets where both buffers contain the same `window` bytes."""
+    if len(a_data) < window or len(b_data) < window:
+        return None
+    a_sums = rolling_checksums(a_data, window)
+    b_sums, b_first = np.unique(rolling_checksums(b_data, window), return_index=True)
+    indexes = np.minimum(np.searchsorted(b_sums, a_sums), len(b_sums) - 1)
+    a_hits = np.flatnonzero(b_sums[indexes] == a_sums)
+    if not a_hits.size:
+        return None
+    b_hits = b_first[indexes[a_hits]]
+    for idx in np.argsort(a_hits + b_hits, kind="stable")[:MAX_RESYNC_CANDIDATES]:
+        a_idx, b_idx = int(a_hits[idx]), int(b_hits[idx])
+        if a_data[a_idx : a_idx + window] == b_data[b_idx : b_idx + window]:
+            return a_idx, b_idx
+    return None
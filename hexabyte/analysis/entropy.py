@@ -0,0 +1,192 @@
+"""Entropy Analysis Module.
+
+Computes per-block Shannon entropy and byte histograms of a data source. Data is read in
+large chunks and every block of a chunk is analyzed at once with numpy.
+"""
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Iterator
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..constants.sizes import KB, MB
+
+if TYPE_CHECKING:
+    from ..data_sources import DataSnapshot
+
+BYTE_VALUES = 256
+MAX_ENTROPY = 8.0
+MIN_BLOCK_SIZE = 256
+DEFAULT_BLOCK_SIZE = 4 * KB
+DEFAULT_CHUNK_SIZE = 4 * MB
+DEFAULT_MAX_BLOCKS = 4096
+LARGE_BLOCK_SIZE = 4 * KB
+
+
+class EntropyAnalyzer:
+    """Entropy Analyzer Class.
+
+    Results are cached per block. Edits only invalidate the touched blocks, or every block
+    after the edit when the data size changes.
+
+    Params
+    ------
+    reader - Callable returning `length` bytes located at `offset` of the analyzed data.
+    size - Total size of the analyzed data.
+    block_size - Number of bytes covered by each entropy value and histogram.
+    chunk_size - Number of bytes read and analyzed at once.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int], bytes | bytearray],
+        size: int,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Initialize the analyzer. No data is analyzed until `analyze` is called."""
+        if block_size < 1:
+            raise ValueError("Block size must be greater than 0.")
+        self._read = reader
+        self._lock = Lock()
+        self._generation = 0
+        self.block_size = block_size
+        self.chunk_size = max(block_size, chunk_size // block_size * block_size)
+        self.cancelled = False
+        self.size = size
+        self.entropy = np.full(self.block_count, np.nan, dtype=np.float32)
+        self.histograms = np.zeros((self.block_count, BYTE_VALUES), dtype=np.uint32)
+
+    @property
+    def block_count(self) -> int:
+        """Return the number of blocks."""
+        return -(-self.size // self.block_size)
+
+    @property
+    def complete(self) -> bool:
+        """Return True if every block has been analyzed."""
+        return not np.isnan(self.entropy).any()
+
+    @property
+    def histogram(self) -> np.ndarray:
+        """Return the byte histogram of all analyzed blocks."""
+        return self.histograms.sum(axis=0, dtype=np.uint64)
+
+    @property
+    def progress(self) -> float:
+        """Return the fraction of analyzed blocks."""
+        if not self.block_count:
+            return 1.0
+        return float(np.count_nonzero(~np.isnan(self.entropy))) / self.block_count
+
+    @classmethod
+    def for_size(
+        cls,
+        reader: Callable[[int, int], bytes | bytearray],
+        size: int,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+    ) -> EntropyAnalyzer:
+        """Create an analyzer with the smallest power of two block size producing at most `max_blocks` blocks."""
+        block_size = max(MIN_BLOCK_SIZE, 1 << max(0, math.ceil(math.log2(max(1, size / max_blocks)))))
+        return cls(reader, size, block_size=block_size)
+
+    def analyze(self, snapshot: DataSnapshot | None = None) -> Iterator[float]:
+        """Analyze all pending blocks, yielding progress after each chunk.
+
+        Safe to run in a worker thread while `update` is called from another thread. Results
+        read before an update are discarded. Worker threads should read from a snapshot of the
+        data, and analysis stops once the snapshot is stale.
+        """
+        self.cancelled = False
+        read = self._read if snapshot is None else snapshot.read
+        blocks_per_chunk = self.chunk_size // self.block_size
+        while not self.cancelled:
+            with self._lock:
+                pending = np.flatnonzero(np.isnan(self.entropy))
+                if not pending.size:
+                    return
+                first = int(pending[0])
+                last = min(first + blocks_per_chunk, self.block_count)
+                size = self.size
+                generation = self._generation
+            offset = first * self.block_size
+            data = bytes(read(offset, min(last * self.block_size, size) - offset))
+            entropy, histograms = block_entropy(data, self.block_size)
+            with self._lock:
+                if snapshot is not None and snapshot.stale:
+                    return
+                if generation != self._generation:
+                    continue
+                self.entropy[first : first + len(entropy)] = entropy
+                self.histograms[first : first + len(entropy)] = histograms
+            yield self.progress
+
+    def cancel(self) -> None:
+        """Stop an in-progress analysis."""
+        self.cancelled = True
+
+    def total_entropy(self) -> float:
+        """Return the normalized Shannon entropy of all analyzed data."""
+        histogram = self.histogram
+        total = histogram.sum()
+        if not total:
+            return 0.0
+        probabilities = histogram[histogram > 0] / total
+        return float(-(probabilities * np.log2(probabilities)).sum() / MAX_ENTROPY)
+
+    def update(self, offset: int, old_length: int, new_length: int) -> None:
+        """Invalidate blocks after `old_length` bytes at `offset` were replaced by `new_length` bytes."""
+        with self._lock:
+            self._generation += 1
+            first = max(0, offset) // self.block_size
+            if old_length == new_length:
+                last = -(-(offset + new_length) // self.block_size)
+                self.entropy[first:last] = np.nan
+                self.histograms[first:last] = 0
+                return
+            self.size += new_length - old_length
+            count = self.block_count
+            entropy = np.full(count, np.nan, dtype=np.float32)
+            histograms = np.zeros((count, BYTE_VALUES), dtype=np.uint32)
+            keep = min(first, count)
+            entropy[:keep] = self.entropy[:keep]
+            histograms[:keep] = self.histograms[:keep]
+            self.entropy = entropy
+            self.histograms = histograms
+
+
+def block_entropy(data: bytes, block_size: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return the normalized Shannon entropy and byte histogram of each block of data.
+
+    Entropy is scaled to the range 0 to 1. The last block may be partial.
+    """
+    values = np.frombuffer(data, dtype=np.uint8)
+    count = -(-len(values) // block_size)
+    if not count:
+        return np.zeros(0, dtype=np.float32), np.zeros((0, BYTE_VALUES), dtype=np.uint32)
+    if block_size >= LARGE_BLOCK_SIZE:
+        # Counting each block separately avoids building an index array for every byte
+        histograms = np.stack(
+            [
+                np.bincount(values[idx : idx + block_size], minlength=BYTE_VALUES)
+                for idx in range(0, len(values), block_size)
+            ]
+        ).astype(np.uint32)
+    else:
+        block_indexes = np.arange(len(values), dtype=np.int64) // block_size
+        counts = np.bincount(block_indexes * BYTE_VALUES + values, minlength=count * BYTE_VALUES)
+        histograms = counts.reshape(count, BYTE_VALUES).astype(np.uint32)
+    return histogram_entropy(histograms), histograms
+
+
+def histogram_entropy(histograms: np.ndarray) -> np.ndarray:
+    """Return the normalized Shannon entropy of each row of byte histograms."""
+    lengths = np.maximum(histograms.sum(axis=1, dtype=np.float64), 1)
+    probabilities = histograms / lengths[:, np.newaxis]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = np.where(histograms > 0, probabilities * np.log2(probabilities), 0.0)
+    entropy = (0.0 - terms.sum(axis=1)) / MAX_ENTROPY
+    return entropy.astype(np.float32)
@@ -0,0 +1,289 @@
+"""Merkle Tree Module.
+
+Maintains per-block digests over a data source. Edits only rehash the touched leaves and
+the path from those leaves to the root.
+"""
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from difflib import SequenceMatcher
+from itertools import accumulate, groupby
+
+import numpy as np
+
+from ..constants.sizes import KB, MB
+from ..data_types import DataSegment
+
+DEFAULT_LEAF_SIZE = 64 * KB
+DEFAULT_HASH_ALGORITHM = "sha256"
+READ_SIZE = 1 * MB
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+# Number of bytes preceding a leaf boundary that select it
+WINDOW_SIZE = 4
+WINDOW_MULTIPLIER = np.uint32(0x85EBCA6B)
+
+
+class MerkleTree:
+    """Merkle Tree Class.
+
+    Leaf boundaries are content defined. A boundary follows every group of `WINDOW_SIZE` bytes
+    whose hash falls below a threshold, as long as the leaf is between a quarter and four times
+    the target leaf size. Since boundaries only depend on nearby bytes, inserts and deletes only
+    rehash leaves until the boundaries line up with the previous ones again, and the tree of
+    edited data always matches the tree built from scratch.
+
+    Leaf digests are compared with the digests of the tree last marked clean, so leaves that
+    were only moved by inserts or deletes are unmodified.
+
+    Params
+    ------
+    reader - Callable returning `length` bytes located at `offset` of the tracked data.
+    size - Total size of the tracked data.
+    leaf_size - Target number of bytes covered by a single leaf.
+    algorithm - Name of the hashlib algorithm used for leaf and node digests.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int], bytes | bytearray],
+        size: int,
+        leaf_size: int = DEFAULT_LEAF_SIZE,
+        algorithm: str = DEFAULT_HASH_ALGORITHM,
+    ) -> None:
+        """Initialize the merkle tree and hash all leaves."""
+        if leaf_size < 1:
+            raise ValueError("Leaf size must be greater than 0.")
+        self._read = reader
+        self._leaf_size = leaf_size
+        self._min_leaf_size = max(1, leaf_size // 4)
+        self._max_leaf_size = leaf_size * 4
+        self._threshold = min(2**32 - 1, 2**32 // max(1, leaf_size - self._min_leaf_size))
+        self._algorithm = algorithm
+        self._lengths: list[int] = []
+        self._levels: list[list[bytes]] = [[]]
+        self._offsets: list[int] | None = None
+        self._clean: list[bytes] = []
+        self.rebuild(size)
+
+    def __len__(self) -> int:
+        """Return the number of leaves."""
+        return len(self._lengths)
+
+    @property
+    def algorithm(self) -> str:
+        """Return the name of the hash algorithm."""
+        return self._algorithm
+
+    @property
+    def leaf_size(self) -> int:
+        """Return the target leaf size."""
+        return self._leaf_size
+
+    @property
+    def reader(self) -> Callable[[int, int], bytes | bytearray]:
+        """Return the callable reading the tracked data."""
+        return self._read
+
+    @reader.setter
+    def reader(self, reader: Callable[[int, int], bytes | bytearray]) -> None:
+        """Set the callable reading the tracked data, such as the live data of a tree built from a snapshot."""
+        self._read = reader
+
+    @property
+    def root(self) -> bytes:
+        """Return the root digest."""
+        if not self._lengths:
+            return hashlib.new(self._algorithm, b"").digest()
+        return self._levels[-1][0]
+
+    @property
+    def size(self) -> int:
+        """Return the total size of the tracked data."""
+        return sum(self._lengths)
+
+    def hexdigest(self) -> str:
+        """Return the root digest as a hex string."""
+        return self.root.hex()
+
+    def leaves(self) -> list[DataSegment]:
+        """Return the data segments covered by each leaf."""
+        return [DataSegment(offset, length) for offset, length in zip(self._leaf_offsets(), self._lengths)]
+
+    def mark_clean(self) -> None:
+        """Record the current leaf digests as matching the on-disk data."""
+        self._clean = list(self._levels[0])
+
+    def modified_segments(self) -> list[DataSegment]:
+        """Return data segments of leaves that do not match the clean leaves in order.
+
+        Leaves past the common prefix and suffix are matched as runs of equal digests, such as
+        leaves of padding. Removed leaves mark the leaf following them, or the last leaf, as modified.
+        """
+        digests = self._levels[0]
+        if not digests:
+            return []
+        clean = self._clean
+        prefix = 0
+        while prefix < min(len(clean), len(digests)) and clean[prefix] == digests[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < min(len(clean), len(digests)) - prefix and clean[-suffix - 1] == digests[-suffix - 1]:
+            suffix += 1
+        clean_runs = self._runs(clean[prefix : len(clean) - suffix])
+        runs = self._runs(digests[prefix : len(digests) - suffix])
+        run_offsets = list(accumulate((count for _, count in runs), initial=prefix))
+        matcher = SequenceMatcher(None, [digest for digest, _ in clean_runs], [digest for digest, _ in runs], False)
+        modified: list[tuple[int, int]] = []
+        for tag, clean_start, _, start, stop in matcher.get_opcodes():
+            if tag != "equal":
+                modified.append((run_offsets[start], run_offsets[stop]))
+                continue
+            for run, clean_run in zip(range(start, stop), range(clean_start, clean_start + stop - start)):
+                # Added leaves of a run are its first leaves, removed leaves mark the following leaf
+                added = runs[run][1] - clean_runs[clean_run][1]
+                if added > 0:
+                    modified.append((run_offsets[run], run_offsets[run] + added))
+                elif added < 0:
+                    modified.append((run_offsets[run + 1], run_offsets[run + 1]))
+        leaves = self.leaves()
+        segments = []
+        for first, last in modified:
+            if first == last:
+                segments.append(leaves[min(first, len(leaves) - 1)])
+            else:
+                segments.extend(leaves[first:last])
+        return DataSegment.reduce(segments)
+
+    def rebuild(self, size: int) -> None:
+        """Rehash all data and mark the result as clean."""
+        self._lengths, self._levels[0], _ = self._split(0, size)
+        self._offsets = None
+        self._build_nodes()
+        self.mark_clean()
+
+    def update(self, offset: int, old_length: int, new_length: int) -> None:
+        """Rehash leaves after `old_length` bytes at `offset` were replaced by `new_length` bytes.
+
+        The reader must already return the modified data.
+        """
+        size = self.size
+        offset = min(max(0, offset), size)
+        old_length = min(max(0, old_length), size - offset)
+        if old_length == 0 and new_length == 0:
+            return
+        offsets = self._leaf_offsets()
+        first = self._leaf_index(offset) if offsets else 0
+        delta = new_length - old_length
+        # Boundaries far enough past the modification are selected by unmodified bytes
+        unmodified = offset + new_length + WINDOW_SIZE
+
+        def aligned(boundary: int) -> bool:
+            """Return True if boundary of the modified data is also a previous leaf boundary."""
+            idx = bisect_left(offsets, boundary - delta)
+            return boundary >= unmodified and idx < len(offsets) and offsets[idx] == boundary - delta
+
+        start = offsets[first] if offsets else 0
+        lengths, digests, stop = self._split(start, size + delta, aligned)
+        last = bisect_left(offsets, stop - delta) if stop < size + delta else len(offsets)
+        leaf_count = last - first
+        self._lengths[first:last] = lengths
+        self._levels[0][first:last] = digests
+        self._offsets = None
+        if len(lengths) == leaf_count:
+            self._update_paths(range(first, last))
+        else:
+            self._build_nodes()
+
+    def _boundaries(self, offset: int, data: bytes | bytearray) -> np.ndarray:
+        """Return the candidate leaf boundaries within data located at offset."""
+        if len(data) < WINDOW_SIZE:
+            return np.zeros(0, dtype=np.int64)
+        values = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+        count = len(values) - WINDOW_SIZE + 1
+        window = np.zeros(count, dtype=np.uint32)
+        for idx in range(WINDOW_SIZE):
+            window |= values[idx : idx + count] << np.uint32(8 * idx)
+        # Runs of zeros hash to zero, so padding is split at the minimum leaf size
+        hashes = window * WINDOW_MULTIPLIER
+        return np.flatnonzero(hashes < self._threshold) + offset + WINDOW_SIZE
+
+    def _build_nodes(self) -> None:
+        """Rebuild all internal node levels from the leaf digests."""
+        self._levels = self._levels[:1]
+        level = self._levels[0]
+        while len(level) > 1:
+            level = [self._hash_node(level, idx) for idx in range(0, len(level), 2)]
+            self._levels.append(level)
+
+    def _hash_node(self, level: list[bytes], idx: int) -> bytes:
+        """Hash the pair of nodes starting at idx. An unpaired node is promoted unchanged."""
+        if idx + 1 >= len(level):
+            return level[idx]
+        return hashlib.new(self._algorithm, NODE_PREFIX + level[idx] + level[idx + 1]).digest()
+
+    def _leaf_index(self, offset: int) -> int:
+        """Return the index of the leaf containing offset."""
+        return min(bisect_right(self._leaf_offsets(), offset) - 1, len(self._lengths) - 1)
+
+    def _leaf_offsets(self) -> list[int]:
+        """Return the start offset of each leaf."""
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(self._lengths)][:-1] if self._lengths else []
+        return self._offsets
+
+    def _split(
+        self, offset: int, size: int, stop: Callable[[int], bool] | None = None
+    ) -> tuple[list[int], list[bytes], int]:
+        """Split data following the leaf boundary at offset into leaves and hash them.
+
+        Splitting ends at the end of the data, or at the first boundary accepted by stop.
+        Returns the leaf lengths, the leaf digests and the offset where splitting ended.
+        """
+        lengths: list[int] = []
+        digests: list[bytes] = []
+        base = offset
+        data: bytes | bytearray = b""
+        boundaries = np.zeros(0, dtype=np.int64)
+        # Edits usually only need the leaves around them, so reads start small and grow
+        max_read_size = max(READ_SIZE, self._max_leaf_size)
+        read_size = max_read_size if stop is None else self._max_leaf_size
+        while offset < size:
+            if offset + self._max_leaf_size > base + len(data) and base + len(data) < size:
+                # Boundaries are selected by the bytes preceding them
+                base = max(0, offset - WINDOW_SIZE)
+                data = self._read(base, min(size, offset + read_size) - base)
+                boundaries = self._boundaries(base, data)
+                read_size = min(2 * read_size, max_read_size)
+            idx = np.searchsorted(boundaries, offset + self._min_leaf_size)
+            if idx < len(boundaries) and boundaries[idx] <= offset + self._max_leaf_size:
+                boundary = int(boundaries[idx])
+            else:
+                boundary = min(offset + self._max_leaf_size, size)
+            lengths.append(boundary - offset)
+            leaf_hash = hashlib.new(self._algorithm, LEAF_PREFIX)
+            with memoryview(data) as view:
+                leaf_hash.update(view[offset - base : boundary - base])
+            digests.append(leaf_hash.digest())
+            offset = boundary
+            if stop is not None and stop(offset):
+                break
+        return lengths, digests, offset
+
+    @staticmethod
+    def _runs(digests: list[bytes]) -> list[tuple[bytes, int]]:
+        """Return the digest and length of each run of equal digests."""
+        return [(digest, len(list(run))) for digest, run in groupby(digests)]
+
+    def _update_paths(self, leaf_indexes: range) -> None:
+        """Rehash the nodes on the path from the specified leaves to the root."""
+        indexes = set(leaf_indexes)
+        for depth in range(1, len(self._levels)):
+            indexes = {idx >> 1 for idx in indexes}
+            below = self._levels[depth - 1]
+            for idx in indexes:
+                self._levels[depth][idx] = self._hash_node(below, idx << 1)
@@ -0,0 +1,206 @@
+"""Overview Pyramid Module.
+
+Summarizes a data source at several block sizes so an overview of any range can be
+rendered from a bounded number of precomputed values.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from enum import Enum
+from threading import Lock
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from ..constants.sizes import KB, MB
+from .entropy import BYTE_VALUES, block_entropy, histogram_entropy
+
+if TYPE_CHECKING:
+    from ..data_sources import DataSnapshot
+
+DEFAULT_LEVEL_SIZES = (64 * KB, 1 * MB, 16 * MB)
+MAX_BYTE_VALUE = BYTE_VALUES - 1
+
+
+class Metric(Enum):
+    """Per-block overview statistics."""
+
+    MEAN = "mean"
+    ENTROPY = "entropy"
+    ZEROS = "zeros"
+
+
+@dataclass
+class PyramidLevel:
+    """Per-block statistics of a single pyramid level. All values are scaled to the range 0 to 1."""
+
+    block_size: int
+    mean: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    entropy: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    zeros: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+
+    def __len__(self) -> int:
+        """Return the number of blocks."""
+        return len(self.mean)
+
+    def resize(self, size: int, keep: int) -> None:
+        """Resize the level for `size` bytes of data, keeping the first `keep` bytes of statistics."""
+        count = -(-size // self.block_size)
+        keep_blocks = min(keep // self.block_size, count, len(self))
+        for metric in Metric:
+            values = np.zeros(count, dtype=np.float32)
+            values[:keep_blocks] = self.values(metric)[:keep_blocks]
+            setattr(self, metric.value, values)
+
+    def values(self, metric: Metric) -> np.ndarray:
+        """Return the per-block values of a metric."""
+        return getattr(self, metric.value)
+
+
+class OverviewPyramid:
+    """Overview Pyramid Class.
+
+    Data is analyzed one top level block at a time. Statistics of every level are derived
+    from the byte histograms of the smallest blocks, so each byte is only read once. Edits
+    only invalidate the touched top level blocks, or every following block when the data
+    size changes.
+
+    Params
+    ------
+    reader - Callable returning `length` bytes located at `offset` of the data.
+    size - Total size of the data.
+    level_sizes - Increasing block sizes of each level. Each size must be a multiple of the previous size.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int], bytes | bytearray],
+        size: int,
+        level_sizes: tuple[int, ...] = DEFAULT_LEVEL_SIZES,
+    ) -> None:
+        """Initialize the pyramid. No data is analyzed until `analyze` is called."""
+        if not level_sizes or any(
+            smaller < 1 or larger % smaller for smaller, larger in zip(level_sizes, level_sizes[1:])
+        ):
+            raise ValueError("Level sizes must be increasing multiples of each other.")
+        self._read = reader
+        self._lock = Lock()
+        self._generation = 0
+        self.cancelled = False
+        self.size = size
+        self.levels = [PyramidLevel(block_size) for block_size in level_sizes]
+        for level in self.levels:
+            level.resize(size, 0)
+        self._valid = np.zeros(len(self.levels[-1]), dtype=bool)
+
+    @property
+    def chunk_size(self) -> int:
+        """Return the number of bytes analyzed at once."""
+        return self.levels[-1].block_size
+
+    @property
+    def complete(self) -> bool:
+        """Return True if all data has been analyzed."""
+        return bool(self._valid.all())
+
+    @property
+    def progress(self) -> float:
+        """Return the fraction of analyzed data."""
+        if not self._valid.size:
+            return 1.0
+        return float(np.count_nonzero(self._valid)) / self._valid.size
+
+    def analyze(self, snapshot: DataSnapshot | None = None) -> Iterator[float]:
+        """Analyze all pending data, yielding progress after each top level block.
+
+        Safe to run in a worker thread while `update` is called from another thread. Results
+        read before an update are discarded. Worker threads should read from a snapshot of the
+        data, and analysis stops once the snapshot is stale.
+        """
+        self.cancelled = False
+        read = self._read if snapshot is None else snapshot.read
+        while not self.cancelled:
+            with self._lock:
+                pending = np.flatnonzero(~self._valid)
+                if not pending.size:
+                    return
+                chunk = int(pending[0])
+                size = self.size
+                generation = self._generation
+            offset = chunk * self.chunk_size
+            data = bytes(read(offset, min(self.chunk_size, size - offset)))
+            stats = self._chunk_stats(data)
+            with self._lock:
+                if snapshot is not None and snapshot.stale:
+                    return
+                if generation != self._generation:
+                    continue
+                for level, (mean, entropy, zeros) in zip(self.levels, stats):
+                    first = offset // level.block_size
+                    level.mean[first : first + len(mean)] = mean
+                    level.entropy[first : first + len(mean)] = entropy
+                    level.zeros[first : first + len(mean)] = zeros
+                self._valid[chunk] = True
+            yield self.progress
+
+    def cancel(self) -> None:
+        """Stop an in-progress analysis."""
+        self.cancelled = True
+
+    def level_for(self, span: float) -> PyramidLevel:
+        """Return the coarsest level whose blocks are no larger than `span` bytes."""
+        for level in reversed(self.levels):
+            if level.block_size <= span:
+                return level
+        return self.levels[0]
+
+    def sample(self, metric: Metric, offset: int, length: int, cells: int) -> np.ndarray:
+        """Return `cells` values of a metric, each summarizing an equal share of the data range.
+
+        Work is proportional to the number of cells rather than the size of the range.
+        """
+        if cells < 1 or length < 1 or not self.size:
+            return np.zeros(max(cells, 0), dtype=np.float32)
+        span = length / cells
+        level = self.level_for(span)
+        values = level.values(metric)
+        bounds = offset + np.arange(cells + 1, dtype=np.float64) * span
+        starts = np.minimum(bounds[:-1] // level.block_size, len(level) - 1).astype(np.intp)
+        stops = np.maximum(np.minimum(np.ceil(bounds[1:] / level.block_size), len(level)).astype(np.intp), starts + 1)
+        if level.block_size >= span:
+            return values[starts]
+        sums = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+        return ((sums[stops] - sums[starts]) / (stops - starts)).astype(np.float32)
+
+    def update(self, offset: int, old_length: int, new_length: int) -> None:
+        """Invalidate data after `old_length` bytes at `offset` were replaced by `new_length` bytes."""
+        with self._lock:
+            self._generation += 1
+            first = max(0, offset) // self.chunk_size
+            if old_length == new_length:
+                last = -(-(offset + new_length) // self.chunk_size)
+                self._valid[first:last] = False
+                return
+            self.size += new_length - old_length
+            keep = first * self.chunk_size
+            for level in self.levels:
+                level.resize(self.size, keep)
+            valid = np.zeros(len(self.levels[-1]), dtype=bool)
+            keep_blocks = min(first, len(valid))
+            valid[:keep_blocks] = self._valid[:keep_blocks]
+            self._valid = valid
+
+    def _chunk_stats(self, data: bytes) -> list[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Return the mean, entropy and zero fraction of every level's blocks within a chunk."""
+        base_size = self.levels[0].block_size
+        _, histograms = block_entropy(data, base_size)
+        stats = []
+        for level in self.levels:
+            step = level.block_size // base_size
+            level_histograms = np.add.reduceat(histograms, np.arange(0, len(histograms), step), axis=0)
+            lengths = np.maximum(level_histograms.sum(axis=1, dtype=np.float64), 1)
+            mean = level_histograms @ np.arange(BYTE_VALUES, dtype=np.float64) / lengths / MAX_BYTE_VALUE
+            zeros = level_histograms[:, 0] / lengths
+            stats.append((mean.astype(np.float32), histogram_entropy(level_histograms), zeros.astype(np.float32)))
+        return stats
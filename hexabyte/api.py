@@ -1,6 +1,14 @@
 """Hexabyte Data Api Package."""
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable, Hashable
+from functools import partial
+from os.path import getsize
 from pathlib import Path
-from typing import Union
+from typing import TYPE_CHECKING
 
 from rich.style import Style
 
@@ -11,8 +19,24 @@ from .commands import register
 from .constants.sizes import KB, MB
 from .context import context
 from .cursor import Cursor
-from .data_sources import SimpleDataSource
+from .data_sources import (
+    DataChange,
+    DataSnapshot,
+    DataSource,
+    PagedDataSource,
+    SimpleDataSource,
+    ViewportCache,
+    WriteBackCache,
+)
+from .data_sources.write_back_cache import overlay
 from .data_types import DataSegment
+from .navigation import DEFAULT_CAPACITY as DEFAULT_NAV_CAPACITY
+from .navigation import NavigationHistory
+from .profiling import profiled
+
+if TYPE_CHECKING:
+    from .analysis import EntropyAnalyzer, MerkleTree, OverviewPyramid
+    from .templates import TemplateParser
 
 
 @register(API_ACTIONS)
@@ -24,42 +48,126 @@ class DataAPI:
     Params
     ------
     filename - The filename of the file that will back the data api.
+    source_class - The data source used for the file. Selected by file size if not specified.
+
+    `bytes_touched` counts the bytes read at the cursor, scanned by searches and modified.
+    `navigation` records significant cursor jumps separately from the undo history.
+    Byte ranges whose display changed are logged so views only repaint the affected lines.
+    Subscribers, including the viewport cache and analyzers, are notified of each modification.
     """
 
     SOURCE_THRESHHOLD = 4 * MB  # 4MB
-    BLOCK_SIZE = 4 * KB  # 4KB
+    BLOCK_SIZE = 64 * KB  # 64KB
+    CHANGE_LOG_SIZE = 64
 
     def __init__(
         self,
         filepath: Path,
+        source_class: type[DataSource] | None = None,
     ) -> None:
         """Initialize the data api."""
-        max_undo = context.config.settings.get("general", {}).get("max-undo")
-        self.action_handler = ActionHandler(self, max_undo=max_undo)
+        general_config = context.config.settings.get("general", {})
+        self.action_handler = ActionHandler(self, max_undo=general_config.get("max-undo"))
+        self.navigation = NavigationHistory(general_config.get("max-nav-history", DEFAULT_NAV_CAPACITY))
 
+        self._diffs: list[DataSegment] = []
+        self._diff_offsets: list[int] = []
         self._highlights: list[DataSegment] = []
-        self._selection: Union[DataSegment, None] = None
+        self._selection: DataSegment | None = None
         self._reduced = True
-        self.open(filepath)
+        self._entropy: EntropyAnalyzer | None = None
+        self._merkle: MerkleTree | None = None
+        self._overview: OverviewPyramid | None = None
+        self._template: TemplateParser | None = None
+        self._version = 0
+        self._change_log: deque[tuple[int, int, int]] = deque(maxlen=self.CHANGE_LOG_SIZE)
+        self._change_count = 0
+        self.bytes_touched = 0
+        self._subscribers: dict[Hashable, Callable[[DataChange], None]] = {}
+        self._flushing = False
+        self._cache = WriteBackCache(lambda offset, length: self._source.read(offset, length), self._write_back)
+        self.viewport = ViewportCache(self.read_at, loaded=self.is_loaded, loader=self._cache.read)
+        self._subscribe_update("viewport", self.viewport.update)
+        self.open(filepath, source_class)
 
     def __len__(self) -> int:
         """Return length of data."""
         return len(self._source)
 
+    @property
+    def diffs(self) -> list[DataSegment]:
+        """Return the sorted list of data segments that differ from the compared data."""
+        return self._diffs
+
+    @property
+    def entropy(self) -> EntropyAnalyzer:
+        """Return the entropy analyzer of the current data.
+
+        Blocks are analyzed on demand and invalidated as data is modified.
+        """
+        if self._entropy is None:
+            from .analysis import EntropyAnalyzer  # pylint: disable=import-outside-toplevel
+
+            self._entropy = EntropyAnalyzer.for_size(self.read_at, len(self))
+            self._subscribe_update("entropy", self._entropy.update)
+        return self._entropy
+
     @property
     def filepath(self) -> Path:
         """Returns data source filepath."""
         return self._source.filepath
 
+    @property
+    def has_merkle(self) -> bool:
+        """Return True if the merkle tree of the current data was built."""
+        return self._merkle is not None
+
     @property
     def highlighted_bytes(self) -> int:
         """Return the number of highlighted bytes."""
         return sum(map(len, self._highlights))
 
+    @property
+    def merkle(self) -> MerkleTree:
+        """Return the merkle tree of the current data.
+
+        The tree is built on first access and kept up to date as data is modified.
+        """
+        if self._merkle is None:
+            from .analysis import MerkleTree  # pylint: disable=import-outside-toplevel
+
+            merkle = MerkleTree(self.read_at, len(self))
+            self.merkle = merkle
+            return merkle
+        return self._merkle
+
+    @merkle.setter
+    def merkle(self, merkle: MerkleTree) -> None:
+        """Set a merkle tree built from the current data, such as from a snapshot in a worker thread.
+
+        The tree reads the data through the api to stay up to date as data is modified.
+        """
+        merkle.reader = self.read_at
+        self._merkle = merkle
+        self._subscribe_update("merkle", merkle.update)
+
     @property
     def modified(self) -> bool:
         """Return True if data contains unsave modifications."""
-        return self._source.modified
+        return self._source.modified or self._cache.dirty
+
+    @property
+    def overview(self) -> OverviewPyramid:
+        """Return the overview pyramid of the current data.
+
+        Data is analyzed on demand and invalidated as data is modified.
+        """
+        if self._overview is None:
+            from .analysis import OverviewPyramid  # pylint: disable=import-outside-toplevel
+
+            self._overview = OverviewPyramid(self.read_at, len(self))
+            self._subscribe_update("overview", self._overview.update)
+        return self._overview
 
     @property
     def selected_bytes(self) -> int:
@@ -68,6 +176,21 @@ class DataAPI:
             return len(self._selection)
         return 0
 
+    @property
+    def template(self) -> TemplateParser | None:
+        """Return the parser of the template overlaid on the data, if any."""
+        return self._template
+
+    @property
+    def change_count(self) -> int:
+        """Return the number of logged display changes."""
+        return self._change_count
+
+    @property
+    def version(self) -> int:
+        """Return the data version. Incremented each time data is modified."""
+        return self._version
+
     @property
     def highlights(self) -> list[DataSegment]:
         """Return the reduced list of highlighted data segments.
@@ -79,84 +202,253 @@ class DataAPI:
         return self._highlights
 
     @property
-    def selection(self) -> Union[DataSegment, None]:
+    def selection(self) -> DataSegment | None:
         """Return selected DataSegment."""
         return self._selection
 
+    def _display_changed(self, offset: int, length: int) -> None:
+        """Log a byte range whose display changed."""
+        self._change_count += 1
+        self._change_log.append((self._change_count, offset, offset + length))
+
+    def _data_changed(self, offset: int, old_length: int, new_length: int) -> None:
+        """Count touched bytes and notify subscribers after old_length bytes at offset were replaced."""
+        self.bytes_touched += old_length + new_length
+        self._notify(offset, old_length, new_length)
+
+    def _notify(self, offset: int, old_length: int, new_length: int) -> None:
+        """Increment the version, log the display change and notify subscribers of a modification."""
+        self._version += 1
+        self._display_changed(offset, new_length if old_length == new_length else sys.maxsize - offset)
+        change = DataChange(offset, old_length, new_length, self._version)
+        for callback in list(self._subscribers.values()):
+            callback(change)
+
+    @staticmethod
+    def _read_patched(
+        reader: Callable[[int, int], bytes], patch_offset: int, patch: bytes, offset: int, length: int
+    ) -> bytearray:
+        """Return data read with reader with the patch bytes overlaid."""
+        return overlay(bytearray(reader(offset, length)), offset, patch_offset, patch)
+
+    def _source_changed(self, change: DataChange) -> None:
+        """Forward a modification of the data source.
+
+        Write backs of the write back cache were already reported when the bytes were set.
+        """
+        if self._flushing:
+            return
+        self._cache.invalidate()
+        self._data_changed(change.offset, change.old_length, change.new_length)
+
+    def _subscribe_update(self, key: str, update: Callable[[int, int, int], None]) -> None:
+        """Subscribe a callable updated with the offset, old length and new length of modifications."""
+        self.subscribe(key, lambda change: update(change.offset, change.old_length, change.new_length))
+
+    def _write_back(self, offset: int, data: memoryview) -> None:
+        """Write modified bytes of the write back cache to the data source."""
+        self._flushing = True
+        try:
+            self._source.write(offset, bytes(data))
+        finally:
+            self._flushing = False
+
+    def apply_template(self, name: str | None) -> None:
+        """Overlay a registered template on the data, or remove the overlay if name is None."""
+        if name is None:
+            self._template = None
+            self.unsubscribe("template")
+            return
+        from .templates import TemplateParser, get_template  # pylint: disable=import-outside-toplevel
+
+        self._template = TemplateParser(get_template(name), self.read_at, self.__len__)
+        self._subscribe_update("template", self._template.invalidate)
+
     def clear(self) -> None:
         """Remove all highlights and selection."""
         self.clear_highlights()
         self.clear_selection()
 
+    def changed_since(self, count: int) -> tuple[int, int] | None:
+        """Return the byte range spanning display changes logged after count, or None if nothing changed.
+
+        The whole data range is returned if the changes are no longer logged.
+        """
+        if count >= self._change_count:
+            return None
+        if not self._change_log or self._change_log[0][0] > count + 1:
+            return 0, sys.maxsize
+        start, stop = sys.maxsize, 0
+        for change, offset, end in reversed(self._change_log):
+            if change <= count:
+                break
+            start, stop = min(start, offset), max(stop, end)
+        return start, stop
+
     def clear_highlights(self) -> None:
         """Clear all data highlights."""
+        for highlight in self._highlights:
+            self._display_changed(highlight.offset, highlight.length)
         self._highlights = []
 
     def clear_selection(self) -> None:
         """Clear selection."""
+        if self._selection is not None:
+            self._display_changed(self._selection.offset, self._selection.length)
         self._selection = None
 
     def delete(self, length: int = 1) -> None:
         """Delete byte(s) a specified offset."""
-        self._source.replace(self.cursor.byte, length, b"")
+        self.replace(length, b"")
+
+    def diffs_in(self, offset: int, length: int) -> list[DataSegment]:
+        """Return diff segments overlapping the specified range."""
+        end = offset + length
+        first = max(bisect_right(self._diff_offsets, offset) - 1, 0)
+        last = bisect_left(self._diff_offsets, end)
+        return [diff for diff in self._diffs[first:last] if diff.after > offset]
 
     def do(self, action: Action) -> None:  # pylint: disable=invalid-name
         """Process and perform action."""
         action.target = self
         self.action_handler.do(action)
 
+    @profiled("api.find")
     def find(self, sub: bytes, start: int = 0, reverse=False) -> int:
         """Search data for query bytes and return byte offset.
 
         Returns -1 if not found.
         """
-        return self._source.find(sub, start, reverse)
+        self._cache.flush()
+        offset = self._source.find(sub, start, reverse)
+        if offset is None:
+            offset = -1
+        if reverse:
+            self.bytes_touched += start - max(offset, 0)
+        else:
+            self.bytes_touched += (len(self) if offset == -1 else offset + len(sub)) - start
+        return offset
+
+    def get_byte(self, offset: int) -> int:
+        """Return the byte value at offset.
+
+        Consecutive accesses near the same offset are served by the write back cache.
+        """
+        value = self._cache.get(offset)
+        self.bytes_touched += 1
+        return value
 
     def highlight(self, length: int = 1) -> None:
         """Add a highlighted data range."""
         self._highlights.append(DataSegment(self.cursor.byte, length))
         self._reduced = False
+        self._display_changed(self.cursor.byte, length)
+
+    def is_loaded(self, offset: int, length: int) -> bool:
+        """Return True if the specified range can be read without waiting for file I/O."""
+        return self._source.is_loaded(offset, length)
 
-    def open(self, filepath: Path) -> None:
+    def open(self, filepath: Path, source_class: type[DataSource] | None = None) -> None:
         """Open a new data source."""
         if not filepath.exists():
             raise FileNotFoundError
-        self._source = SimpleDataSource(filepath)
-        # if getsize(filepath) <= self.SOURCE_THRESHHOLD:
-        #     self._source = SimpleDataSource(filepath)
-        # else:
-        #     self._source = PagedDataSource(filepath, self.BLOCK_SIZE)
+        previous: DataSource | None = getattr(self, "_source", None)
+        if source_class is not None:
+            self._source: DataSource = source_class(filepath)
+        elif getsize(filepath) <= self.SOURCE_THRESHHOLD:
+            self._source = SimpleDataSource(filepath)
+        else:
+            self._source = PagedDataSource(filepath, self.BLOCK_SIZE)
+        if previous is not None:
+            previous.unsubscribe(id(self))
+        self._source.subscribe(id(self), self._source_changed)
+        self._cache.invalidate()
         self.cursor = Cursor(max_bytes=len(self))
-
-    def read(self, length: Union[int, None] = None) -> bytearray:
+        self.navigation.clear()
+        for key in ("entropy", "merkle", "overview"):
+            self.unsubscribe(key)
+        self._entropy = None
+        self._merkle = None
+        self._overview = None
+        if self._template is not None:
+            self._template.reset()
+        self._notify(0, len(previous) if previous is not None else 0, len(self))
+
+    def read(self, length: int | None = None) -> bytearray:
         """Return a bytearray of the specified range."""
-        data = self._source.read(self.cursor.byte, length)
+        data = self._cache.read(self.cursor.byte, length)
         self.cursor.byte += len(data)
+        self.bytes_touched += len(data)
         return data
 
-    def read_at(self, offset: int, length: Union[int, None] = None) -> bytearray:
+    @profiled("api.read_at")
+    def read_at(self, offset: int, length: int | None = None) -> bytearray:
         """Return a bytearray of the specified range and location.
 
-        Does not affect cursor.
+        Does not affect cursor. Bytes set in the write back cache are overlaid without writing them back.
         """
-        return self._source.read(offset, length)
+        return self._cache.read(offset, length)
 
     def replace(self, length: int, data: bytes) -> None:
         """Replace a portion of data with a new data sequence."""
-        self._source.replace(self.cursor.byte, length, data)
+        offset = min(self.cursor.byte, len(self))
+        self._cache.flush()
+        self._source.replace(offset, length, data)
 
-    def save(self, new_filename: Union[Path, None] = None) -> None:
+    @profiled("api.save")
+    def save(self, new_filename: Path | None = None) -> None:
         """Save the current data to file."""
+        self._cache.flush()
         self._source.save(new_filename)
+        if self._merkle is not None:
+            self._merkle.mark_clean()
 
     def seek(self, offset: int) -> None:
         """Move cursor to offset."""
         self.cursor.byte = offset
 
+    def set_byte(self, offset: int, value: int) -> None:
+        """Set the byte value at offset without changing the data size.
+
+        Edits are made in the write back cache and written to the data source when data is next
+        searched, modified by other means or saved, or when a byte in another block is accessed.
+        """
+        self._cache.set(offset, value)
+        self._data_changed(offset, 1, 1)
+
     def select(self, length: int = 1) -> None:
         """Select a data range."""
+        self.clear_selection()
+        self._display_changed(self.cursor.byte, length)
         self._selection = DataSegment(self.cursor.byte, length, style=Style(reverse=True, bgcolor="blue"))
 
+    def set_diffs(self, diffs: list[DataSegment]) -> None:
+        """Replace the list of data segments that differ from the compared data."""
+        style = Style(bgcolor="red")
+        self._diffs = [DataSegment(diff.offset, diff.length, style=style) for diff in DataSegment.reduce(diffs)]
+        self._diff_offsets = [diff.offset for diff in self._diffs]
+        self._display_changed(0, sys.maxsize)
+
+    def snapshot(self) -> DataSnapshot:
+        """Return an immutable view of the current data for background readers.
+
+        The snapshot is stale once the data is modified or another file is opened. Bytes set in
+        the write back cache are included without writing them back.
+        """
+        snapshot = self._source.snapshot()
+        patch_offset, patch = self._cache.modifications()
+        reader: Callable[[int, int], bytes | bytearray] = snapshot.read
+        if patch:
+            reader = partial(self._read_patched, snapshot.read, patch_offset, patch)
+        return DataSnapshot(reader, len(snapshot), self._version, lambda: self._version)
+
+    def subscribe(self, key: Hashable, callback: Callable[[DataChange], None]) -> None:
+        """Call back with each modification of the data, replacing any callback of the same key.
+
+        Modifications are reported once the modified data can be read.
+        """
+        self._subscribers[key] = callback
+
     def unhighlight(self, length: int = 1) -> None:
         """Remove all highlights within specified range."""
         unhighlight_range = DataSegment(self.cursor.byte, length)
@@ -172,11 +464,20 @@ class DataAPI:
                 # highlight potentially needs double sliced
                 continue
             new_highlights.append(highlight)
+        kept = {id(highlight) for highlight in new_highlights}
+        for highlight in self._highlights:
+            if id(highlight) not in kept:
+                self._display_changed(highlight.offset, highlight.length)
         self._highlights = new_highlights
 
+    def unsubscribe(self, key: Hashable) -> None:
+        """Remove the callback subscribed with key."""
+        self._subscribers.pop(key, None)
+
     def write(self, data: bytes, insert: bool = False) -> None:
         """Write data to data at specified location."""
+        self._cache.flush()
         self._source.write(self.cursor.byte, data, insert)
 
 
-__all__ = ["Cursor", "DataAPI"]
+__all__ = ["Cursor", "DataAPI", "DataSnapshot"]
@@ -1,12 +1,24 @@
 """Hexabyte Commands Module."""
 from math import log2
 from sys import modules
+from typing import TYPE_CHECKING, Any
 
 from ..constants.sizes import BYTE_SZ, DWORD_SZ, QWORD_SZ, WORD_SZ
-from .command import Command
 from .command_parser import CommandParser, InvalidCommandError
 from .decorators import register, register_actions, register_target
 
+if TYPE_CHECKING:
+    from .command import Command
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Command message on first access so parsing commands does not require textual."""
+    if name == "Command":
+        from .command import Command  # pylint: disable=import-outside-toplevel
+
+        return Command
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def int_fmt_str(val: int, endian: str = "@", signed: bool = False) -> str:
     """Determine the number of bytes required for an integer value."""
@@ -1,10 +1,11 @@
 """Command Parser Module."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING, Any
 
 from ..actions import Action
+from ..utils import import_object
 
 if TYPE_CHECKING:
     from ..hexabyte_app import HexabyteApp
@@ -37,6 +38,8 @@ class CommandParser:  # pylint: disable=too-few-public-methods
     # Stores a tuple containing a query string and Widget class
     _targets: dict[str, type[Any]] = {}
     _cmd_map: dict[str, type[Action]] = {}
+    # Maps commands to the `module:Class` path of actions that have not been imported yet
+    _manifest: dict[str, str] = {}
 
     def __new__(cls) -> CommandParser:
         """Create CommandParser Singleton instance if it doesn't exist."""
@@ -48,12 +51,21 @@ class CommandParser:  # pylint: disable=too-few-public-methods
         """Create a new action."""
         cmd = cmd.lower()
         action_class = self._cmd_map.get(cmd)
+        if action_class is None and cmd in self._manifest:
+            action_class = self._load_action(cmd)
         if action_class is None:
             raise InvalidCommandError(" ".join([cmd, *arguments]), "Invalid Command")
         action = action_class(arguments)
 
         return action
 
+    def _load_action(self, cmd: str) -> type[Action]:
+        """Import and register an action listed in the manifest."""
+        action = import_object(self._manifest.pop(cmd))
+        self.register_action(action)
+        self._cmd_map[cmd] = action
+        return action
+
     @classmethod
     def _split_input(cls, cmd_input: str) -> list[list[str]]:
         """Split input string into action_word and arguments."""
@@ -86,6 +98,14 @@ class CommandParser:  # pylint: disable=too-few-public-methods
         for action in actions:
             self.register_action(action)
 
+    def register_manifest(self, manifest: Mapping[str, str]) -> None:
+        """Register actions by command without importing them.
+
+        Each command maps to the `module:Class` path of its action, which is imported on first use.
+        """
+        for cmd, path in manifest.items():
+            self._manifest[cmd.lower()] = path
+
     def register_app(self, app: HexabyteApp) -> None:
         """Register the app to perform actions on."""
         self._app = app
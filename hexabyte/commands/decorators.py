@@ -1,6 +1,6 @@
 """Register actions and associated commands."""
-from collections.abc import Callable, Iterable
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any, Union
 
 from ..actions import Action
 from .command_parser import CommandParser
@@ -24,9 +24,15 @@ def register_target(cls) -> Callable[..., Any]:
     return cls
 
 
-def register(actions: Iterable[type[Action]]) -> Callable[..., Any]:
-    """Class decorator to register a new target and new actions."""
-    parser.register_actions(actions)
+def register(actions: Union[Iterable[type[Action]], Mapping[str, str]]) -> Callable[..., Any]:
+    """Class decorator to register a new target and new actions.
+
+    Actions may be provided as classes or as a manifest mapping commands to `module:Class` paths.
+    """
+    if isinstance(actions, Mapping):
+        parser.register_manifest(actions)
+    else:
+        parser.register_actions(actions)
 
     def decorator(cls):
         parser.register_target(cls)
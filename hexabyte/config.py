@@ -10,7 +10,7 @@ from .constants.generic import CONFIG_FILENAME, DEFAULT_CONFIG_PATH
 
 DEFAULT_SETTINGS: Munch = Munch.fromDict(
     {
-        "general": {"max-cmd-history": 100, "max-undo": 100, "plugins": []},
+        "general": {"max-cmd-history": 100, "max-nav-history": 100, "max-undo": 100, "plugins": [], "target-fps": 60},
         "normal": {
             "primary": "hex",
             "offset-style": "hex",
@@ -22,6 +22,7 @@ DEFAULT_SETTINGS: Munch = Munch.fromDict(
             "primary": "hex",
             "secondary": "utf8",
             "offset-style": "hex",
+            "linked-scroll": True,
             "bin": {"column-count": 4, "column-size": 1},
             "hex": {"column-count": 4, "column-size": 4},
             "utf8": {"column-count": 8, "column-size": 4},
@@ -30,6 +31,7 @@ DEFAULT_SETTINGS: Munch = Munch.fromDict(
             "primary": "hex",
             "secondary": "hex",
             "offset-style": "hex",
+            "linked-scroll": True,
             "bin": {"column-count": 4, "column-size": 1},
             "hex": {"column-count": 4, "column-size": 4},
             "utf8": {"column-count": 8, "column-size": 4},
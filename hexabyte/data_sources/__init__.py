@@ -1,6 +1,21 @@
 """Data Sources Package."""
 
+from ._data_source import DataSource
+from .data_change import DataChange
+from .data_snapshot import DataSnapshot
+from .mmap_data_source import MmapDataSource
 from .paged_data_source import PagedDataSource
 from .simple_data_source import SimpleDataSource
+from .viewport_cache import ViewportCache
+from .write_back_cache import WriteBackCache
 
-__all__ = ["PagedDataSource", "SimpleDataSource"]
+__all__ = [
+    "DataChange",
+    "DataSnapshot",
+    "DataSource",
+    "MmapDataSource",
+    "PagedDataSource",
+    "SimpleDataSource",
+    "ViewportCache",
+    "WriteBackCache",
+]
@@ -1,12 +1,21 @@
 """Abstract Data Source Module."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable
 from pathlib import Path
 from typing import Union
 
+from .data_change import DataChange
+from .data_snapshot import DataSnapshot
+
 
 class DataSource(ABC):
-    """Abstract Data Source Class."""
+    """Abstract Data Source Class.
+
+    The version increments with each modification, and subscribers are notified of the
+    modified range. Snapshots are immutable views of one version, so readers in other threads
+    are not affected by later modifications.
+    """
 
     def __init__(self, filepath: Path) -> None:
         """Initialize data source."""
@@ -16,6 +25,8 @@ class DataSource(ABC):
             raise FileNotFoundError
         self._filepath = filepath
         self._modified = False
+        self._version = 0
+        self._subscribers: dict[Hashable, Callable[[DataChange], None]] = {}
         self.__post_init__()
 
     @property
@@ -28,6 +39,11 @@ class DataSource(ABC):
         """Return modified state of data source."""
         return self._modified
 
+    @property
+    def version(self) -> int:
+        """Return the number of modifications made to the data."""
+        return self._version
+
     @abstractmethod
     def __len__(self) -> int:
         """Return the total data size."""
@@ -38,26 +54,55 @@ class DataSource(ABC):
         """Perform post init actions."""
         raise NotImplementedError
 
+    def _changed(self, offset: int, old_length: int, new_length: int) -> None:
+        """Increment the version and notify subscribers after old_length bytes at offset were replaced."""
+        self._version += 1
+        change = DataChange(offset, old_length, new_length, self._version)
+        for callback in list(self._subscribers.values()):
+            callback(change)
+
     @abstractmethod
     def find(self, sub: bytes, start: int = 0, reverse: bool = False) -> Union[int, None]:
         """Search data for query bytes and return byte offset if found."""
         raise NotImplementedError
 
+    def is_loaded(self, offset: int, length: int) -> bool:  # pylint: disable=unused-argument
+        """Return True if the specified range can be read without waiting for file I/O."""
+        return True
+
     @abstractmethod
     def read(self, offset: int = 0, length: Union[int, None] = None) -> bytearray:
         """Return a bytearray of the specified range."""
         raise NotImplementedError
 
     @abstractmethod
-    def replace(self, offset: int, length: int, data: bytearray) -> None:
+    def replace(self, offset: int, length: int, data: Union[bytes, bytearray]) -> None:
         """Replace a portion of data with a new data sequence."""
         raise NotImplementedError
 
     @abstractmethod
-    def save(self, new_filepath: Path) -> None:
+    def save(self, new_filepath: Union[Path, None] = None) -> None:
         """Save data source."""
         raise NotImplementedError
 
+    def snapshot(self) -> DataSnapshot:
+        """Return an immutable view of the current data.
+
+        Copies the whole data. Sources override this with cheaper copy-on-write snapshots.
+        """
+        data = bytes(self.read())
+        return DataSnapshot(
+            lambda offset, length: data[offset : offset + length], len(data), self._version, lambda: self._version
+        )
+
+    def subscribe(self, key: Hashable, callback: Callable[[DataChange], None]) -> None:
+        """Call back with each modification of the data, replacing any callback of the same key."""
+        self._subscribers[key] = callback
+
+    def unsubscribe(self, key: Hashable) -> None:
+        """Remove the callback subscribed with key."""
+        self._subscribers.pop(key, None)
+
     @abstractmethod
     def write(self, offset: int, data: Union[bytes, bytearray], insert: bool = False) -> None:
         """Write the provided data starting at the specified offset.
@@ -0,0 +1,25 @@
+"""DataChange module."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class DataChange:
+    """A modification of data.
+
+    Params
+    ------
+    offset - Offset of the modified data.
+    old_length - Number of bytes replaced at offset.
+    new_length - Number of bytes replacing them.
+    version - Version of the data following the modification.
+    """
+
+    offset: int
+    old_length: int
+    new_length: int
+    version: int
+
+    @property
+    def resized(self) -> bool:
+        """Return True if the modification changed the data size."""
+        return self.old_length != self.new_length
@@ -0,0 +1,50 @@
+"""Data Snapshot Module."""
+from __future__ import annotations
+
+from collections.abc import Callable
+
+
+class DataSnapshot:
+    """Data Snapshot Class.
+
+    Immutable view of one version of data. Reads always return the data as it was when the
+    snapshot was taken, so background readers see a consistent view while the data is
+    modified. Compare `version` with the current version, or check `stale`, to detect results
+    computed from outdated data.
+
+    Params
+    ------
+    reader - Callable returning `length` bytes located at `offset` of the snapshot data.
+    length - Size of the snapshot data.
+    version - Version of the snapshot data.
+    current_version - Callable returning the current version of the data.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int], bytes | bytearray],
+        length: int,
+        version: int,
+        current_version: Callable[[], int],
+    ) -> None:
+        """Initialize the data snapshot."""
+        self._read = reader
+        self._current_version = current_version
+        self.length = length
+        self.version = version
+
+    def __len__(self) -> int:
+        """Return the size of the snapshot data."""
+        return self.length
+
+    @property
+    def stale(self) -> bool:
+        """Return True if the data was modified since the snapshot was taken."""
+        return self._current_version() != self.version
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Return `length` bytes located at `offset`, truncated at the end of the snapshot data."""
+        if offset < 0:
+            raise ValueError("Offset must be greater than 0")
+        length = min(length, self.length - offset)
+        return bytes(self._read(offset, length)) if length > 0 else b""
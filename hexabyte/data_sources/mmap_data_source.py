@@ -0,0 +1,139 @@
+"""Memory Mapped Data Source Module."""
+import mmap
+from functools import partial
+from typing import Union
+from weakref import finalize
+
+from ._data_source import DataSnapshot, DataSource, Path
+
+PAGE_SIZE = mmap.PAGESIZE
+
+
+class MmapDataSource(DataSource):
+    """A data source backed by a private memory mapping of the file.
+
+    Pages are only read from file when accessed and only copied when modified, so opening
+    and patching a file in place does not depend on its size. Edits that change the data size
+    copy the mapping into memory.
+
+    Snapshots of mapped data use their own read-only mapping of the file and only copy the
+    pages modified since the file was mapped. Snapshots of data in memory share it until it is
+    next modified, which copies it first.
+    """
+
+    def __len__(self) -> int:
+        """Return total data size."""
+        return len(self._data)
+
+    def __post_init__(self) -> None:
+        """Map file and initialize data source."""
+        self._data: Union[mmap.mmap, bytearray] = bytearray()
+        self._shared = False
+        self._dirty_pages: set[int] = set()
+        with open(self._filepath, "rb") as source:
+            if self._filepath.stat().st_size:
+                self._data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    def __del__(self) -> None:
+        """Release the file mapping."""
+        self._close()
+
+    def _close(self) -> None:
+        """Release the file mapping, if mapped."""
+        data = getattr(self, "_data", None)
+        if isinstance(data, mmap.mmap):
+            data.close()
+
+    def _own(self) -> None:
+        """Copy the data into memory, releasing the file mapping."""
+        data = bytearray(self._data)
+        self._close()
+        self._data = data
+        self._dirty_pages.clear()
+        self._shared = False
+
+    @staticmethod
+    def _read_snapshot(mapping: mmap.mmap, pages: dict[int, bytes], offset: int, length: int) -> bytes:
+        """Read snapshot data from the file mapping, overlaid with the pages copied from the source."""
+        first, last = offset // PAGE_SIZE, (offset + length - 1) // PAGE_SIZE
+        if not any(page in pages for page in range(first, last + 1)):
+            return mapping[offset : offset + length]
+        data = bytearray()
+        for page in range(first, last + 1):
+            data += pages[page] if page in pages else mapping[page * PAGE_SIZE : (page + 1) * PAGE_SIZE]
+        start = offset - first * PAGE_SIZE
+        return bytes(data[start : start + length])
+
+    def find(self, sub: bytes, start: int = 0, reverse: bool = False) -> int:
+        """Search data for query bytes and return byte offset or -1 if not found."""
+        if reverse:
+            return self._data.rfind(sub, 0, start)
+        return self._data.find(sub, start)
+
+    def read(self, offset: int = 0, length: Union[int, None] = None) -> bytearray:
+        """Return a bytearray of the specified range."""
+        if length is not None:
+            return bytearray(self._data[offset : offset + length])
+        return bytearray(self._data[offset:])
+
+    def replace(self, offset: int, length: int, data: Union[bytes, bytearray]) -> None:
+        """Replace a portion of data with a new data sequence."""
+        size = len(self._data)
+        start = min(max(0, offset), size)
+        old_length = min(max(0, offset + length), size) - start
+        if self._shared or (len(data) != old_length and isinstance(self._data, mmap.mmap)):
+            self._own()
+        if isinstance(self._data, mmap.mmap) and data:
+            self._dirty_pages.update(range(start // PAGE_SIZE, (start + len(data) - 1) // PAGE_SIZE + 1))
+        self._data[start : start + max(0, length)] = data
+        self._modified = True
+        self._changed(start, old_length, len(data))
+
+    def save(self, new_filepath: Union[Path, None] = None) -> None:
+        """Save the current data to file.
+
+        Data is written to a temporary file and then renamed to the desired filename.
+        """
+        if new_filepath and self._filepath != new_filepath:
+            dest_filepath = Path(new_filepath)
+            is_temp = False
+        else:
+            dest_filepath = self.filepath.parent / f"~{self.filepath.name}"
+            is_temp = True
+        with dest_filepath.open("wb") as dest_file:
+            dest_file.write(self._data)
+        self._close()
+        if is_temp:
+            dest_filepath.replace(self.filepath)
+        else:
+            self._filepath = dest_filepath
+        self.__post_init__()
+        self._modified = False
+
+    def snapshot(self) -> DataSnapshot:
+        """Return an immutable view of the current data."""
+        data = self._data
+        if not isinstance(data, mmap.mmap):
+            self._shared = True
+            return DataSnapshot(
+                lambda offset, length: data[offset : offset + length], len(data), self._version, lambda: self._version
+            )
+        with open(self._filepath, "rb") as source:
+            mapping = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+        pages = {page: data[page * PAGE_SIZE : (page + 1) * PAGE_SIZE] for page in self._dirty_pages}
+        snapshot = DataSnapshot(
+            partial(self._read_snapshot, mapping, pages), len(data), self._version, lambda: self._version
+        )
+        finalize(snapshot, mapping.close)
+        return snapshot
+
+    def write(self, offset: int, data: Union[bytes, bytearray], insert: bool = False) -> None:
+        """Write the provided data starting at the specified offset.
+
+        Params:
+        offset - Specifies start index where data will be written.
+        data - bytearray of data to be written
+        insert - Specifies whether new data is inserted between or overwrites
+        existing data.
+        """
+        self.replace(offset, 0 if insert else len(data), data)
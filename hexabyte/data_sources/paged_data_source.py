@@ -2,19 +2,34 @@
 
 Provides the interface for interacting with raw file data.
 """
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import partial
+from io import BufferedReader
+from itertools import accumulate
+from threading import Lock, RLock
 from typing import Union
+from weakref import finalize
 
-from ..constants.sizes import DEFAULT_BLOCK_SIZE
-from ._data_source import DataSource, Path
+from ..constants.sizes import DEFAULT_BLOCK_SIZE, MB
+from ..profiling import profiled
+from ._data_source import DataSnapshot, DataSource, Path
 from .data_block import DataBlock
 
 MIN_AUTO_REDUCE_THRESHHOLD = 128
+FIND_CHUNK_SIZE = 1 * MB
 
 
 class PagedDataSource(DataSource):
     """Data Source Class.
 
-    Provides a data management layer for interfacing with files.
+    Provides a data management layer for interfacing with files. Blocks are only read from
+    file when accessed, so opening a file does not depend on its size. Access is serialized
+    so the source can be shared with background workers.
+
+    Modified blocks are replaced rather than changed in place, so snapshots only copy the
+    list of blocks and share their data. Snapshots read unloaded blocks through their own
+    handle of the file.
 
     Params:
     filname - The filename of the file that will back the data api.
@@ -33,32 +48,25 @@ class PagedDataSource(DataSource):
         auto_reduce_threshhold: int = MIN_AUTO_REDUCE_THRESHHOLD,
     ) -> None:
         """Initialize the data source."""
-        super().__init__(filepath)
         if block_size < 1:
             raise ValueError("Block size must be greater than 0.")
-        self._auto_reduce = auto_reduce
         if auto_reduce_threshhold < MIN_AUTO_REDUCE_THRESHHOLD:
             raise ValueError(f"Auto reduce threshhold must be greater than  or equal to {MIN_AUTO_REDUCE_THRESHHOLD}")
+        self._auto_reduce = auto_reduce
         self._auto_reduce_threshhold = auto_reduce_threshhold
         self._block_size = block_size
+        super().__init__(filepath)
 
     def __post_init__(self) -> None:
         """Perform post init actions."""
+        self._lock = RLock()
         self._file = open(self._filepath, "rb")  # pylint: disable=R1732
-        self._clean_size = self._filepath.stat().st_size
-        self._blocks: list[DataBlock] = []
-        self._loaded_blocks = 0
-        remaining = self._clean_size
-        offset = 0
-        while remaining > 0:
-            size = self._block_size if remaining > self._block_size else remaining
-            self._blocks.append(DataBlock(offset, size))
-            offset += size
-            remaining -= size
+        self._offsets: Union[list[int], None] = None
+        self._init_blocks()
 
     def __del__(self) -> None:
         """Cleanup DataSource Resources."""
-        if not self._file.closed:
+        if hasattr(self, "_file") and not self._file.closed:
             self._file.close()
 
     @property
@@ -68,69 +76,234 @@ class PagedDataSource(DataSource):
 
     def __len__(self) -> int:
         """Return the total data size."""
-        return sum(len(block) for block in self._blocks)
+        offsets = self._block_offsets()
+        if not offsets:
+            return 0
+        return offsets[-1] + len(self._blocks[-1])
+
+    def _block_index(self, offset: int) -> int:
+        """Return the index of the block containing offset."""
+        return max(0, bisect_right(self._block_offsets(), offset) - 1)
+
+    def _block_offsets(self) -> list[int]:
+        """Return the current start offset of each block."""
+        if self._offsets is None:
+            self._offsets = [0, *accumulate(len(block) for block in self._blocks)][:-1] if self._blocks else []
+        return self._offsets
 
+    def _init_blocks(self) -> None:
+        """Split the file into unloaded clean blocks."""
+        self._clean_size = self._filepath.stat().st_size
+        self._blocks: list[DataBlock] = []
+        self._loaded: OrderedDict[int, DataBlock] = OrderedDict()
+        self._offsets = None
+        remaining = self._clean_size
+        offset = 0
+        while remaining > 0:
+            size = self._block_size if remaining > self._block_size else remaining
+            self._blocks.append(DataBlock(offset, size))
+            offset += size
+            remaining -= size
+
+    @profiled("source.load_block")
     def _load_block(self, block: DataBlock) -> None:
         """Load block data from file."""
         self._file.seek(block.clean_offset)
         block.data = bytearray(self._file.read(block.clean_size))
         block.loaded = True
-        self._loaded_blocks += 1
-        if self._auto_reduce and self._loaded_blocks > self._auto_reduce_threshhold:
-            self.reduce()
-
-    def reduce(self) -> None:
-        """Reduce memory footprint of datasource."""
-        for block in self._blocks:
-            if block.loaded and not block.dirty:
-                block.data = bytearray()
-                block.loaded = False
-                self._loaded_blocks -= 1
+        self._loaded[id(block)] = block
+        if self._auto_reduce and len(self._loaded) > self._auto_reduce_threshhold:
+            self.reduce(self._auto_reduce_threshhold // 2)
 
-    def read(self, offset: int = 0, length: Union[int, None] = None) -> bytearray:
-        """Return bytearray of specified data range."""
-        if offset < 0:
-            raise ValueError("Offset must be greater than 0")
-        if offset > len(self):
-            raise ValueError(f"Offset ({offset}) exceeds data size ({len(self)})")
-        if length is None:
-            length = len(self) - offset
+    def find(self, sub: bytes, start: int = 0, reverse: bool = False) -> int:
+        """Search data for query bytes and return byte offset or -1 if not found.
+
+        Data is searched in overlapping chunks so matches spanning blocks are found.
+        """
+        with self._lock:
+            size = len(self)
+            overlap = max(0, len(sub) - 1)
+            if reverse:
+                end = min(max(0, start), size)
+                while end > 0:
+                    chunk_start = max(0, end - FIND_CHUNK_SIZE - overlap)
+                    idx = self.read(chunk_start, end - chunk_start).rfind(sub)
+                    if idx != -1:
+                        return chunk_start + idx
+                    end = chunk_start + overlap if chunk_start else 0
+                return -1
+            offset = max(0, start)
+            while offset < size:
+                idx = self.read(offset, FIND_CHUNK_SIZE + overlap).find(sub)
+                if idx != -1:
+                    return offset + idx
+                offset += FIND_CHUNK_SIZE
+            return -1
+
+    def _read_snapshot(  # pylint: disable=too-many-arguments
+        self,
+        blocks: list[DataBlock],
+        offsets: list[int],
+        file: BufferedReader,
+        file_lock: Lock,
+        offset: int,
+        length: int,
+    ) -> bytearray:
+        """Return a data range of a snapshot block list.
+
+        Unloaded blocks are read from the snapshot file without being loaded.
+        """
         data = bytearray()
-        block_offset = 0
-        for block in self._blocks:
-            if block_offset + len(block) <= offset:
-                block_offset += len(block)
-                continue
-            if not block.loaded:
-                self._load_block(block)
-            start = offset - block_offset
-            if length <= len(block) - start:
-                data += block.data[start : start + length]
-                break
-            new_data = block.data[start:]
+        idx = max(0, bisect_right(offsets, offset) - 1)
+        while length > 0 and idx < len(blocks):
+            block = blocks[idx]
+            start = offset - offsets[idx]
+            with self._lock:
+                block_data = block.data if block.loaded else None
+            if block_data is not None:
+                new_data = block_data[start : start + length]
+            else:
+                with file_lock:
+                    file.seek(block.clean_offset + start)
+                    new_data = bytearray(file.read(min(length, block.clean_size - start)))
             data += new_data
             length -= len(new_data)
             offset += len(new_data)
-            block_offset += len(block)
+            idx += 1
         return data
 
+    def is_loaded(self, offset: int, length: int) -> bool:
+        """Return True if every block overlapping the specified range is loaded."""
+        with self._lock:
+            offsets = self._block_offsets()
+            idx = self._block_index(offset)
+            stop = offset + length
+            while idx < self._block_count and offsets[idx] < stop:
+                if not self._blocks[idx].loaded:
+                    return False
+                idx += 1
+            return True
+
+    def read(self, offset: int = 0, length: Union[int, None] = None) -> bytearray:
+        """Return bytearray of specified data range."""
+        if offset < 0:
+            raise ValueError("Offset must be greater than 0")
+        with self._lock:
+            size = len(self)
+            if offset >= size:
+                return bytearray()
+            if length is None:
+                length = size - offset
+            data = bytearray()
+            offsets = self._block_offsets()
+            idx = self._block_index(offset)
+            while length > 0 and idx < self._block_count:
+                block = self._blocks[idx]
+                if not block.loaded:
+                    self._load_block(block)
+                elif id(block) in self._loaded:
+                    self._loaded.move_to_end(id(block))
+                start = offset - offsets[idx]
+                new_data = block.data[start : start + length]
+                data += new_data
+                length -= len(new_data)
+                offset += len(new_data)
+                idx += 1
+            return data
+
+    def reduce(self, keep: int = 0) -> None:
+        """Reduce memory footprint of datasource.
+
+        Unloads clean blocks, keeping the `keep` most recently used blocks loaded.
+        """
+        with self._lock:
+            while len(self._loaded) > keep:
+                _, block = self._loaded.popitem(last=False)
+                block.data = bytearray()
+                block.loaded = False
+
+    def replace(self, offset: int, length: int, data: Union[bytes, bytearray]) -> None:
+        """Replace a portion of data with a new data sequence.
+
+        The touched blocks are merged and the result is split back into dirty blocks, so
+        large replaces do not leave blocks that are slow to edit afterwards.
+        """
+        with self._lock:
+            size = len(self)
+            offset = min(max(0, offset), size)
+            length = min(max(0, length), size - offset)
+            if not self._blocks:
+                self._blocks.append(DataBlock(0, 0, dirty=True, loaded=True))
+            first = self._block_index(offset)
+            last = self._block_index(offset + length - 1) if length else first
+            offsets = self._block_offsets()
+            merged = bytearray()
+            for block in self._blocks[first : last + 1]:
+                if not block.loaded:
+                    self._load_block(block)
+                self._loaded.pop(id(block), None)
+                merged += block.data
+            start = offset - offsets[first]
+            merged[start : start + length] = data
+            self._blocks[first : last + 1] = self._split_block(self._blocks[first].clean_offset, merged)
+            self._offsets = None
+            self._modified = True
+        self._changed(offset, length, len(data))
+
+    def _split_block(self, clean_offset: int, data: bytearray) -> list[DataBlock]:
+        """Return dirty blocks holding data, each at most twice the block size."""
+        if len(data) < 2 * self._block_size:
+            return [DataBlock(clean_offset, 0, True, True, data)]
+        size = self._block_size
+        return [DataBlock(clean_offset, 0, True, True, data[idx : idx + size]) for idx in range(0, len(data), size)]
+
     def save(self, new_filepath: Union[Path, None] = None) -> None:
         """Save the current data to file.
 
         Data is written to a temporary file and then renamed to the desired filename.
         """
-        if new_filepath and self._filepath != new_filepath:
-            dest_filepath = new_filepath
-            is_temp = False
-        else:
-            dest_filepath = self.filepath.parent / f"{self.filepath.name}.tmp"
-            is_temp = True
-        with dest_filepath.open("wb") as dest_file:
-            for block in self._blocks:
-                if not block.loaded:
-                    self._load_block(block)
-                dest_file.write(block.data)
-        if is_temp:
+        with self._lock:
+            if new_filepath and self._filepath != new_filepath:
+                dest_filepath = Path(new_filepath)
+                is_temp = False
+            else:
+                dest_filepath = self.filepath.parent / f"{self.filepath.name}.tmp"
+                is_temp = True
+            with dest_filepath.open("wb") as dest_file:
+                for block in self._blocks:
+                    if block.loaded:
+                        dest_file.write(block.data)
+                    else:
+                        self._file.seek(block.clean_offset)
+                        dest_file.write(self._file.read(block.clean_size))
             self._file.close()
-            dest_filepath.replace(self.filepath)
+            if is_temp:
+                dest_filepath.replace(self.filepath)
+            else:
+                self._filepath = dest_filepath
             self._file = open(self.filepath, "rb")  # pylint: disable=R1732
+            self._init_blocks()
+            self._modified = False
+
+    def snapshot(self) -> DataSnapshot:
+        """Return an immutable view of the current data."""
+        with self._lock:
+            blocks = list(self._blocks)
+            offsets = list(self._block_offsets())
+            size = len(self)
+            file = open(self._filepath, "rb")  # pylint: disable=R1732
+        reader = partial(self._read_snapshot, blocks, offsets, file, Lock())
+        snapshot = DataSnapshot(reader, size, self._version, lambda: self._version)
+        finalize(snapshot, file.close)
+        return snapshot
+
+    def write(self, offset: int, data: Union[bytes, bytearray], insert: bool = False) -> None:
+        """Write the provided data starting at the specified offset.
+
+        Params:
+        offset - Specifies start index where data will be written.
+        data - bytearray of data to be written
+        insert - Specifies whether new data is inserted between or overwrites
+        existing data.
+        """
+        self.replace(offset, 0 if insert else len(data), data)
@@ -1,11 +1,14 @@
 """Simple Data Source Module."""
 from typing import Union
 
-from ._data_source import DataSource, Path
+from ._data_source import DataSnapshot, DataSource, Path
 
 
 class SimpleDataSource(DataSource):
-    """A simple no-frills data source for loading files."""
+    """A simple no-frills data source for loading files.
+
+    Snapshots share the data until it is next modified, which copies it first.
+    """
 
     def __len__(self) -> int:
         """Return total data size."""
@@ -15,6 +18,13 @@ class SimpleDataSource(DataSource):
         """Open file and initialize data source."""
         with open(self._filepath, "rb") as source:
             self._data = bytearray(source.read())
+        self._shared = False
+
+    def _own(self) -> None:
+        """Copy the data before it is modified if a snapshot shares it."""
+        if self._shared:
+            self._data = bytearray(self._data)
+            self._shared = False
 
     def find(self, sub: bytes, start: int = 0, reverse: bool = False) -> int:
         """Search data for query bytes and return byte offset or -1 if not found."""
@@ -28,9 +38,13 @@ class SimpleDataSource(DataSource):
             return bytearray(self._data[offset : offset + length])
         return bytearray(self._data[offset:])
 
-    def replace(self, offset: int, length: int, data: bytes) -> None:
+    def replace(self, offset: int, length: int, data: Union[bytes, bytearray]) -> None:
         """Replace a portion of data with a new data sequence."""
+        self._own()
+        start = min(offset, len(self._data))
+        old_length = min(length, len(self._data) - start)
         self._data[offset : offset + length] = data
+        self._changed(start, old_length, len(data))
 
     def save(self, new_filepath: Union[Path, None] = None) -> None:
         """Save the current data to file.
@@ -51,7 +65,15 @@ class SimpleDataSource(DataSource):
             self._filepath = dest_filepath
         self._modified = False
 
-    def write(self, offset: int, data: bytes, insert: bool = False) -> None:
+    def snapshot(self) -> DataSnapshot:
+        """Return an immutable view of the current data."""
+        self._shared = True
+        data = self._data
+        return DataSnapshot(
+            lambda offset, length: data[offset : offset + length], len(data), self._version, lambda: self._version
+        )
+
+    def write(self, offset: int, data: Union[bytes, bytearray], insert: bool = False) -> None:
         """Write the provided data starting at the specified offset.
 
         Params:
@@ -60,8 +82,12 @@ class SimpleDataSource(DataSource):
         insert - Specifies whether new data is inserted between or overwrites
         existing data.
         """
+        self._own()
+        start = min(offset, len(self._data))
+        old_length = 0 if insert else min(len(data), len(self._data) - start)
         if insert:
             self._data[offset:offset] = data
         else:
             self._data[offset : offset + len(data)] = data
         self._modified = True
+        self._changed(start, old_length, len(data))
@@ -0,0 +1,156 @@
+"""Viewport Cache Module."""
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from threading import Lock
+
+from ..constants.sizes import KB
+from ..profiling import profiled
+
+DEFAULT_ALIGNMENT = 4 * KB
+FETCH_WORKERS = 2
+
+
+@cache
+def fetch_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by background window fetches."""
+    return ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="viewport-fetch")
+
+
+class ViewportCache:
+    """Viewport Cache Class.
+
+    Holds a single offset aligned window of data shared by every view rendering the same data.
+    Views reserve the number of bytes they display, and a miss fetches a window large enough
+    for all of them, so views scrolled to the same offset are served by one read.
+
+    Views that must not wait for file I/O use `read_nowait`. Windows that are not loaded are
+    read by a background thread pool, and listening views are notified once the window can be
+    read without waiting. Notifications are made from the fetching thread.
+
+    Params
+    ------
+    reader - Callable returning `length` bytes located at `offset` of the data.
+    alignment - Window boundaries are aligned to multiples of this size.
+    loaded - Callable returning True if `length` bytes at `offset` can be read without waiting
+    for file I/O. Reads never wait in the background if not specified.
+    loader - Callable loading `length` bytes located at `offset` in a background thread. It is
+    called concurrently with reads, so it must not modify data. Defaults to reader.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int], bytes | bytearray],
+        alignment: int = DEFAULT_ALIGNMENT,
+        loaded: Callable[[int, int], bool] | None = None,
+        loader: Callable[[int, int], object] | None = None,
+    ) -> None:
+        """Initialize the viewport cache."""
+        if alignment < 1:
+            raise ValueError("Alignment must be greater than 0.")
+        self._read = reader
+        self._loaded = loaded
+        self._load = loader or reader
+        self.alignment = alignment
+        self._offset = 0
+        self._data = b""
+        self._stop = 0
+        self._valid = False
+        self._spans: dict[Hashable, int] = {}
+        self._listeners: dict[Hashable, Callable[[int, int], None]] = {}
+        self._fetching: set[tuple[int, int]] = set()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def span(self) -> int:
+        """Return the largest number of bytes reserved by a view."""
+        return max(self._spans.values(), default=0)
+
+    @property
+    def window(self) -> tuple[int, int]:
+        """Return the offset and length of the cached window."""
+        return self._offset, len(self._data)
+
+    def _fetch(self, start: int, stop: int) -> None:
+        """Read a window so it is loaded, then notify listeners. Runs in a worker thread."""
+        try:
+            self._load(start, stop - start)
+        finally:
+            with self._lock:
+                self._fetching.discard((start, stop))
+                listeners = list(self._listeners.values())
+        for callback in listeners:
+            callback(start, stop)
+
+    def _window_range(self, offset: int, end: int) -> tuple[int, int]:
+        """Return the aligned window fetched to read from offset up to end."""
+        start = offset // self.alignment * self.alignment
+        stop = -(-max(end, offset + self.span) // self.alignment) * self.alignment
+        return start, stop
+
+    def invalidate(self) -> None:
+        """Discard the cached window."""
+        self._valid = False
+        self._data = b""
+
+    @profiled("viewport.read")
+    def read(self, offset: int, length: int) -> bytes:
+        """Return `length` bytes located at `offset`, fetching a new window on a miss."""
+        end = offset + length
+        if not self._valid or offset < self._offset or end > self._stop:
+            self.misses += 1
+            start, stop = self._window_range(offset, end)
+            self._data = bytes(self._read(start, stop - start))
+            self._offset = start
+            # A short read means the window reaches the end of data
+            self._stop = stop
+            self._valid = True
+        else:
+            self.hits += 1
+        start = offset - self._offset
+        return self._data[start : start + length]
+
+    def read_nowait(self, offset: int, length: int) -> bytes | None:
+        """Return `length` bytes located at `offset`, or None if reading would wait for file I/O.
+
+        The window containing the bytes is fetched in the background if None is returned.
+        """
+        end = offset + length
+        if self._valid and self._offset <= offset and end <= self._stop:
+            return self.read(offset, length)
+        start, stop = self._window_range(offset, end)
+        if self._loaded is None or self._loaded(start, stop - start):
+            return self.read(offset, length)
+        with self._lock:
+            if (start, stop) in self._fetching:
+                return None
+            self._fetching.add((start, stop))
+        fetch_executor().submit(self._fetch, start, stop)
+        return None
+
+    def listen(self, view: Hashable, callback: Callable[[int, int], None]) -> None:
+        """Call back a view with the start and stop offsets of each window fetched in the background."""
+        with self._lock:
+            self._listeners[view] = callback
+
+    def release(self, view: Hashable) -> None:
+        """Remove the span reserved by a view and its fetch listener."""
+        self._spans.pop(view, None)
+        with self._lock:
+            self._listeners.pop(view, None)
+
+    def reserve(self, view: Hashable, span: int) -> None:
+        """Reserve the number of bytes displayed by a view."""
+        self._spans[view] = max(0, span)
+
+    def update(self, offset: int, old_length: int, new_length: int) -> None:
+        """Discard the cached window if replacing `old_length` bytes at `offset` modified it.
+
+        The window is always discarded if the data size changed, since following bytes moved.
+        """
+        if old_length != new_length or (offset < self._offset + len(self._data) and offset + new_length > self._offset):
+            self.invalidate()
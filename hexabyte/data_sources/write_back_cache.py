@@ -0,0 +1,138 @@
+"""Write Back Cache Module."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from threading import Lock
+
+from ..constants.sizes import KB
+
+DEFAULT_BLOCK_SIZE = 4 * KB
+
+
+class WriteBackCache:
+    """Write Back Cache Class.
+
+    Holds a single aligned block of data for single byte edits. Reads and writes within the
+    block access it in place, and modified bytes are written back as one range when the cache
+    is flushed or a byte outside the block is accessed. Editing within a block does not
+    allocate. Ranges read through the cache have modified bytes overlaid, so reading does not
+    require a write back.
+
+    Params
+    ------
+    reader - Callable returning `length` bytes located at `offset` of the data.
+    writer - Callable overwriting data at `offset` with the given bytes.
+    block_size - Block boundaries are aligned to multiples of this size.
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[int, int | None], bytearray],
+        writer: Callable[[int, memoryview], None],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ) -> None:
+        """Initialize the write back cache."""
+        if block_size < 1:
+            raise ValueError("Block size must be greater than 0.")
+        self._read = reader
+        self._write = writer
+        self.block_size = block_size
+        self._lock = Lock()
+        self._block = bytearray()
+        self._offset = 0
+        self._dirty_start = 0
+        self._dirty_stop = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def dirty(self) -> bool:
+        """Return True if the block contains modifications that were not written back."""
+        return self._dirty_stop > self._dirty_start
+
+    def _index(self, offset: int) -> int:
+        """Return the index of offset within the block, loading the block containing offset on a miss."""
+        index = offset - self._offset
+        if 0 <= index < len(self._block):
+            self.hits += 1
+            return index
+        self.misses += 1
+        self._flush()
+        self._offset = offset // self.block_size * self.block_size
+        self._block = self._read(self._offset, self.block_size)
+        index = offset - self._offset
+        if index >= len(self._block):
+            self._block = bytearray()
+            raise IndexError(f"Offset out of range - {offset:#x}")
+        return index
+
+    def _overlay(self, offset: int, data: bytearray) -> bytearray:
+        """Copy modified bytes over data located at offset. The lock must be held."""
+        if self._dirty_stop > self._dirty_start:
+            overlay(data, offset, self._offset + self._dirty_start, self._block[self._dirty_start : self._dirty_stop])
+        return data
+
+    def _flush(self) -> None:
+        """Write modified bytes back. The lock must be held."""
+        if self._dirty_stop <= self._dirty_start:
+            return
+        with memoryview(self._block) as view:
+            self._write(self._offset + self._dirty_start, view[self._dirty_start : self._dirty_stop])
+        self._dirty_start = self._dirty_stop = 0
+
+    def flush(self) -> None:
+        """Write modified bytes back to the data."""
+        if self._dirty_stop <= self._dirty_start:
+            return
+        with self._lock:
+            self._flush()
+
+    def get(self, offset: int) -> int:
+        """Return the byte value located at offset."""
+        with self._lock:
+            index = self._index(offset)
+            return self._block[index]
+
+    def modifications(self) -> tuple[int, bytes]:
+        """Return the offset and a copy of the modified bytes that were not written back."""
+        with self._lock:
+            return self._offset + self._dirty_start, bytes(self._block[self._dirty_start : self._dirty_stop])
+
+    def read(self, offset: int, length: int | None = None) -> bytearray:
+        """Return the data range at offset with modified bytes overlaid."""
+        with self._lock:
+            return self._overlay(offset, self._read(offset, length))
+
+    def invalidate(self) -> None:
+        """Discard the cached block, including modifications that were not written back."""
+        with self._lock:
+            self._block = bytearray()
+            self._dirty_start = self._dirty_stop = 0
+
+    def set(self, offset: int, value: int) -> None:
+        """Set the byte value located at offset."""
+        with self._lock:
+            index = self._index(offset)
+            self._block[index] = value
+            if self._dirty_stop <= self._dirty_start:
+                self._dirty_start, self._dirty_stop = index, index + 1
+            else:
+                self._dirty_start = min(self._dirty_start, index)
+                self._dirty_stop = max(self._dirty_stop, index + 1)
+
+
+def overlay(data: bytearray, offset: int, patch_offset: int, patch: bytes | bytearray) -> bytearray:
+    """Copy the part of patch located at patch_offset that overlaps data located at offset.
+
+    Params
+    ------
+    data - Data read at offset, modified in place.
+    offset - Location of data.
+    patch_offset - Location of patch.
+    patch - Bytes replacing data at their location.
+    """
+    start = max(offset, patch_offset)
+    stop = min(offset + len(data), patch_offset + len(patch))
+    if start < stop:
+        data[start - offset : stop - offset] = patch[start - patch_offset : stop - patch_offset]
+    return data
@@ -1,21 +1,25 @@
 """Hexabyte Appplication Class."""
 
+from typing import Union
+
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.reactive import reactive
 from textual.widgets import Input
 
-from .actions import Action, ActionError
+from .actions import Action, ActionError, LongRunningAction
 from .actions.action_handler import ActionHandler
-from .actions.app import Exit
+from .actions.app import Cancel, Exit, Profile, Trace
 from .commands import Command, CommandParser, InvalidCommandError, register_actions
 from .constants.generic import APP_NAME
 from .context import context
 from .widgets.command_prompt import CommandPrompt
+from .widgets.editor import Editor
 from .widgets.help_screen import HelpScreen, HelpWindow
 from .widgets.workbench import Workbench
 
-ACTIONS = [Exit]
+ACTIONS = [Cancel, Exit, Profile, Trace]
+PROGRESS_INTERVAL = 0.25
 
 
 @register_actions(ACTIONS)
@@ -46,6 +50,7 @@ class HexabyteApp(App):
         self.cmd_parser = CommandParser()
         self.cmd_parser.register_app(self)
         self.workbench = Workbench()
+        self.running_actions: list[LongRunningAction] = []
 
     def compose(self) -> ComposeResult:
         """Compose main screen."""
@@ -54,6 +59,64 @@ class HexabyteApp(App):
         yield CommandPrompt(max_cmd_history=max_cmd_history, id="cmd-prompt")
         yield HelpScreen(id="help")
 
+    def _apply_api_action(self, editor: Editor, action: Action) -> None:
+        """Perform an api action on the editor data and update the editor."""
+        version = editor.api.version
+        editor.api.do(action)
+        editor.cursor = editor.api.cursor.bit
+        editor.refresh_changes()
+        if editor.api.version != version:
+            editor.post_message(Editor.Changed(editor))
+
+    def _do_api_action(self, action: Action) -> None:
+        """Perform an api action on the active editor, or start it if long running."""
+        workbench = self.query_one("Workbench", Workbench)
+        if workbench.active_editor is None:
+            raise ValueError("No active editor")
+        if isinstance(action, LongRunningAction):
+            self._start_action(workbench.active_editor, action)
+        else:
+            self._apply_api_action(workbench.active_editor, action)
+
+    def _finish_action(self, editor: Editor, action: LongRunningAction, error: Union[ActionError, None]) -> None:
+        """Apply a long running action once prepared, and report the outcome."""
+        self.running_actions.remove(action)
+        if not self.running_actions:
+            self.progress_timer.pause()
+        prompt = self.query_one("#cmd-prompt", CommandPrompt)
+        try:
+            if error is not None:
+                raise error
+            self._apply_api_action(editor, action)
+            prompt.set_status(f"{action.CMD} done")
+        except (ActionError, InvalidCommandError) as err:
+            prompt.set_status(f"{action.CMD} - {err}")
+
+    def _run_action(self, editor: Editor, action: LongRunningAction) -> None:
+        """Prepare a long running action. Runs in a worker thread."""
+        error: Union[ActionError, None] = None
+        try:
+            action.run()
+        except ActionError as err:
+            error = err
+        except Exception as err:  # pylint: disable=broad-except
+            # Unexpected errors must not kill the app or leave the action running
+            error = ActionError(f"{type(err).__name__} - {err}")
+        self.call_from_thread(self._finish_action, editor, action, error)
+
+    def _show_progress(self) -> None:
+        """Show the progress of running actions in the command prompt."""
+        if self.running_actions:
+            status = ", ".join(f"{action.CMD} {action.progress}" for action in self.running_actions)
+            self.query_one("#cmd-prompt", CommandPrompt).set_status(status)
+
+    def _start_action(self, editor: Editor, action: LongRunningAction) -> None:
+        """Start preparing a long running action in a worker thread."""
+        editor.api.action_handler.start(action)
+        self.running_actions.append(action)
+        self.progress_timer.resume()
+        self.run_worker(lambda: self._run_action(editor, action), thread=True, group="actions")
+
     def action_cmd_prompt_show(self) -> None:
         """Enter command mode."""
         prompt = self.query_one("#cmd-prompt", CommandPrompt)
@@ -78,6 +141,8 @@ class HexabyteApp(App):
                 prompt.display = True
                 prompt.set_status("Unsave Changes")
                 return
+        for action in self.running_actions:
+            action.progress.cancel()
         self.exit()
 
     def action_toggle_dark(self) -> None:
@@ -98,6 +163,12 @@ class HexabyteApp(App):
         """Process and perform action."""
         self.action_handler.do(action)
 
+    def on_mount(self) -> None:
+        """Perform on_mount tasks."""
+        self.progress_timer = self.set_interval(  # pylint: disable=attribute-defined-outside-init
+            PROGRESS_INTERVAL, self._show_progress, pause=True
+        )
+
     def on_command(self, event: Command) -> None:
         """Handle an editor command."""
         prompt = self.query_one("#cmd-prompt", CommandPrompt)
@@ -114,15 +185,11 @@ class HexabyteApp(App):
                 if action.TARGET == "app":
                     self.do(action)
                 elif action.TARGET == "api":
-                    workbench = self.query_one("Workbench", Workbench)
-                    if workbench.active_editor is None:
-                        raise ValueError("No active editor")
-                    workbench.active_editor.api.do(action)
-                    workbench.active_editor.cursor = workbench.active_editor.api.cursor.bit
-                    workbench.active_editor.refresh()
+                    self._do_api_action(action)
                 else:
                     raise InvalidCommandError(event.cmd, f"Unsupported target - {action.TARGET}")
             prompt.set_status("", clear=True)
+            self._show_progress()
         except (ActionError, InvalidCommandError) as err:
             prompt.set_status(str(err))
 
@@ -130,5 +197,7 @@ class HexabyteApp(App):
         """Toggle help screen visibility if show_help flag changes."""
         help_screen = self.query_one("#help", HelpScreen)
         help_screen.display = visibility
+        if visibility:
+            help_screen.load_text()
         window = help_screen.query_one("HelpWindow", HelpWindow)
         window.focus()
@@ -0,0 +1,88 @@
+"""Navigation History Module."""
+from __future__ import annotations
+
+from array import array
+
+DEFAULT_CAPACITY = 100
+MIN_CAPACITY = 2
+
+
+class NavigationHistory:
+    """Navigation History Class.
+
+    Records the cursor positions of significant jumps in a fixed size ring of integers, so
+    history memory does not depend on how often the cursor moves. Stepping back and forward
+    moves through the recorded positions. Recording a jump discards the positions ahead of the
+    current one, and the oldest positions are overwritten once the ring is full.
+
+    Params
+    ------
+    capacity - Maximum number of recorded positions.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize the navigation history."""
+        if capacity < MIN_CAPACITY:
+            raise ValueError(f"Capacity must be at least {MIN_CAPACITY}.")
+        self._points = array("q", bytes(capacity * array("q").itemsize))
+        self._start = 0
+        self._length = 0
+        self._position = -1
+
+    def __len__(self) -> int:
+        """Return the number of recorded positions."""
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of recorded positions."""
+        return len(self._points)
+
+    @property
+    def current(self) -> int | None:
+        """Return the current position, or None if nothing was recorded."""
+        return self._get(self._position) if self._length else None
+
+    def _append(self, offset: int) -> None:
+        """Append a position, overwriting the oldest position if full."""
+        if self._length == self.capacity:
+            self._start = (self._start + 1) % self.capacity
+        else:
+            self._length += 1
+        self._points[(self._start + self._length - 1) % self.capacity] = offset
+        self._position = self._length - 1
+
+    def _get(self, index: int) -> int:
+        """Return the position at index, counting from the oldest position."""
+        return self._points[(self._start + index) % self.capacity]
+
+    def back(self) -> int | None:
+        """Step back and return the previous position, or None if at the oldest position."""
+        if self._position < 1:
+            return None
+        self._position -= 1
+        return self._get(self._position)
+
+    def clear(self) -> None:
+        """Discard every recorded position."""
+        self._start = self._length = 0
+        self._position = -1
+
+    def forward(self) -> int | None:
+        """Step forward and return the next position, or None if at the newest position."""
+        if self._position >= self._length - 1:
+            return None
+        self._position += 1
+        return self._get(self._position)
+
+    def record(self, source: int, destination: int) -> None:
+        """Record a jump from source to destination.
+
+        Jumps to the current position are ignored, so stepping back and forward is not recorded.
+        """
+        if self._length and self._get(self._position) == destination:
+            return
+        self._length = self._position + 1
+        if not self._length or self._get(self._position) != source:
+            self._append(source)
+        self._append(destination)
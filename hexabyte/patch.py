@@ -0,0 +1,198 @@
+"""Batch Patch Module.
+
+Applies the same set of byte patches to many files in parallel without starting the TUI.
+Files are opened with memory mapped data sources, so only the patched pages are copied.
+
+Patch specifications are TOML files containing a list of patches. Byte values are hex
+strings and may contain whitespace.
+
+    [[patch]]
+    offset = 0x10
+    data = "aa bb"
+
+    [[patch]]
+    find = "de ad be ef"
+    replace = "ca fe ba be"
+    count = 1
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from os import cpu_count
+from pathlib import Path
+from time import perf_counter
+from typing import overload
+
+import toml
+
+from .api import DataAPI
+from .config import Config
+from .context import context
+from .data_sources import MmapDataSource
+
+CHUNKS_PER_WORKER = 4
+
+
+class PatchError(Exception):
+    """Raised when a patch cannot be applied."""
+
+
+@dataclass(frozen=True)
+class Patch:
+    """A single byte patch.
+
+    Params
+    ------
+    data - Bytes written at offset or replacing each match of find.
+    offset - Offset at which data is written. Mutually exclusive with find.
+    find - Byte sequence replaced by data. Mutually exclusive with offset.
+    count - Maximum number of replaced matches. Replaces every match if 0.
+    """
+
+    data: bytes
+    offset: int | None = None
+    find: bytes | None = None
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Validate patch."""
+        if (self.offset is None) == (self.find is None):
+            raise ValueError("Patch requires exactly one of offset or find.")
+        if self.offset is not None and self.offset < 0:
+            raise ValueError("Patch offset must be greater than or equal to 0.")
+        if self.find is not None and not self.find:
+            raise ValueError("Patch find bytes must not be empty.")
+        if self.count < 0:
+            raise ValueError("Patch count must be greater than or equal to 0.")
+
+    def apply(self, api: DataAPI) -> int:
+        """Apply the patch and return the number of patched locations."""
+        if self.offset is not None:
+            if self.offset + len(self.data) > len(api):
+                raise PatchError(f"Patch at {self.offset:#x} exceeds data size {len(api):#x}")
+            api.seek(self.offset)
+            api.write(self.data)
+            return 1
+        find = self.find or b""
+        replaced = 0
+        offset = api.find(find)
+        while offset != -1 and (not self.count or replaced < self.count):
+            api.seek(offset)
+            api.replace(len(find), self.data)
+            replaced += 1
+            offset = api.find(find, offset + len(self.data))
+        return replaced
+
+
+@dataclass
+class PatchResult:
+    """Outcome of patching a single file.
+
+    Params
+    ------
+    filepath - The patched file.
+    patched - Number of patched locations.
+    elapsed - Time taken to open, patch and save the file in seconds.
+    error - Description of the failure, or None if all patches were applied.
+    """
+
+    filepath: Path
+    patched: int = 0
+    elapsed: float = 0.0
+    error: str | None = None
+
+    def __str__(self) -> str:
+        """Return a one line summary of the result."""
+        if self.error is not None:
+            return f"{self.filepath}: error: {self.error}"
+        return f"{self.filepath}: {self.patched} locations patched in {self.elapsed * 1000:.1f} ms"
+
+
+def load_patches(patch_filepath: Path) -> list[Patch]:
+    """Return the patches of a TOML patch specification.
+
+    Raises a ValueError naming the index of the first malformed patch.
+    """
+    patches = []
+    for idx, spec in enumerate(toml.load(patch_filepath).get("patch", [])):
+        try:
+            patches.append(_parse_patch(spec))
+        except ValueError as err:
+            raise ValueError(f"Invalid patch {idx}: {err}") from err
+    return patches
+
+
+def _parse_hex(spec: dict, key: str) -> bytes:
+    """Return the bytes of a hex string patch field."""
+    if key not in spec:
+        raise ValueError(f"Missing {key!r}.")
+    if not isinstance(spec[key], str):
+        raise ValueError(f"{key!r} must be a hex string.")
+    return bytes.fromhex(spec[key])
+
+
+@overload
+def _parse_int(spec: dict, key: str) -> int | None:
+    ...
+
+
+@overload
+def _parse_int(spec: dict, key: str, default: int) -> int:
+    ...
+
+
+def _parse_int(spec: dict, key: str, default: int | None = None) -> int | None:
+    """Return the value of an integer patch field, or default if it is not specified."""
+    value = spec.get(key, default)
+    if value is not None and (not isinstance(value, int) or isinstance(value, bool)):
+        raise ValueError(f"{key!r} must be an integer.")
+    return value
+
+
+def _parse_patch(spec: dict) -> Patch:
+    """Return the patch of a single patch specification."""
+    if not isinstance(spec, dict):
+        raise ValueError("Patch must be a table.")
+    if "find" in spec:
+        count = _parse_int(spec, "count", 0)
+        return Patch(_parse_hex(spec, "replace"), find=_parse_hex(spec, "find"), count=count)
+    return Patch(_parse_hex(spec, "data"), offset=_parse_int(spec, "offset"))
+
+
+def patch_file(patches: list[Patch], filepath: Path) -> PatchResult:
+    """Apply patches to a file and save it if modified.
+
+    No data is written unless every patch is applied.
+    """
+    context.setdefault("config", Config())
+    result = PatchResult(filepath)
+    start = perf_counter()
+    try:
+        api = DataAPI(filepath, MmapDataSource)
+        for patch in patches:
+            result.patched += patch.apply(api)
+        if api.modified:
+            api.save()
+    except (OSError, PatchError, ValueError) as err:
+        result.error = str(err) or type(err).__name__
+    result.elapsed = perf_counter() - start
+    return result
+
+
+def patch_files(patches: list[Patch], filepaths: Iterable[Path], jobs: int | None = None) -> Iterator[PatchResult]:
+    """Apply patches to each file, yielding results in file order.
+
+    Files are distributed in chunks across a pool of `jobs` worker processes. Defaults to one
+    worker per CPU. A single job runs in the current process.
+    """
+    filepaths = list(filepaths)
+    jobs = jobs or cpu_count() or 1
+    if jobs == 1 or len(filepaths) <= 1:
+        for filepath in filepaths:
+            yield patch_file(patches, filepath)
+        return
+    chunksize = max(1, len(filepaths) // (jobs * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(patch_file, [patches] * len(filepaths), filepaths, chunksize=chunksize)
@@ -0,0 +1,142 @@
+"""Profiling Module.
+
+Collects timing histograms of instrumented hot paths. Profiling is disabled by default and
+instrumented code only checks a flag while disabled.
+"""
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import Any, TypeVar
+
+BUCKET_COUNT = 32
+US_PER_SECOND = 1_000_000
+
+T = TypeVar("T", bound=Callable[..., Any])
+
+
+class Histogram:
+    """Timing Histogram Class.
+
+    Durations are counted in power of two microsecond buckets, so recording is constant time
+    and percentiles are accurate to within a factor of two.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        """Return the mean duration in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, fraction: float) -> float:
+        """Return the upper bound of the bucket containing the percentile in seconds."""
+        if not self.count:
+            return 0.0
+        threshold = fraction * self.count
+        seen = 0
+        for idx, count in enumerate(self.buckets):
+            seen += count
+            if seen >= threshold:
+                return min(self.max, (1 << idx) / US_PER_SECOND)
+        return self.max
+
+    def record(self, duration: float) -> None:
+        """Record a duration in seconds."""
+        micros = int(duration * US_PER_SECOND)
+        self.buckets[min(micros.bit_length(), BUCKET_COUNT - 1)] += 1
+        self.count += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable summary. Durations are in microseconds."""
+        return {
+            "count": self.count,
+            "total_us": self.total * US_PER_SECOND,
+            "mean_us": self.mean * US_PER_SECOND,
+            "p50_us": self.percentile(0.5) * US_PER_SECOND,
+            "p95_us": self.percentile(0.95) * US_PER_SECOND,
+            "max_us": self.max * US_PER_SECOND,
+            "buckets": {f"<{1 << idx}us": count for idx, count in enumerate(self.buckets) if count},
+        }
+
+
+class Profiler:
+    """Profiler Class.
+
+    Tracks a histogram per instrumented operation. Safe to use from worker threads.
+    """
+
+    def __init__(self) -> None:
+        """Initialize a disabled profiler."""
+        self.enabled = False
+        self._lock = Lock()
+        self.histograms: dict[str, Histogram] = {}
+
+    def dump(self, filepath: Path) -> None:
+        """Write all histograms to a JSON file."""
+        with filepath.open("w", encoding="utf8") as dump_file:
+            json.dump(self.to_dict(), dump_file, indent=2)
+
+    def record(self, name: str, duration: float) -> None:
+        """Record a duration in seconds for an operation."""
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.record(duration)
+
+    def reset(self) -> None:
+        """Discard all recorded durations."""
+        with self._lock:
+            self.histograms = {}
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the duration of the managed block if profiling is enabled."""
+        if not self.enabled:
+            yield
+            return
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, perf_counter() - start)
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        """Return JSON serializable summaries of every histogram, sorted by name."""
+        with self._lock:
+            return {name: self.histograms[name].to_dict() for name in sorted(self.histograms)}
+
+
+profiler = Profiler()
+
+
+def profiled(name: str) -> Callable[[T], T]:
+    """Decorate a function so its duration is recorded under name while profiling is enabled."""
+
+    def decorator(func: T) -> T:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return func(*args, **kwargs)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.record(name, perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
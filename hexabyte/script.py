@@ -0,0 +1,99 @@
+"""Headless Script Module.
+
+Applies command scripts to files without starting the TUI. Scripts contain the same
+commands accepted by the command prompt, one or more per line separated by `;`. Blank
+lines and lines starting with `#` are ignored. Modified data is only written when the
+script contains a `save` or `saveas` command.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .actions import ActionError
+from .api import DataAPI
+from .commands import CommandParser, InvalidCommandError
+from .config import Config
+from .context import context
+
+COMMENT_PREFIX = "#"
+
+
+@dataclass
+class ScriptResult:
+    """Outcome of applying a script to a single file.
+
+    Params
+    ------
+    filepath - The file the script was applied to.
+    actions - Number of actions performed.
+    modified - True if unsaved modifications were discarded.
+    error - Description of the failed command, or None if the script completed.
+    """
+
+    filepath: Path
+    actions: int = 0
+    modified: bool = False
+    error: str | None = None
+
+    def __str__(self) -> str:
+        """Return a one line summary of the result."""
+        if self.error is not None:
+            return f"{self.filepath}: error: {self.error}"
+        status = "unsaved modifications discarded" if self.modified else "ok"
+        return f"{self.filepath}: {self.actions} actions, {status}"
+
+
+def read_script(script_filepath: Path) -> list[tuple[int, str]]:
+    """Return the line numbers and command strings of a script file."""
+    lines = []
+    with script_filepath.open(encoding="utf8") as script_file:
+        for line_number, line in enumerate(script_file, start=1):
+            cmd = line.strip()
+            if cmd and not cmd.startswith(COMMENT_PREFIX):
+                lines.append((line_number, cmd))
+    return lines
+
+
+def run_script(script: list[tuple[int, str]], filepath: Path) -> ScriptResult:
+    """Apply script commands to a file, stopping at the first failed command."""
+    result = ScriptResult(filepath)
+    parser = CommandParser()
+    line_number = 0
+    try:
+        api = DataAPI(filepath)
+        for line_number, line in script:
+            for action in parser.parse(line):
+                if action.TARGET != "api":
+                    raise InvalidCommandError(line, f"Unsupported target in script mode - {action.TARGET}")
+                api.do(action)
+                result.actions += 1
+        result.modified = api.modified
+    except (ActionError, InvalidCommandError, OSError, ValueError) as err:
+        location = f"line {line_number}: " if line_number else ""
+        result.error = f"{location}{str(err) or type(err).__name__}"
+    return result
+
+
+def run_scripts(
+    script: list[tuple[int, str]], filepaths: Iterable[Path], jobs: int | None = None
+) -> Iterator[ScriptResult]:
+    """Apply a script to each file, yielding results in file order.
+
+    Files are processed in parallel by a pool of `jobs` worker processes. Defaults to one
+    worker per CPU. A single job runs in the current process.
+    """
+    filepaths = list(filepaths)
+    if jobs == 1 or len(filepaths) <= 1:
+        for filepath in filepaths:
+            yield run_script(script, filepath)
+        return
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(context.config,)) as executor:
+        yield from executor.map(run_script, [script] * len(filepaths), filepaths)
+
+
+def _init_worker(config: Config) -> None:
+    """Share the active config with a worker process."""
+    context.config = config
@@ -0,0 +1,24 @@
+"""Data Templates Package.
+
+Templates overlay structure definitions built from `struct` format strings on data. Templates
+are builtin, defined in the `templates` section of the config or registered by plugins.
+"""
+from .parser import Node, TemplateParser, format_value
+from .registry import detect_template, get_template, load_templates, register_template, templates
+from .template import Array, Field, Struct, Template, TemplateError
+
+__all__ = [
+    "Array",
+    "Field",
+    "Node",
+    "Struct",
+    "Template",
+    "TemplateError",
+    "TemplateParser",
+    "detect_template",
+    "format_value",
+    "get_template",
+    "load_templates",
+    "register_template",
+    "templates",
+]
@@ -0,0 +1,150 @@
+"""Builtin Templates Module."""
+from .template import Array, Field, Member, Struct, Template
+
+
+def _fields(*specs: str) -> tuple[Field, ...]:
+    """Return fields from `name:format` specifications."""
+    return tuple(Field(*spec.split(":")) for spec in specs)
+
+
+def _elf(name: str, word: str, program_header: Struct, section_header: Struct, magic: bytes) -> Template:
+    """Return an ELF template using the given word format for addresses and offsets."""
+    header = _fields(
+        "e_ident:16s",
+        "e_type:H",
+        "e_machine:H",
+        "e_version:I",
+        f"e_entry:{word}",
+        f"e_phoff:{word}",
+        f"e_shoff:{word}",
+        "e_flags:I",
+        "e_ehsize:H",
+        "e_phentsize:H",
+        "e_phnum:H",
+        "e_shentsize:H",
+        "e_shnum:H",
+        "e_shstrndx:H",
+    )
+    members: tuple[Member, ...] = (
+        *header,
+        Array("program_headers", program_header, "e_phnum", at="e_phoff"),
+        Array("section_headers", section_header, "e_shnum", at="e_shoff"),
+    )
+    return Template(name, Struct(name, members, "<"), magic, f"{name.upper()} little endian executable")
+
+
+ELF32 = _elf(
+    "elf32",
+    "I",
+    Struct(
+        "program_header",
+        _fields(
+            "p_type:I", "p_offset:I", "p_vaddr:I", "p_paddr:I", "p_filesz:I", "p_memsz:I", "p_flags:I", "p_align:I"
+        ),
+    ),
+    Struct(
+        "section_header",
+        _fields(
+            "sh_name:I",
+            "sh_type:I",
+            "sh_flags:I",
+            "sh_addr:I",
+            "sh_offset:I",
+            "sh_size:I",
+            "sh_link:I",
+            "sh_info:I",
+            "sh_addralign:I",
+            "sh_entsize:I",
+        ),
+    ),
+    b"\x7fELF\x01\x01",
+)
+
+ELF64 = _elf(
+    "elf64",
+    "Q",
+    Struct(
+        "program_header",
+        _fields(
+            "p_type:I", "p_flags:I", "p_offset:Q", "p_vaddr:Q", "p_paddr:Q", "p_filesz:Q", "p_memsz:Q", "p_align:Q"
+        ),
+    ),
+    Struct(
+        "section_header",
+        _fields(
+            "sh_name:I",
+            "sh_type:I",
+            "sh_flags:Q",
+            "sh_addr:Q",
+            "sh_offset:Q",
+            "sh_size:Q",
+            "sh_link:I",
+            "sh_info:I",
+            "sh_addralign:Q",
+            "sh_entsize:Q",
+        ),
+    ),
+    b"\x7fELF\x02\x01",
+)
+
+PE = Template(
+    "pe",
+    Struct(
+        "pe",
+        (
+            Struct(
+                "dos_header",
+                _fields(
+                    "e_magic:2s",
+                    *(
+                        f"{name}:H"
+                        for name in (
+                            "e_cblp",
+                            "e_cp",
+                            "e_crlc",
+                            "e_cparhdr",
+                            "e_minalloc",
+                            "e_maxalloc",
+                            "e_ss",
+                            "e_sp",
+                            "e_csum",
+                            "e_ip",
+                            "e_cs",
+                            "e_lfarlc",
+                            "e_ovno",
+                        )
+                    ),
+                    "e_res:8s",
+                    "e_oemid:H",
+                    "e_oeminfo:H",
+                    "e_res2:20s",
+                    "e_lfanew:I",
+                ),
+            ),
+            Struct(
+                "nt_headers",
+                (
+                    Field("signature", "4s"),
+                    Struct(
+                        "file_header",
+                        _fields(
+                            "machine:H",
+                            "number_of_sections:H",
+                            "time_date_stamp:I",
+                            "pointer_to_symbol_table:I",
+                            "number_of_symbols:I",
+                            "size_of_optional_header:H",
+                            "characteristics:H",
+                        ),
+                    ),
+                ),
+                at="dos_header.e_lfanew",
+            ),
+        ),
+        "<",
+    ),
+    b"MZ",
+    "PE/COFF executable headers",
+)
+
+BUILTIN_TEMPLATES = (ELF32, ELF64, PE)
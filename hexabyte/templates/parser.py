@@ -0,0 +1,246 @@
+"""Template Parser Module."""
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+from .template import Array, Field, Member, Struct, Template
+
+MAX_CACHED = 1 << 16
+MAX_BYTES_PREVIEW = 48
+ELLIPSIS = "..."
+
+
+@dataclass(frozen=True)
+class Node:
+    """A template member located in data.
+
+    Params
+    ------
+    name - Member name, or the element index of array elements.
+    path - Dotted path of the member from the template root.
+    member - The located field, struct or array definition.
+    offset - Offset of the member in data.
+    size - Number of bytes occupied by the member.
+    endian - Byte order prefix used to decode fields.
+    count - Number of elements of arrays.
+    """
+
+    name: str
+    path: str
+    member: Member
+    offset: int
+    size: int
+    endian: str
+    count: int = 0
+
+    @property
+    def end(self) -> int:
+        """Return the offset following the member."""
+        return self.offset + self.size
+
+    @property
+    def expandable(self) -> bool:
+        """Return True if the node has children."""
+        return not isinstance(self.member, Field)
+
+    @property
+    def key(self) -> tuple[int, str]:
+        """Return the cache key of the node."""
+        return self.offset, self.path
+
+
+class TemplateParser:
+    """Template Parser Class.
+
+    Locates template members in data on demand. Struct layouts and field values are cached
+    by offset as they are parsed, so only the members that are displayed or searched are ever
+    read. Array elements are located arithmetically and never parsed up front. Cached entries
+    overlapping modified data are discarded.
+
+    Params
+    ------
+    template - The template overlaid on data.
+    reader - Callable returning `length` bytes located at `offset` of the data.
+    length - Callable returning the data size.
+    """
+
+    def __init__(
+        self, template: Template, reader: Callable[[int, int], bytes | bytearray], length: Callable[[], int]
+    ) -> None:
+        """Initialize the template parser."""
+        self.template = template
+        self._read = reader
+        self._length = length
+        self._lock = Lock()
+        self._layouts: dict[tuple[int, str], list[Node]] = {}
+        self._values: dict[tuple[int, str], tuple[int, Any]] = {}
+
+    @property
+    def cached(self) -> int:
+        """Return the number of cached layouts and values."""
+        return len(self._layouts) + len(self._values)
+
+    @property
+    def root(self) -> Node:
+        """Return the node of the template root struct."""
+        root = self.template.root
+        node = Node(self.template.name, "", root, 0, 0, self.template.endian)
+        return Node(node.name, "", root, 0, self._struct_size(node), node.endian)
+
+    def _cache_layout(self, node: Node, layout: list[Node]) -> None:
+        """Cache a struct layout."""
+        if len(self._layouts) >= MAX_CACHED:
+            self._layouts.clear()
+        self._layouts[node.key] = layout
+
+    def _element(self, node: Node, index: int) -> Node:
+        """Return an array element node."""
+        element = node.member.element  # type: ignore[union-attr]
+        size = element.static_size or 0
+        return Node(str(index), f"{node.path}[{index}]", element, node.offset + index * size, size, node.endian)
+
+    def _layout(self, node: Node) -> list[Node]:
+        """Return the member nodes of a struct, laying them out if not cached."""
+        with self._lock:
+            layout = self._layouts.get(node.key)
+        if layout is not None:
+            return layout
+        struct_def: Struct = node.member  # type: ignore[assignment]
+        endian = struct_def.endian or node.endian
+        data_size = self._length()
+        layout = []
+        offset = node.offset
+        for member in struct_def.members:
+            path = f"{node.path}.{member.name}" if node.path else member.name
+            member_offset = offset if member.at is None else self._resolve(layout, member.at)
+            child = Node(member.name, path, member, member_offset, 0, endian)
+            if isinstance(member, Field):
+                child = Node(member.name, path, member, member_offset, member.static_size, endian)
+            elif isinstance(member, Struct):
+                child = Node(member.name, path, member, member_offset, self._struct_size(child), endian)
+            else:
+                element_size = member.element.static_size or 0
+                count = member.count if isinstance(member.count, int) else self._resolve(layout, member.count)
+                if element_size:
+                    count = min(count, max(0, data_size - member_offset) // element_size)
+                child = Node(member.name, path, member, member_offset, count * element_size, endian, count)
+            layout.append(child)
+            if member.at is None:
+                offset = child.end
+        with self._lock:
+            self._cache_layout(node, layout)
+        return layout
+
+    def _resolve(self, layout: list[Node], reference: int | str) -> int:
+        """Return an integer, or the value of a field laid out earlier in the same struct."""
+        if isinstance(reference, int):
+            return reference
+        name, _, rest = reference.partition(".")
+        for node in layout:
+            if node.name != name:
+                continue
+            if rest and isinstance(node.member, Struct):
+                return self._resolve(self._layout(node), rest)
+            value = self.value(node)
+            return value if isinstance(value, int) else 0
+        return 0
+
+    def _struct_size(self, node: Node) -> int:
+        """Return the size of a struct node."""
+        static_size = node.member.static_size
+        if static_size is not None:
+            return static_size
+        sequential = [child for child in self._layout(node) if child.member.at is None]
+        return sequential[-1].end - node.offset if sequential else 0
+
+    def children(self, node: Node, start: int = 0, stop: int | None = None) -> list[Node]:
+        """Return child nodes of a struct, or the elements of an array between start and stop."""
+        if isinstance(node.member, Struct):
+            return self._layout(node)[start:stop]
+        if isinstance(node.member, Array):
+            stop = node.count if stop is None else min(stop, node.count)
+            return [self._element(node, index) for index in range(max(0, start), stop)]
+        return []
+
+    def invalidate(self, offset: int, old_length: int, new_length: int) -> None:
+        """Discard cached entries after `old_length` bytes at `offset` were replaced by `new_length` bytes.
+
+        Entries overlapping the replaced bytes are discarded. If the data size changed, every
+        layout and the values following the replaced bytes are discarded as well.
+        """
+        resized = old_length != new_length
+        stop = offset + max(old_length, new_length, 1)
+        with self._lock:
+            if resized:
+                self._layouts.clear()
+            for key, layout in list(self._layouts.items()):
+                if _layout_end(key[0], layout) > offset and key[0] < stop:
+                    del self._layouts[key]
+            for key, (size, _) in list(self._values.items()):
+                if key[0] + size > offset and (resized or key[0] < stop):
+                    del self._values[key]
+
+    def node_at(self, offset: int) -> list[Node]:
+        """Return the nodes containing offset from the root down to the innermost node."""
+        path = []
+        node: Node | None = self.root
+        while node is not None:
+            if node.offset <= offset < node.end:
+                path.append(node)
+            if isinstance(node.member, Array):
+                if not node.offset <= offset < node.end:
+                    break
+                size = node.member.element.static_size or 1
+                node = self._element(node, (offset - node.offset) // size)
+            elif isinstance(node.member, Struct):
+                node = next((child for child in self._layout(node) if child.offset <= offset < child.end), None)
+            else:
+                node = None
+        return path
+
+    def reset(self) -> None:
+        """Discard every cached layout and value."""
+        with self._lock:
+            self._layouts.clear()
+            self._values.clear()
+
+    def value(self, node: Node) -> Any:
+        """Return the decoded value of a field node, or None if it extends past the end of data."""
+        with self._lock:
+            cached = self._values.get(node.key)
+        if cached is not None:
+            return cached[1]
+        field: Field = node.member  # type: ignore[assignment]
+        data = self._read(node.offset, node.size)
+        value: Any = None
+        if len(data) == node.size:
+            values = struct.unpack(field.format(node.endian), data)
+            value = values[0] if len(values) == 1 else values
+        with self._lock:
+            if len(self._values) >= MAX_CACHED:
+                self._values.clear()
+            self._values[node.key] = (node.size, value)
+        return value
+
+
+def _layout_end(offset: int, layout: list[Node]) -> int:
+    """Return the end of the data range a struct layout depends on."""
+    return max((node.end for node in layout if node.member.at is None), default=offset)
+
+
+def format_value(value: Any) -> str:
+    """Return a short display string of a field value."""
+    if value is None:
+        return "<eof>"
+    if isinstance(value, int):
+        return f"{value:#x}"
+    if isinstance(value, bytes):
+        text = value.hex(" ")
+        return text if len(text) <= MAX_BYTES_PREVIEW else text[: MAX_BYTES_PREVIEW - len(ELLIPSIS)] + ELLIPSIS
+    if isinstance(value, tuple):
+        return ", ".join(format_value(item) for item in value)
+    return str(value)
@@ -0,0 +1,51 @@
+"""Template Registry Module."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from ..context import context
+from .builtin import BUILTIN_TEMPLATES
+from .template import Template, TemplateError
+
+templates: dict[str, Template] = {template.name: template for template in BUILTIN_TEMPLATES}
+# Ids of the configs whose templates were registered
+_loaded_configs: set[int] = set()
+
+
+def _load_config_templates() -> None:
+    """Register the templates defined in the active config once."""
+    config = context.get("config")
+    if config is not None and id(config) not in _loaded_configs:
+        _loaded_configs.add(id(config))
+        for template in load_templates(config.settings.get("templates", {})):
+            register_template(template)
+
+
+def detect_template(data: bytes) -> Template | None:
+    """Return the template with the longest magic matching the start of data."""
+    _load_config_templates()
+    matches = [template for template in templates.values() if template.magic and data.startswith(template.magic)]
+    return max(matches, key=lambda template: len(template.magic), default=None)
+
+
+def get_template(name: str) -> Template:
+    """Return a registered template by name."""
+    _load_config_templates()
+    if name not in templates:
+        raise TemplateError(f"Unknown template - {name}")
+    return templates[name]
+
+
+def load_templates(definitions: Mapping[str, Mapping[str, Any]]) -> list[Template]:
+    """Create templates from config definitions.
+
+    Each definition is a table with a list of `fields`. Definitions may reference each other
+    as struct members.
+    """
+    return [Template.from_dict(name, spec, definitions) for name, spec in definitions.items()]
+
+
+def register_template(template: Template) -> None:
+    """Register a new template, replacing any template with the same name."""
+    templates[template.name] = template
@@ -0,0 +1,192 @@
+"""Template Definition Module."""
+from __future__ import annotations
+
+import struct
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Union
+
+ENDIAN_PREFIXES = "@=<>!"
+
+
+class TemplateError(Exception):
+    """Raised when a template definition is invalid."""
+
+
+@dataclass(frozen=True)
+class Field:
+    """A single value decoded with a `struct` format string.
+
+    Params
+    ------
+    name - Field name.
+    fmt - `struct` format string. Uses the enclosing struct byte order unless prefixed.
+    at - Offset of the field relative to the template start, or the name of an earlier
+    integer field holding it. Follows the previous member if None.
+    """
+
+    name: str
+    fmt: str
+    at: int | str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate format."""
+        try:
+            struct.calcsize(self.format("<"))
+        except struct.error as err:
+            raise TemplateError(f"Invalid format for field {self.name!r} - {self.fmt!r}") from err
+
+    @property
+    def static_size(self) -> int:
+        """Return the number of bytes occupied by the field."""
+        return struct.calcsize(self.format("<"))
+
+    def format(self, endian: str) -> str:
+        """Return the format string using the given byte order unless the format specifies one."""
+        return self.fmt if self.fmt[:1] in ENDIAN_PREFIXES else endian + self.fmt
+
+
+@dataclass(frozen=True)
+class Struct:
+    """A sequence of members.
+
+    Params
+    ------
+    name - Struct name.
+    members - Fields, structs and arrays in data order.
+    endian - Byte order prefix of member formats. Inherited from the enclosing struct if None.
+    at - Offset of the struct relative to the template start, or the name of an earlier
+    integer field holding it. Follows the previous member if None.
+    """
+
+    name: str
+    members: tuple[Member, ...]
+    endian: str | None = None
+    at: int | str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate members."""
+        if self.endian is not None and (len(self.endian) != 1 or self.endian not in ENDIAN_PREFIXES):
+            raise TemplateError(f"Invalid byte order for struct {self.name!r} - {self.endian!r}")
+        names = [member.name for member in self.members]
+        if len(names) != len(set(names)):
+            raise TemplateError(f"Duplicate member names in struct {self.name!r}")
+
+    @property
+    def static_size(self) -> int | None:
+        """Return the number of bytes occupied by the struct, or None if it depends on data."""
+        size = 0
+        for member in self.members:
+            if member.at is not None:
+                return None
+            member_size = member.static_size
+            if member_size is None:
+                return None
+            size += member_size
+        return size
+
+
+@dataclass(frozen=True)
+class Array:
+    """A repeated field or struct.
+
+    Params
+    ------
+    name - Array name.
+    element - Repeated field or struct. Must have a static size.
+    count - Number of elements, or the name of an earlier integer field holding it.
+    at - Offset of the array relative to the template start, or the name of an earlier
+    integer field holding it. Follows the previous member if None.
+    """
+
+    name: str
+    element: Field | Struct
+    count: int | str
+    at: int | str | None = None
+
+    def __post_init__(self) -> None:
+        """Validate element."""
+        if self.element.static_size is None:
+            raise TemplateError(f"Elements of array {self.name!r} must have a static size")
+        if isinstance(self.count, int) and self.count < 0:
+            raise TemplateError(f"Invalid count for array {self.name!r} - {self.count}")
+
+    @property
+    def static_size(self) -> int | None:
+        """Return the number of bytes occupied by the array, or None if it depends on data."""
+        if isinstance(self.count, str):
+            return None
+        return self.count * (self.element.static_size or 0)
+
+
+Member = Union[Field, Struct, Array]
+
+
+@dataclass(frozen=True)
+class Template:
+    """A named structure definition overlaid on data.
+
+    Params
+    ------
+    name - Template name.
+    root - Struct located at the start of the data.
+    magic - Leading bytes identifying data the template applies to. Never detected if empty.
+    description - Short description shown with the template.
+    """
+
+    name: str
+    root: Struct
+    magic: bytes = b""
+    description: str = ""
+
+    @property
+    def endian(self) -> str:
+        """Return the byte order of the root struct."""
+        return self.root.endian or "<"
+
+    @classmethod
+    def from_dict(cls, name: str, spec: Mapping[str, Any], definitions: Mapping[str, Mapping[str, Any]]) -> Template:
+        """Create a template from a config definition.
+
+        Members are tables with a name and either a `format`, or a `struct` naming another
+        definition. Members with a `count` are arrays. Members may specify an `at` offset.
+        """
+        magic = spec.get("magic", "")
+        return cls(
+            name,
+            _struct_from_dict(name, spec, definitions, ()),
+            bytes.fromhex(magic) if magic else b"",
+            spec.get("description", ""),
+        )
+
+
+def _struct_from_dict(
+    name: str, spec: Mapping[str, Any], definitions: Mapping[str, Mapping[str, Any]], parents: tuple[str, ...]
+) -> Struct:
+    """Create a struct from a config definition, resolving referenced definitions."""
+    if name in parents:
+        raise TemplateError(f"Recursive struct definition - {' > '.join([*parents, name])}")
+    members: list[Member] = []
+    for member_spec in spec.get("fields", []):
+        member_name = member_spec.get("name")
+        if not member_name:
+            raise TemplateError(f"Unnamed member in {name!r}")
+        at = member_spec.get("at")
+        element: Field | Struct
+        if "format" in member_spec:
+            element = Field(member_name, member_spec["format"])
+        elif "struct" in member_spec:
+            struct_name = member_spec["struct"]
+            if struct_name not in definitions:
+                raise TemplateError(f"Unknown struct {struct_name!r} in {name!r}")
+            element = _struct_from_dict(struct_name, definitions[struct_name], definitions, (*parents, name))
+            element = Struct(member_name, element.members, element.endian)
+        else:
+            raise TemplateError(f"Member {member_name!r} of {name!r} requires a format or struct")
+        if "count" in member_spec:
+            members.append(Array(member_name, element, member_spec["count"], at))
+        elif isinstance(element, Field):
+            members.append(Field(member_name, element.fmt, at))
+        else:
+            members.append(Struct(member_name, element.members, element.endian, at))
+    return Struct(name, tuple(members), spec.get("endian"))
@@ -0,0 +1,146 @@
+"""Action Tracing Module.
+
+Records the command, target, duration, bytes touched and undo history memory of every
+action performed by an action handler. Records are kept in a ring buffer that can be
+exported as JSON lines and replayed against a file to benchmark command latency.
+"""
+from __future__ import annotations
+
+import json
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from threading import Lock
+from time import time
+
+DEFAULT_CAPACITY = 10_000
+
+
+@dataclass
+class TraceRecord:  # pylint: disable=too-many-instance-attributes
+    """A single traced action.
+
+    Params
+    ------
+    cmd - Command of the action.
+    argv - Command arguments.
+    target - Target type of the action, such as api or app.
+    operation - One of do, undo or redo.
+    duration - Time taken to perform the operation in seconds.
+    bytes_touched - Number of bytes read, scanned or modified by the operation.
+    undo_memory - Estimated memory held by the undo and redo history after the operation in bytes.
+    source - Name of the file the action was applied to, if any.
+    timestamp - Time the operation completed as seconds since the epoch.
+    error - Description of the failure, or None if the operation succeeded.
+    """
+
+    cmd: str
+    argv: tuple[str, ...] = ()
+    target: str = ""
+    operation: str = "do"
+    duration: float = 0.0
+    bytes_touched: int = 0
+    undo_memory: int = 0
+    source: str = ""
+    timestamp: float = field(default_factory=time)
+    error: str | None = None
+
+    @property
+    def command(self) -> str:
+        """Return the command string that performs the action."""
+        return " ".join([self.cmd, *self.argv])
+
+    @classmethod
+    def from_dict(cls, values: dict) -> TraceRecord:
+        """Create a record from exported values."""
+        return cls(**{**values, "argv": tuple(values.get("argv", ()))})
+
+
+class ActionTracer:
+    """Action Tracer Class.
+
+    Keeps the most recent trace records in a ring buffer. Tracing is disabled by default.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False) -> None:
+        """Initialize tracer."""
+        self.enabled = enabled
+        self._lock = Lock()
+        self.records: deque[TraceRecord] = deque(maxlen=capacity)
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        """Iterate over a snapshot of the records, oldest first."""
+        with self._lock:
+            return iter(list(self.records))
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self.records)
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of kept records."""
+        return self.records.maxlen or 0
+
+    def clear(self) -> None:
+        """Discard all records."""
+        with self._lock:
+            self.records.clear()
+
+    def export(self, filepath: Path) -> None:
+        """Write all records to a JSON lines file."""
+        with filepath.open("w", encoding="utf8") as trace_file:
+            for record in self:
+                trace_file.write(json.dumps(asdict(record)) + "\n")
+
+    def record(self, record: TraceRecord) -> None:
+        """Add a record, discarding the oldest record if the buffer is full."""
+        with self._lock:
+            self.records.append(record)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Return the count, total and max duration and bytes touched of each command."""
+        summary: dict[str, dict[str, float]] = {}
+        for record in self:
+            name = record.cmd if record.operation == "do" else f"{record.cmd}.{record.operation}"
+            stats = summary.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "bytes_touched": 0})
+            stats["count"] += 1
+            stats["total"] += record.duration
+            stats["max"] = max(stats["max"], record.duration)
+            stats["bytes_touched"] += record.bytes_touched
+        return summary
+
+
+tracer = ActionTracer()
+
+
+def load_trace(filepath: Path) -> list[TraceRecord]:
+    """Return the records of an exported trace."""
+    with filepath.open(encoding="utf8") as trace_file:
+        return [TraceRecord.from_dict(json.loads(line)) for line in trace_file if line.strip()]
+
+
+def replay(records: Iterable[TraceRecord], filepath: Path) -> ActionTracer:
+    """Perform the traced api commands on a file and return a tracer holding the new records.
+
+    Undo and redo records are skipped since they are replayed by the undo and redo commands.
+    Actions that fail are recorded with an error. Data is not saved unless the trace contains a
+    save command.
+    """
+    # pylint: disable=import-outside-toplevel
+    from .actions import ActionError
+    from .api import DataAPI
+    from .commands import CommandParser, InvalidCommandError
+
+    records = [record for record in records if record.operation == "do" and record.target == "api"]
+    replay_tracer = ActionTracer(capacity=max(DEFAULT_CAPACITY, 2 * len(records)), enabled=True)
+    api = DataAPI(filepath)
+    api.action_handler.tracer = replay_tracer
+    parser = CommandParser()
+    for record in records:
+        try:
+            api.do(parser.parse_one(record.command))
+        except (ActionError, InvalidCommandError, ValueError):
+            continue
+    return replay_tracer
@@ -1,4 +1,13 @@
 """Utility functions package."""
+from importlib import import_module
+from typing import Any
+
+
+def import_object(path: str) -> Any:
+    """Import and return an object from a `package.module:name` path."""
+    module_name, _, name = path.partition(":")
+    module = import_module(module_name)
+    return getattr(module, name) if name else module
 
 
 def map_range(val, range_a, range_b):
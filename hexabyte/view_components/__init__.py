@@ -1,5 +1,25 @@
-"""Rich-compatible Components Package."""
-from .byte_view import ByteView
-from .hc_view import HCView
+"""Rich-compatible Components Package.
 
-__all__ = ["ByteView", "HCView"]
+Components are only imported when first accessed.
+"""
+from typing import Any
+
+from ..utils import import_object
+
+_LAZY_ATTRS = {
+    "ByteView": f"{__name__}.byte_view:ByteView",
+    "HCView": f"{__name__}.hc_view:HCView",
+    "Layout": f"{__name__}.layout:Layout",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import components on first access."""
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = import_object(_LAZY_ATTRS[name])
+    globals()[name] = value
+    return value
+
+
+__all__ = ["ByteView", "HCView", "Layout"]
@@ -1,6 +1,5 @@
 """ByteView Component Module."""
-from collections.abc import Iterable
-from math import ceil
+from collections.abc import Callable, Iterable
 from string import printable
 from typing import Union
 
@@ -18,16 +17,19 @@ from ..constants import DisplayMode
 from ..constants.sizes import BYTE_BITS, NIBBLE_BITS
 from ..cursor import Cursor
 from ..data_types import DataSegment
-
-NUMBERS_COLUMN_DEFAULT_PADDING = 3
+from .layout import BYTE_REPR_LEN, Layout
 
 
 class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
     """Construct a ByteView object to render byte data in various formats.
 
+    Data is not held by the view. Lines are read on demand and the layout is only recomputed
+    when the data size or a layout setting changes.
+
     Args:
     ----
-        data (bytes): data.
+        reader (Callable): Returns `length` bytes located at `offset` of the data.
+        length (Callable): Returns the data size.
         column_count (int, optional): Number of columns per row. Defaults to 4
         column_size (int, optional): Number of bytes per column. Defaults to 4
         offsets (bool, optional): Show line offsets. Defaults to False.
@@ -40,7 +42,7 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
         highlighter (Highlighter, optional): Text highlighter.
     """
 
-    BYTE_REPR_LEN = {DisplayMode.HEX: 2, DisplayMode.BIN: 8, DisplayMode.UTF8: 1}
+    BYTE_REPR_LEN = BYTE_REPR_LEN
 
     VALID_CHARS = {
         DisplayMode.HEX: "0123456789abcdef",
@@ -50,7 +52,8 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
 
     def __init__(
         self,
-        data: Union[bytes, bytearray],
+        reader: Callable[[int, int], Union[bytes, bytearray]],
+        length: Callable[[], int],
         *,
         view_mode: DisplayMode = DisplayMode.HEX,
         column_count: int = 4,
@@ -65,7 +68,10 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
         highlighter: Union[Highlighter, None] = None,
     ) -> None:
         """Initialize ByteView Component."""
-        self.data = data
+        self.reader = reader
+        self.length = length
+        self._layout_key: tuple = ()
+        self._layout = Layout(0)
         self.view_mode = view_mode
         self.column_count = column_count
         self.column_size = column_size
@@ -80,10 +86,43 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
         self.highlighter = highlighter
         self.highlights: list[DataSegment] = []
 
+    @classmethod
+    def from_data(cls, data: Union[bytes, bytearray], **kwargs) -> "ByteView":
+        """Create a byte view of in-memory data."""
+        return cls(lambda offset, length: data[offset : offset + length], data.__len__, **kwargs)
+
+    @property
+    def layout(self) -> Layout:
+        """Return the layout of the view, recomputed only if the data size or a layout setting changed."""
+        key = (
+            self.length(),
+            self.view_mode,
+            self.column_count,
+            self.column_size,
+            self.offsets,
+            self.hex_offsets,
+            self.start_offset,
+            self.padding,
+        )
+        if key != self._layout_key:
+            _, right, _, left = Padding.unpack(self.padding)
+            self._layout = Layout(
+                key[0],
+                self.view_mode,
+                self.column_count,
+                self.column_size,
+                self.offsets,
+                self.hex_offsets,
+                self.start_offset,
+                left + right,
+            )
+            self._layout_key = key
+        return self._layout
+
     @property
     def line_bit_length(self) -> int:
         """Get bits per line based on column settings."""
-        return self.line_byte_length * BYTE_BITS
+        return self.column_count * self.column_size * BYTE_BITS
 
     @property
     def line_byte_length(self) -> int:
@@ -93,30 +132,22 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
     @property
     def line_count(self) -> int:
         """Get the number of lines based on data size and column settings."""
-        return ceil(len(self.data) / (self.line_byte_length))
+        return self.layout.line_count
 
     @property
     def data_width(self) -> int:
         """Get the character width of the data column."""
-        return (self.BYTE_REPR_LEN[self.view_mode] * self.column_size + 1) * self.column_count
+        return self.layout.data_width
 
     @property
     def offsets_column_width(self) -> int:
         """Get the number of characters used to render the offsets column."""
-        if self.offsets:
-            max_val = self.start_offset + (self.line_count * self.line_byte_length)
-            if self.hex_offsets:
-                num_str = hex(max_val)
-            else:
-                num_str = str(max_val)
-            return len(num_str) + NUMBERS_COLUMN_DEFAULT_PADDING
-        return 0
+        return self.layout.offsets_column_width
 
     @property
     def height(self) -> int:
         """Return calculated height in lines."""
-        _height = len(self.data) // self.line_byte_length + 1
-        return _height
+        return self.layout.height
 
     @property
     def text_style(self) -> Style:
@@ -133,12 +164,7 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
     @property
     def width(self) -> int:
         """Return calculated width in columns."""
-        _, right, _, left = Padding.unpack(self.padding)
-        padding = left + right
-        _width = self.offsets_column_width + padding + self.data_width
-        if self.offsets:
-            _width += 1
-        return _width
+        return self.layout.width
 
     @property
     def size(self) -> Size:
@@ -170,14 +196,31 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
     ) -> Iterable[Segment]:
         """Generate a single view line."""
         if self.offsets:
-            offset_txt = hex(offset) if self.hex_offsets else str(offset)
-            offset_column = str(offset_txt).rjust(self.offsets_column_width - 2) + " | "
-            yield Segment(offset_column, style=self.offset_style)
+            yield self._offset_segment(offset)
         text = self.generate_text(offset, data, highlights)
         if self.highlighter is not None:
             text = self.highlighter(text)
         yield from text.render(_console, end=end)
 
+    def generate_placeholder_line(
+        self, _console: Console, offset: int, length: int, end: str = ""
+    ) -> Iterable[Segment]:
+        """Generate a view line of `?` placeholders for length bytes that are not loaded yet."""
+        if self.offsets:
+            yield self._offset_segment(offset)
+        placeholder = "?" * self.BYTE_REPR_LEN[self.view_mode]
+        text = Text(style=self.text_style)
+        for col_start in range(0, length, self.column_size):
+            text.append(placeholder * min(self.column_size, length - col_start), "dim")
+            if self.line_byte_length != self.column_size:
+                text.append(" ")
+        yield from text.render(_console, end=end)
+
+    def _offset_segment(self, offset: int) -> Segment:
+        """Return the offsets column segment of a line."""
+        offset_txt = hex(offset) if self.hex_offsets else str(offset)
+        return Segment(offset_txt.rjust(self.layout.offsets_column_width - 2) + " | ", style=self.offset_style)
+
     def generate_text(self, offset: int, data: bytes, highlights: list[DataSegment]) -> Text:
         """Generate a text line from data."""
         text = Text()
@@ -288,12 +331,12 @@ class ByteView(JupyterMixin):  # pylint: disable=too-many-instance-attributes
     ) -> Iterable[Segment]:
         """Get Segments for the ByteView object."""
         offset = self.start_offset
-        for start in range(0, len(self.data), self.line_byte_length):
-            line_data = self.data[start : start + self.line_byte_length]
+        for start in range(0, self.length(), self.line_byte_length):
+            line_data = self.reader(start, self.line_byte_length)
             if self.offsets:
                 yield from self.generate_line(_console, offset, line_data, [], end="\n")
             else:
-                yield from self.generate_text(offset, line_data, []).render(console, end="\n")
+                yield from self.generate_text(offset, line_data, []).render(_console, end="\n")
             offset += self.line_byte_length
 
 
@@ -381,8 +424,8 @@ if __name__ == "__main__":  # pragma: no cover
     else:
         byte_data = FILLER_DATA  # pylint: disable=invalid-name
     mode = DisplayMode(args.mode_str.lower())
-    view = ByteView(
-        data=byte_data,
+    view = ByteView.from_data(
+        byte_data,
         view_mode=mode,
         offsets=args.offsets,
         start_offset=args.start_offset,
@@ -3,9 +3,11 @@
 Maps data onto a modified hilbert curve. Colorized using the `color_map_func`.
 """
 from collections.abc import Callable, Iterable
+from functools import cache
 from random import random
 from typing import Union
 
+import numpy as np
 from hilbertcurve.hilbertcurve import HilbertCurve
 from rich.color import Color as RichColor
 from rich.console import Console, ConsoleOptions
@@ -14,7 +16,6 @@ from rich.measure import Measurement
 from rich.padding import Padding, PaddingDimensions
 from rich.segment import Segment, Segments
 from rich.style import Style
-from rich.text import Text
 from textual.color import Color
 from textual.geometry import Size
 
@@ -23,6 +24,7 @@ from ..utils import map_range
 
 HC_DIMENSIONS = 2
 HC_ITERATIONS = 5
+PALETTE_SIZE = 256
 
 
 class HCView(JupyterMixin):
@@ -32,7 +34,7 @@ class HCView(JupyterMixin):
 
     Args:
     ----
-        data (bytes): data.
+        data (bytes): data. Values are expected in the range 0 to 1.
     """
 
     def __init__(
@@ -45,16 +47,17 @@ class HCView(JupyterMixin):
         color_map_func: Union[Callable[..., RichColor], None] = None,
     ) -> None:
         """Initialize ByteView Component."""
-        self.data = data
+        self.data = np.asarray(data, dtype=np.float64)
         self.hc_iterations = hc_iterations
         self.cursor = cursor
         self.cursor_visible = False
         self.padding = padding
-        self.curve = HilbertCurve(self.hc_iterations, HC_DIMENSIONS, 0)
+        self.index_table = hilbert_index_table(self.hc_iterations)
         if color_map_func is not None:
             self.map_color: Callable[..., RichColor] = color_map_func
         else:
             self.map_color = percent_to_red
+        self.palette = style_palette(self.map_color)
 
     @property
     def block_size(self) -> int:
@@ -114,21 +117,46 @@ class HCView(JupyterMixin):
             yield from self.generate_line(y, _console, end="\n")
 
     def generate_line(self, y: int, _console: Console, end: str = "") -> Iterable[Segment]:
-        """Generate a single view line."""
-        line = Text("")
-        for x in range(self.width):
-            val = self._get_data(x, y)
-            line.append(" ", Style(bgcolor=self.map_color(val)))
-        yield from line.render(_console, end=end)
+        """Generate a single view line.
+
+        Adjacent cells sharing a palette entry are emitted as a single segment.
+        """
+        indexes = y // self.width * self.block_size + self.index_table[y % self.width]
+        values = np.zeros(self.width, dtype=np.float64)
+        in_range = indexes < len(self.data)
+        values[in_range] = self.data[indexes[in_range]]
+        colors = np.rint(np.clip(np.nan_to_num(values), 0, 1) * (PALETTE_SIZE - 1)).astype(np.intp)
+        run_starts = np.flatnonzero(np.diff(colors, prepend=-1))
+        run_ends = np.append(run_starts[1:], self.width)
+        for start, stop in zip(run_starts.tolist(), run_ends.tolist()):
+            yield Segment(" " * (stop - start), self.palette[colors[start]])
+        if end:
+            yield Segment(end)
 
     def coord2idx(self, x: int, y: int) -> int:
         """Calculate data index from coordinate pair."""
         idx_major = y // self.width * self.block_size
-        adjusted_y = y % self.width
-        idx_minor = self.curve.distance_from_point([adjusted_y, x])
+        idx_minor = int(self.index_table[y % self.width, x])
         return idx_major + idx_minor
 
 
+@cache
+def hilbert_index_table(hc_iterations: int) -> np.ndarray:
+    """Return a read-only table mapping each (y, x) cell of a curve to its distance along the curve."""
+    width = 2**hc_iterations
+    curve = HilbertCurve(hc_iterations, HC_DIMENSIONS, 0)
+    points = [[y, x] for y in range(width) for x in range(width)]
+    table = np.array(curve.distances_from_points(points), dtype=np.intp).reshape(width, width)
+    table.flags.writeable = False
+    return table
+
+
+@cache
+def style_palette(color_map_func: Callable[..., RichColor]) -> tuple[Style, ...]:
+    """Return background styles for evenly spaced values between 0 and 1."""
+    return tuple(Style(bgcolor=color_map_func(idx / (PALETTE_SIZE - 1))) for idx in range(PALETTE_SIZE))
+
+
 def percent_to_red(val: float) -> RichColor:
     """Map a 0 to 1 float value to the red color range."""
     return Color(int(map_range(val, (0, 1), (0, 255))), 0, 0).rich_color
@@ -179,7 +207,7 @@ if __name__ == "__main__":  # pragma: no cover
         padding=args.padding,
     )
     console.print(f"{curve_view.hc_iterations=}")
-    console.print(f"{curve_view.curve.n=}")
+    console.print(f"{curve_view.width=}")
     console.print(f"{curve_view.block_size=}")
     console.print(f"{curve_view.size=}")
     console.print(curve_view)
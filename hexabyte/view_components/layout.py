@@ -0,0 +1,92 @@
+"""Byte View Layout Module."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from math import ceil
+
+from ..constants import DisplayMode
+from ..constants.sizes import BYTE_BITS
+
+BYTE_REPR_LEN = {DisplayMode.HEX: 2, DisplayMode.BIN: 8, DisplayMode.UTF8: 1}
+NUMBERS_COLUMN_DEFAULT_PADDING = 3
+
+
+@dataclass(frozen=True)
+class Layout:  # pylint: disable=too-many-instance-attributes
+    """Line and column metrics of a byte view.
+
+    Metrics are computed once when the layout is created. A new layout is only required when
+    one of the parameters changes.
+
+    Params
+    ------
+    data_length - Number of bytes of the viewed data.
+    view_mode - Display mode of the data column.
+    column_count - Number of columns per line.
+    column_size - Number of bytes per column.
+    offsets - Show line offsets.
+    hex_offsets - Use hexadecimal line offsets.
+    start_offset - Starting number for line offsets.
+    padding_width - Number of padding characters to the left and right of the view.
+    """
+
+    data_length: int
+    view_mode: DisplayMode = DisplayMode.HEX
+    column_count: int = 4
+    column_size: int = 4
+    offsets: bool = False
+    hex_offsets: bool = True
+    start_offset: int = 0
+    padding_width: int = 0
+    line_byte_length: int = field(init=False)
+    line_bit_length: int = field(init=False)
+    line_count: int = field(init=False)
+    height: int = field(init=False)
+    char_width: int = field(init=False)
+    char_bits: int = field(init=False)
+    column_width: int = field(init=False)
+    data_width: int = field(init=False)
+    offsets_column_width: int = field(init=False)
+    data_x: int = field(init=False)
+    width: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Compute metrics."""
+        set_metric = object.__setattr__
+        line_byte_length = self.column_count * self.column_size
+        line_count = ceil(self.data_length / line_byte_length)
+        char_width = BYTE_REPR_LEN[self.view_mode]
+        column_width = char_width * self.column_size + 1
+        offsets_column_width = 0
+        if self.offsets:
+            max_val = self.start_offset + line_count * line_byte_length
+            num_str = hex(max_val) if self.hex_offsets else str(max_val)
+            offsets_column_width = len(num_str) + NUMBERS_COLUMN_DEFAULT_PADDING
+        data_x = offsets_column_width + 1 if self.offsets else 0
+        set_metric(self, "line_byte_length", line_byte_length)
+        set_metric(self, "line_bit_length", line_byte_length * BYTE_BITS)
+        set_metric(self, "line_count", line_count)
+        set_metric(self, "height", self.data_length // line_byte_length + 1)
+        set_metric(self, "char_width", char_width)
+        set_metric(self, "char_bits", BYTE_BITS // char_width)
+        set_metric(self, "column_width", column_width)
+        set_metric(self, "data_width", column_width * self.column_count)
+        set_metric(self, "offsets_column_width", offsets_column_width)
+        set_metric(self, "data_x", data_x)
+        set_metric(self, "width", data_x + self.padding_width + column_width * self.column_count)
+
+    def bit_at(self, x: int, y: int) -> int | None:
+        """Return the bit offset rendered at content coordinates, or None if outside the data column.
+
+        Clicks on column separators select the last character of the column.
+        """
+        data_x = x - self.data_x
+        if data_x < 0 or y < 0:
+            return None
+        column = min(data_x // self.column_width, self.column_count - 1)
+        char = min(data_x - column * self.column_width, self.column_width - 2)
+        return y * self.line_bit_length + (column * self.column_size * self.char_width + char) * self.char_bits
+
+    def line_of(self, bit_offset: int) -> int:
+        """Return the line containing the bit offset."""
+        return bit_offset // self.line_bit_length
@@ -0,0 +1,100 @@
+"""Sidebar Analysis Panel."""
+from time import monotonic
+from typing import Union
+
+import numpy as np
+from textual.app import ComposeResult
+from textual.widgets import Static
+
+from ..analysis import EntropyAnalyzer
+from ..analysis.entropy import MAX_ENTROPY
+from ..data_sources import DataSnapshot
+from ..view_components import HCView
+from ..widgets.info_panel import InfoItem
+from ..widgets.sidebar_panel import SidebarVerticalPanel
+
+HIGH_ENTROPY = 0.9
+REFRESH_INTERVAL = 0.25
+TOP_BYTE_COUNT = 4
+
+
+class AnalysisPanel(SidebarVerticalPanel):
+    """Display an entropy map and byte statistics for the selected editor.
+
+    Analysis runs in a worker thread and the map fills in as blocks are analyzed.
+    """
+
+    DEFAULT_CSS = """
+    AnalysisPanel {
+
+    }
+    AnalysisPanel #analysis-map {
+        width: auto;
+        padding: 1 2;
+    }
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize AnalysisPanel."""
+        super().__init__(*args, **kwargs)
+        self._analyzer: Union[EntropyAnalyzer, None] = None
+
+    def compose(self) -> ComposeResult:
+        """Compose child widgets."""
+        yield InfoItem(name="status")
+        yield InfoItem(name="entropy")
+        yield InfoItem(name="blocks")
+        yield InfoItem(name="common")
+        yield Static(id="analysis-map")
+
+    def _analyze(self, analyzer: EntropyAnalyzer, snapshot: DataSnapshot) -> None:
+        """Analyze pending blocks. Runs in a worker thread."""
+        last_refresh = monotonic()
+        for _ in analyzer.analyze(snapshot):
+            if monotonic() - last_refresh >= REFRESH_INTERVAL:
+                self.app.call_from_thread(self.update_view, analyzer)
+                last_refresh = monotonic()
+        if not analyzer.cancelled:
+            self.app.call_from_thread(self.update_view, analyzer)
+
+    def start_analysis(self) -> None:
+        """Analyze the selected editor data in the background."""
+        if self._analyzer is not None:
+            self._analyzer.cancel()
+        if self.editor is None:
+            self._analyzer = None
+            return
+        analyzer = self.editor.api.entropy
+        self._analyzer = analyzer
+        self.update_view(analyzer)
+        if not analyzer.complete:
+            snapshot = self.editor.api.snapshot()
+            self.run_worker(lambda: self._analyze(analyzer, snapshot), thread=True, group="analysis")
+
+    def update_data(self) -> None:
+        """React to modified editor data."""
+        self.start_analysis()
+
+    def update_view(self, analyzer: EntropyAnalyzer) -> None:
+        """Render analysis results."""
+        if analyzer is not self._analyzer:
+            return
+        status = "complete" if analyzer.complete else f"analyzing {analyzer.progress:.0%}"
+        self.query_one("#status-value", Static).update(status)
+        self.query_one("#entropy-value", Static).update(f"{analyzer.total_entropy() * MAX_ENTROPY:.3f} bits per byte")
+        entropy = np.nan_to_num(analyzer.entropy, nan=0.0)
+        high_blocks = int(np.count_nonzero(entropy > HIGH_ENTROPY))
+        self.query_one("#blocks-value", Static).update(
+            f"{analyzer.block_count:,} blocks of {analyzer.block_size:,} bytes\n{high_blocks:,} high entropy"
+        )
+        histogram = analyzer.histogram
+        common = np.argsort(histogram, kind="stable")[::-1][:TOP_BYTE_COUNT]
+        total = int(histogram.sum()) or 1
+        self.query_one("#common-value", Static).update(
+            "\n".join(f"0x{value:02x} {int(histogram[value]) / total:.1%}" for value in common if histogram[value])
+        )
+        self.query_one("#analysis-map", Static).update(HCView(entropy))
+
+    def watch_editor(self) -> None:
+        """React to changed editor."""
+        self.start_analysis()
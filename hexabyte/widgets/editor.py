@@ -15,7 +15,10 @@ from ..commands import Command
 from ..constants import DisplayMode
 from ..constants.sizes import BIT, BYTE_BITS, NIBBLE_BITS
 from ..context import context
-from ..view_components import ByteView
+from ..data_sources import DataChange
+from ..profiling import profiled, profiler
+from ..view_components import ByteView, Layout
+from .refresh_scheduler import DEFAULT_FPS, RefreshScheduler
 
 CURSOR_INCREMENTS = {
     DisplayMode.HEX: NIBBLE_BITS,
@@ -44,6 +47,8 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
         Binding("ctrl+s", "save", "Save File", show=True),
         Binding("ctrl+z", "undo", "Undo Action", show=False),
         Binding("ctrl+y", "redo", "Redo Action", show=False),
+        Binding("ctrl+left", "back", "Jump Back", show=False),
+        Binding("ctrl+right", "forward", "Jump Forward", show=False),
     ]
     """
     | Key(s) | Description |
@@ -62,7 +67,9 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
     | ctrl+o | Offset Style. |
     | ctrl+s | Save file. |
     | ctrl+z | Undo. |
-    | ctrl+y | Redo. |.
+    | ctrl+y | Redo. |
+    | ctrl+left | Return to the previous jump position. |
+    | ctrl+right | Return to the next jump position. |.
     """
 
     COMPONENT_CLASSES: ClassVar[set[str]] = {"text"}
@@ -91,9 +98,9 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
     highlighter: reactive[Union[Highlighter, None]] = reactive(None)
     show_offsets: reactive[bool] = reactive(True, init=False)
     hex_offsets: reactive[bool] = reactive(True, init=False)
-    cursor: reactive[int] = reactive(0)  # Cursor bit position
+    cursor: reactive[int] = reactive(0, repaint=False)  # Cursor bit position
     cursor_blink: reactive[bool] = reactive(True)
-    _cursor_visible: reactive[bool] = reactive(True)
+    _cursor_visible: reactive[bool] = reactive(True, repaint=False)
 
     class Changed(Message):  # pylint: disable=too-few-public-methods
         """Posted when data changes.
@@ -113,6 +120,39 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
             self.editor = sender
             super().__init__()
 
+    class Fetched(Message):  # pylint: disable=too-few-public-methods
+        """Posted when data rendered as placeholders was fetched in the background.
+
+        Attributes
+        ----------
+        start: Start offset of the fetched data.
+        end: End offset of the fetched data.
+        """
+
+        def __init__(self, start: int, end: int) -> None:
+            """Initialize Fetched message."""
+            self.start = start
+            self.end = end
+            super().__init__()
+
+    class Moved(Message):  # pylint: disable=too-few-public-methods
+        """Posted when the editor cursor or scroll position changes.
+
+        Can be handled using `on_editor_moved` in a subclass of `Editor` or in a parent
+        widget in the DOM.
+
+        Attributes
+        ----------
+        editor: The `Editor` widget that was moved.
+        """
+
+        bubble = True
+
+        def __init__(self, editor: "Editor") -> None:
+            """Initialize Moved message."""
+            self.editor = editor
+            super().__init__()
+
     class Selected(Message):  # pylint: disable=too-few-public-methods
         """Posted when an editor is selected.
 
@@ -153,7 +193,9 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
         disabled: Whether the editor is disabled or not.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._pending_cursor: Union[int, None] = None
         self.api = api
+        self._change_count = api.change_count
         self.cursor = self.api.cursor.bit = start_offset
         mode_config = context.config.settings.get(context.file_mode.value, {})
         if id == "primary":
@@ -172,7 +214,8 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
             continue
         self.cursor_increment = CURSOR_INCREMENTS[self.display_mode]
         self.view = ByteView(
-            data=self.api.read_at(0),
+            self.api.viewport.read,
+            self.api.__len__,
             view_mode=self.display_mode,
             column_count=column_count,
             column_size=column_size,
@@ -180,23 +223,67 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
             hex_offsets=self.hex_offsets,
         )
         self.virtual_size = self.view.size
+        self._offsets_column_width = self.view.layout.offsets_column_width
+        general_config = context.config.settings.get("general", {})
+        self.refresh_scheduler = RefreshScheduler(self, general_config.get("target-fps", DEFAULT_FPS))
 
     @property
     def _cursor_at_end(self) -> bool:
         """Flag to indicate if the cursor is at the end."""
         return self.cursor > self.api.cursor.max_bytes
 
+    @property
+    def _target_cursor(self) -> int:
+        """Return the cursor position including moves that were not applied yet."""
+        return self.cursor if self._pending_cursor is None else self._pending_cursor
+
     @property
     def _cursor_y(self) -> int:
         """Return the y position of cursor."""
-        return self.cursor // self.view.line_bit_length
+        return self.layout.line_of(self.cursor)
+
+    @property
+    def layout(self) -> Layout:
+        """Return the layout shared by rendering, hit testing and cursor movement."""
+        return self.view.layout
+
+    @property
+    def top_offset(self) -> int:
+        """Return the byte offset of the first visible line."""
+        return self.refresh_scheduler.scroll_y * self.layout.line_byte_length
+
+    def _data_changed(self, change: DataChange) -> None:
+        """Resize the scrollable area and repaint the lines affected by a data modification."""
+        if change.resized:
+            self.update_size()
+        self.refresh_changes()
+
+    def _fetched(self, start: int, stop: int) -> None:
+        """Post a message that a window was fetched. Called from a fetch thread."""
+        self.post_message(self.Fetched(start, stop))
+
+    def _reserve_viewport(self) -> None:
+        """Reserve the number of bytes displayed by the editor in the shared viewport cache."""
+        self.api.viewport.reserve(id(self), (self.size.height + 1) * self.layout.line_byte_length)
+
+    def _apply_cursor_move(self) -> None:
+        """Apply the coalesced cursor move."""
+        if self._pending_cursor is None:
+            return
+        self.api.cursor.bit = self._pending_cursor
+        self._pending_cursor = None
+        self.cursor = self.api.cursor.bit
 
     def goto(self, new_offset: int) -> None:
-        """Generate a goto command to track cursor movement.
+        """Move the cursor without parsing a command.
 
+        Moves requested before the next screen refresh are coalesced into a single cursor
+        update. Use the `goto` command to move the cursor from scripts.
         new_offset should be a bit offset, NOT a byte offset.
         """
-        self.send_cmd(f"goto bit {new_offset}")
+        if self._pending_cursor is None:
+            self.call_after_refresh(self._apply_cursor_move)
+        self._pending_cursor = self.validate_cursor(new_offset)
 
     def _toggle_cursor(self) -> None:
         """Toggle visibility of cursor."""
@@ -216,37 +303,47 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
             self.hex_offsets = True
             self.show_offsets = True
 
+    def action_back(self) -> None:
+        """Return to the previous jump position."""
+        self.send_cmd("back")
+
+    def action_forward(self) -> None:
+        """Return to the next jump position."""
+        self.send_cmd("forward")
+
     def action_cursor_down(self) -> None:
         """Move the cursor down."""
-        self.goto(self.cursor + self.view.line_bit_length)
+        self.goto(self._target_cursor + self.layout.line_bit_length)
 
     def action_cursor_up(self) -> None:
         """Move the cursor up."""
-        self.goto(self.cursor - self.view.line_bit_length)
+        self.goto(self._target_cursor - self.layout.line_bit_length)
 
     def action_cursor_left(self) -> None:
         """Move the cursor one position to the left."""
-        self.goto(self.cursor - self.cursor_increment)
+        self.goto(self._target_cursor - self.cursor_increment)
 
     def action_cursor_right(self) -> None:
         """Move the cursor one position to the right."""
-        self.goto(self.cursor + self.cursor_increment)
+        self.goto(self._target_cursor + self.cursor_increment)
 
     def action_cursor_end(self) -> None:
         """Move the cursor to the end of the input."""
-        self.goto((self.cursor // self.view.line_bit_length + 1) * self.view.line_bit_length - 1)
+        line_bit_length = self.layout.line_bit_length
+        self.goto((self._target_cursor // line_bit_length + 1) * line_bit_length - 1)
 
     def action_cursor_home(self) -> None:
         """Move the cursor to the start of the input."""
-        self.goto(self.cursor // self.view.line_bit_length * self.view.line_bit_length)
+        line_bit_length = self.layout.line_bit_length
+        self.goto(self._target_cursor // line_bit_length * line_bit_length)
 
     def action_cursor_page_up(self) -> None:
         """Move the cursor up a page."""
-        self.goto(self.cursor - self.view.line_bit_length * self.size.height)
+        self.goto(self._target_cursor - self.layout.line_bit_length * self.size.height)
 
     def action_cursor_page_down(self) -> None:
         """Move the cursor down a page."""
-        self.goto(self.cursor + self.view.line_bit_length * self.size.height)
+        self.goto(self._target_cursor + self.layout.line_bit_length * self.size.height)
 
     def action_delete_left(self) -> None:
         """Delete data to left of cursor."""
@@ -268,7 +365,7 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
 
     def action_redo(self) -> None:
         """Redo action."""
-        self.api.action_handler.redo()
+        self.send_cmd("redo")
 
     def action_save(self) -> None:
         """Save data to file."""
@@ -276,7 +373,7 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
 
     def action_undo(self) -> None:
         """Undo action."""
-        self.api.action_handler.undo()
+        self.send_cmd("undo")
 
     def insert_at_cursor(self, char: str) -> None:
         """Insert character at the cursor, move the cursor to the end of the new text.
@@ -287,6 +384,7 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
         """
         # if text not in ByteView.VALID_CHARS[self.display_mode]:
         #     raise ValueError("Invalid Character")
+        self._apply_cursor_move()
         self.api.cursor.bit = self.cursor
         current_data = self.api.read_at(self.api.cursor.byte, 1)
         current_value = current_data[0] if current_data else 0
@@ -309,16 +407,13 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
     def on_click(self, click: Click) -> None:
         """Handle click events."""
         if click.button == 1:
+            offset = click.get_content_offset(self)
+            if offset is None:
+                return
             x_offset, y_offset = self.scroll_offset
-            x = click.x + x_offset
-            y = click.y + y_offset
-            if x > self.view.offsets_column_width + 1:
-                y_portion = (y - 1) * self.view.line_bit_length
-                data_x = x - self.view.offsets_column_width - 2
-                spaces_count = data_x // (self.view.BYTE_REPR_LEN[self.display_mode] * self.view.column_size + 1)
-                adjusted_x = data_x - spaces_count
-                x_portion = adjusted_x * self.cursor_increment
-                self.goto(y_portion + x_portion)
+            bit_offset = self.layout.bit_at(offset.x + x_offset, offset.y + y_offset)
+            if bit_offset is not None:
+                self.goto(bit_offset)
 
     def on_focus(self) -> None:
         """Handle focus events."""
@@ -349,6 +444,9 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
 
     def on_mount(self) -> None:
         """Mount child widgets."""
+        self._reserve_viewport()
+        self.api.viewport.listen(id(self), self._fetched)
+        self.api.subscribe(id(self), self._data_changed)
         self.update_view_style()
         self.blink_timer = self.set_interval(  # pylint: disable=attribute-defined-outside-init
             0.5,
@@ -362,23 +460,73 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
         self.insert_at_cursor(line)
         event.stop()
 
+    def on_resize(self) -> None:
+        """Handle resize events."""
+        self._reserve_viewport()
+
+    def on_editor_fetched(self, message: Fetched) -> None:
+        """Repaint placeholder lines once their data was fetched."""
+        message.stop()
+        self._refresh_range(message.start, message.end)
+
+    def on_unmount(self) -> None:
+        """Handle unmount events."""
+        self.api.viewport.release(id(self))
+        self.api.unsubscribe(id(self))
+
+    @profiled("editor.render_line")
     def render_line(self, y: int) -> Strip:
         """Render editor content line."""
         self.view.cursor.bit = self.api.cursor.bit
         scroll_x, scroll_y = self.scroll_offset
+        line_byte_length = self.layout.line_byte_length
         y += scroll_y
-        offset = y * self.view.line_byte_length
-        line_data = self.api.read_at(offset, self.view.line_byte_length)
+        offset = y * line_byte_length
+        line_data = self.api.viewport.read_nowait(offset, line_byte_length)
+        if line_data is None:
+            length = min(line_byte_length, len(self.api) - offset)
+            line = Strip(self.view.generate_placeholder_line(self._console, offset, length))
+        else:
+            with profiler.timer("editor.highlights"):
+                highlights = [self.api.selection] if self.api.selection else []
+                highlights.extend(self.api.highlights)
+                highlights.extend(self.api.diffs_in(offset, line_byte_length))
+            with profiler.timer("view.generate_line"):
+                line = Strip(self.view.generate_line(self._console, offset, line_data, highlights))
         # Crop the strip so that is covers the visible area
-        highlights = [self.api.selection] if self.api.selection else []
-        highlights.extend(self.api.highlights)
-        strip = (
-            Strip(self.view.generate_line(self._console, offset, line_data, highlights))
-            .extend_cell_length(self.content_size.width - self.scrollbar_gutter.width)
-            .crop(scroll_x, scroll_x + self.size.width)
+        strip = line.extend_cell_length(self.content_size.width - self.scrollbar_gutter.width).crop(
+            scroll_x, scroll_x + self.size.width
         )
         return strip
 
+    def scroll_to_offset(self, offset: int) -> None:
+        """Scroll so the line containing the byte offset is the first visible line."""
+        self.refresh_scheduler.scroll_to(offset // self.layout.line_byte_length)
+
+    def refresh_changes(self) -> None:
+        """Repaint the visible lines displaying data changed since the last repaint.
+
+        The editor is fully repainted if the offsets column was resized.
+        """
+        changed = self.api.changed_since(self._change_count)
+        self._change_count = self.api.change_count
+        layout = self.layout
+        if layout.offsets_column_width != self._offsets_column_width:
+            self._offsets_column_width = layout.offsets_column_width
+            self.refresh_scheduler.refresh()
+            return
+        if changed is not None:
+            self._refresh_range(*changed)
+
+    def _refresh_range(self, start: int, stop: int) -> None:
+        """Repaint the visible lines displaying bytes from start up to stop."""
+        line_byte_length = self.layout.line_byte_length
+        top = self.refresh_scheduler.scroll_y
+        first = max(start // line_byte_length, top)
+        last = min((stop - 1) // line_byte_length, top + self.size.height - 1)
+        if first <= last:
+            self.refresh_scheduler.refresh_lines(first, last - first + 1)
+
     def send_cmd(self, cmd: str) -> None:
         """Send a command message."""
         self.post_message(Command(cmd))
@@ -388,6 +536,10 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
         self._update_styles()
         self.view.text_style = self.get_component_rich_style("text")
 
+    def update_size(self) -> None:
+        """Resize the scrollable area to the data size."""
+        self.virtual_size = self.view.size
+
     def validate_cursor(self, cursor: int) -> int:
         """Validate updated cursor position."""
         return min(max(0, cursor), len(self.api) * BYTE_BITS)
@@ -410,21 +562,40 @@ class Editor(ScrollView):  # pylint: disable=too-many-public-methods
         self.view.column_size = display_mode_config.get("column-size")
         self.view.view_mode = mode
         self.virtual_size = self.view.size
+        self._reserve_viewport()
 
     async def watch_show_offsets(self, val: bool) -> None:
         """Update show_offsets property of ByteView component."""
         self.view.offsets = val
+        self.update_size()
 
     async def watch__cursor_visible(self, val: bool) -> None:
-        """Update view cursor status."""
+        """Update view cursor status and repaint the cursor line."""
         self.view.cursor_visible = val
+        self.refresh_scheduler.refresh_lines(self._cursor_y)
 
-    async def watch_cursor(self) -> None:
-        """React to cursor changes."""
-        self.view.cursor.bit = self.cursor
-        scroll_y = self.scroll_offset.y
+    async def watch_cursor(self, old_cursor: int, new_cursor: int) -> None:
+        """React to cursor changes.
+
+        Only the lines containing the previous and new cursor are repainted unless scrolled.
+        Repaints and scrolling are applied by the refresh scheduler.
+        Moves further than a page are recorded in the navigation history.
+        """
+        self.view.cursor.bit = new_cursor
+        if abs(new_cursor - old_cursor) > self.layout.line_bit_length * max(1, self.size.height):
+            self.api.navigation.record(old_cursor, new_cursor)
+        self.refresh_scheduler.refresh_lines(self.layout.line_of(old_cursor))
+        self.refresh_scheduler.refresh_lines(self.layout.line_of(new_cursor))
+        scroll_y = self.refresh_scheduler.scroll_y
         cursor_y = self._cursor_y
         if cursor_y < scroll_y:
-            self.scroll_to(y=cursor_y, animate=False)
+            self.refresh_scheduler.scroll_to(cursor_y)
         elif cursor_y >= scroll_y + self.size.height:
-            self.scroll_to(y=cursor_y - self.size.height + 1, animate=False)
+            self.refresh_scheduler.scroll_to(cursor_y - self.size.height + 1)
+        self.post_message(self.Moved(self))
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        """React to vertical scroll changes."""
+        super().watch_scroll_y(old_value, new_value)
+        if round(old_value) != round(new_value):
+            self.post_message(self.Moved(self))
@@ -2,7 +2,6 @@
 import toml
 from textual.app import ComposeResult
 from textual.containers import Center, VerticalScroll
-from textual.widgets import Markdown
 
 from ..config import CONFIG_FILENAME, DEFAULT_CONFIG_PATH, DEFAULT_SETTINGS
 from ..constants.generic import APP_NAME
@@ -53,9 +52,13 @@ class HelpScreen(Center):  # pylint: disable=too-few-public-methods
 - `Ctrl+s` - Save changes to disk
 - `Ctrl+y` - Redo
 - `Ctrl+z` - Undo
+- `Ctrl+Left` - Return to the previous jump position
+- `Ctrl+Right` - Return to the next jump position
 
 ### Commands
 
+- **back** *[QTY]* - Return the cursor to the previous position recorded before a jump of more than a page.
+- **cancel** - Cancel running actions such as **replaceall**.
 - **clear** *[ **all** | highlights | selection ]* - Clear all data highlights and/or selection.
 - **delete** - Delete data. Optionally specify delete length and offset.
   - **delete**
@@ -69,6 +72,7 @@ Integer literals accept an optional endian parameter.
   - **find** *[ **@** | > | < | ! ]* *INTEGER*
 - **findnext** - Find the next occurrence of last search.
 - **findprev** - Find the prev occurrence of last search.
+- **forward** *[QTY]* - Return the cursor to the next position recorded in the navigation history.
 - **goto** *BYTE_OFFSET* - Jump active editor to specified byte offset.
 Accepts offset in decimal, hex, and binary.
   - **goto** *byte* *BYTE_OFFSET*
@@ -77,6 +81,11 @@ Accepts offset in decimal, hex, and binary.
 - **insert** *BYTE_OFFSET* *BYTE_VALUE* - Insert a byte value at specified offset.
 - **move** *SRC_OFFSET* *DST_OFFSET* *SRC_QTY* *[DST_QTY]* - Move SRC_QRY bytes from
 SRC_OFFSET and insert at DST_OFFSET. Overwrites DST_QTY bytes if specified.
+- **nextdiff** - Jump to the next difference between the primary and secondary editors in diff mode.
+- **prevdiff** - Jump to the previous difference between the primary and secondary editors in diff mode.
+- **profile** *[ on | off | reset | dump FILEPATH ]* - Toggle timing of rendering, reads, actions and saves.
+Timings are shown in the sidebar profile tab.
+  - **profile** *dump* *FILEPATH* - Write timing histograms to a JSON file.
 - **set** *BYTE_OFFSET* *BYTE_VALUE* - Set the byte value at specified offset.
   - **set** *byte* *BYTE_OFFSET* *BYTE_VALUE*
   - **set** *bit* *BYTE_OFFSET* *BIT_OFFSET* *BIT_VALUE*
@@ -88,6 +97,9 @@ SRC_OFFSET and insert at DST_OFFSET. Overwrites DST_QTY bytes if specified.
 Integer literals accept an optional endian parameter.
   - **replace** *( STRING | b"BYTE STRING" | INTEGER )* *( STRING | b"BYTE STRING" | INTEGER )*
   - **replace** *[ **@** | > | < | ! ]* *FIND_INTEGER* *REPLACE_INTEGER*
+- **replaceall** *FIND_LITERAL* *REPLACE_LITERAL* - Replace every occurrence of a value in data.
+Occurrences are searched in the background with progress shown in the command prompt, then replaced together.
+  - **replaceall** *[ **@** | > | < | ! ]* *FIND_INTEGER* *REPLACE_INTEGER*
 - **replacenext** - Replace the next occurrence of last find/replace.
 - **replaceprev** - Replace the prev occurrence of last find/replace.
 - **open** *( primary | secondary )* *filename* - Open a file into the specified editor.
@@ -95,6 +107,11 @@ Integer literals accept an optional endian parameter.
 - **save** - Save data changes to file.
 - **saveas** *new_filename* - Save data changes to a new file.
 - **select** *BYTE_OFFSET* *[LENGTH]* - Select a segment of data. Only one active selection allowed.
+- **template** *( NAME | none )* - Overlay a structure template on the data.
+Fields are shown in the sidebar template tab. Builtin templates are elf32, elf64 and pe.
+- **trace** *[ on | off | clear | export FILEPATH ]* - Toggle recording of each action's duration, bytes touched
+and undo memory. The most recent actions are kept.
+  - **trace** *export* *FILEPATH* - Write recorded actions to a JSON lines file for replay.
 - **unhighlight** *BYTE_OFFSET* *[LENGTH]* - Remove all highlights within specified range.
 
 ## Planned Commands
@@ -134,4 +151,12 @@ Default Settings:
 
     def compose(self) -> ComposeResult:
         """Compose help screen widgets."""
-        yield HelpWindow(Markdown(self.HELP_TEXT, id=f"{self.id}-text"), id=f"{self.id}-window")
+        yield HelpWindow(id=f"{self.id}-window")
+
+    def load_text(self) -> None:
+        """Render the help text. Parsing is deferred until help is first shown."""
+        from textual.widgets import Markdown  # pylint: disable=import-outside-toplevel
+
+        window = self.query_one(HelpWindow)
+        if not window.children:
+            window.mount(Markdown(self.HELP_TEXT, id=f"{self.id}-text"))
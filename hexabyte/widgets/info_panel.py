@@ -4,12 +4,16 @@ import stat
 from hashlib import md5, sha1
 from pathlib import Path
 from sys import platform
+from typing import Union
 
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.widgets import Label, Static
 
+from ..analysis import MerkleTree
+from ..api import DataAPI
 from ..constants.sizes import KB, MB
+from ..data_sources import DataSnapshot
 from ..widgets.sidebar_panel import SidebarVerticalPanel
 
 
@@ -51,6 +55,11 @@ class InfoPanel(SidebarVerticalPanel):
     }
     """
 
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize InfoPanel."""
+        super().__init__(*args, **kwargs)
+        self._merkle_api: Union[DataAPI, None] = None
+
     def compose(self) -> ComposeResult:
         """Compose child widgets."""
         yield InfoItem(name="filename")
@@ -62,19 +71,76 @@ class InfoPanel(SidebarVerticalPanel):
         yield InfoItem(name="permissions")
         yield InfoItem(name="md5")
         yield InfoItem(name="sha1")
+        yield InfoItem(name="buffer")
+        yield InfoItem(name="changed")
+
+    def _build_merkle(self, api: DataAPI, snapshot: DataSnapshot) -> None:
+        """Build the merkle tree of the buffer data. Runs in a worker thread."""
+        merkle = MerkleTree(snapshot.read, len(snapshot))
+        self.app.call_from_thread(self._show_merkle, api, merkle, snapshot)
+
+    def _compute_hashes(self, api: DataAPI) -> None:
+        """Hash file data. Runs in a worker thread."""
+        md5_hash = md5(usedforsecurity=False)
+        sha1_hash = sha1(usedforsecurity=False)
+        with api.filepath.open("rb") as f:
+            for chunk in iter(lambda: f.read(MB), b""):
+                md5_hash.update(chunk)
+                sha1_hash.update(chunk)
+        self.app.call_from_thread(self._show_hashes, api, md5_hash.hexdigest(), sha1_hash.hexdigest())
+
+    def _show_hashes(self, api: DataAPI, md5_digest: str, sha1_digest: str) -> None:
+        """Display file hashes computed by the worker."""
+        if self.editor is None or self.editor.api is not api:
+            return
+        self.query_one("#md5-value", Static).update(md5_digest)
+        self.query_one("#sha1-value", Static).update(sha1_digest)
+
+    def _show_merkle(self, api: DataAPI, merkle: MerkleTree, snapshot: DataSnapshot) -> None:
+        """Use the merkle tree built by the worker unless the data was modified meanwhile."""
+        if not snapshot.stale:
+            api.merkle = merkle
+        if self._merkle_api is api:
+            self._merkle_api = None
+        self.update_buffer_hash()
+
+    def update_buffer_hash(self) -> None:
+        """Update the live merkle hash of the in-memory data.
+
+        The merkle tree is built in a worker thread, then the data api keeps it up to date.
+        """
+        if self.editor is None:
+            return
+        api = self.editor.api
+        buffer_value = self.query_one("#buffer-value", Static)
+        changed_value = self.query_one("#changed-value", Static)
+        if not api.has_merkle:
+            buffer_value.update("calculating...")
+            changed_value.update("calculating...")
+            if self._merkle_api is not api:
+                self._merkle_api = api
+                snapshot = api.snapshot()
+                self.run_worker(lambda: self._build_merkle(api, snapshot), thread=True, group="merkle")
+            return
+        merkle = api.merkle
+        buffer_value.update(f"{merkle.algorithm} merkle root\n{merkle.hexdigest()}")
+        segments = merkle.modified_segments()
+        changed_bytes = sum(map(len, segments))
+        changed_value.update(f"{len(segments):,} regions ({changed_bytes:,} bytes)")
+
+    def update_data(self) -> None:
+        """React to modified editor data."""
+        self.update_buffer_hash()
 
     def update_hashes(self) -> None:
-        """Update file hashes."""
+        """Update file hashes in the background."""
         if self.editor is None:
             return
-        filepath = self.editor.api.filepath
-        with filepath.open("rb") as f:
-            md5_hash = md5(f.read(), usedforsecurity=False).hexdigest()
-            sha1_hash = sha1(f.read(), usedforsecurity=False).hexdigest()
-        md5_value = self.query_one("#md5-value", Static)
-        md5_value.update(md5_hash)
-        sha1_value = self.query_one("#sha1-value", Static)
-        sha1_value.update(sha1_hash)
+        for value_id in ("#md5-value", "#sha1-value"):
+            self.query_one(value_id, Static).update("calculating...")
+        api = self.editor.api
+        self.run_worker(lambda: self._compute_hashes(api), thread=True, exclusive=True, group="hashes")
+        self.update_buffer_hash()
 
     def update_stats(self) -> None:
         """Update file size info."""
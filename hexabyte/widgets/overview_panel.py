@@ -0,0 +1,201 @@
+"""Sidebar Overview Panel."""
+from itertools import cycle
+from time import monotonic
+from typing import Union
+
+import numpy as np
+from rich.segment import Segment
+from rich.style import Style
+from textual.events import Click, MouseScrollDown, MouseScrollUp
+from textual.reactive import reactive
+from textual.strip import Strip
+
+from ..analysis import Metric, OverviewPyramid
+from ..data_sources import DataSnapshot
+from ..view_components.hc_view import PALETTE_SIZE, percent_to_blue, percent_to_green, percent_to_red, style_palette
+from ..widgets.sidebar_panel import SidebarPanel
+
+HEADER_LINES = 1
+LEFT_BUTTON = 1
+RIGHT_BUTTON = 3
+REFRESH_INTERVAL = 0.25
+ZOOM_FACTOR = 4
+CURSOR_STYLE = Style(color="white", bold=True)
+METRIC_COLORS = {
+    Metric.ENTROPY: percent_to_red,
+    Metric.MEAN: percent_to_green,
+    Metric.ZEROS: percent_to_blue,
+}
+
+
+class OverviewPanel(SidebarPanel):
+    """Display a zoomable minimap of the selected editor data.
+
+    Each cell summarizes an equal share of the visible range using the overview pyramid.
+    Click a cell to jump to it, scroll to zoom around the cursor and right click to cycle
+    the displayed metric.
+    """
+
+    DEFAULT_CSS = """
+    OverviewPanel {
+        width: 100%;
+        height: 100%;
+    }
+    """
+
+    metric: reactive[Metric] = reactive(Metric.ENTROPY, init=False)
+    zoom: reactive[int] = reactive(0, init=False)
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize OverviewPanel."""
+        super().__init__(*args, **kwargs)
+        self._overview: Union[OverviewPyramid, None] = None
+        self._grid: Union[np.ndarray, None] = None
+        self._metrics = cycle(Metric)
+        while next(self._metrics) is not self.metric:
+            continue
+
+    @property
+    def map_size(self) -> tuple[int, int]:
+        """Return the number of map columns and rows."""
+        return self.size.width, max(0, self.size.height - HEADER_LINES)
+
+    def _analyze(self, overview: OverviewPyramid, snapshot: DataSnapshot) -> None:
+        """Build the overview pyramid. Runs in a worker thread."""
+        last_refresh = monotonic()
+        for _ in overview.analyze(snapshot):
+            if monotonic() - last_refresh >= REFRESH_INTERVAL:
+                self.app.call_from_thread(self.refresh_map)
+                last_refresh = monotonic()
+        if not overview.cancelled:
+            self.app.call_from_thread(self.refresh_map)
+
+    def _build_grid(self) -> np.ndarray:
+        """Sample the overview pyramid for every map cell and convert samples to palette indexes."""
+        columns, rows = self.map_size
+        if self.editor is None or self._overview is None:
+            return np.zeros((rows, columns), dtype=np.intp)
+        offset, length = self.view_range()
+        values = self._overview.sample(self.metric, offset, length, rows * columns)
+        return np.rint(np.clip(values, 0, 1) * (PALETTE_SIZE - 1)).astype(np.intp).reshape(rows, columns)
+
+    def _row_segments(self, row: int) -> list[Segment]:
+        """Return segments for a map row, merging adjacent cells with equal colors."""
+        palette = style_palette(METRIC_COLORS[self.metric])
+        colors = self._grid[row] if self._grid is not None else np.zeros(0, dtype=np.intp)
+        columns, _ = self.map_size
+        cursor_cell = -1
+        if self.editor is not None:
+            offset, length = self.view_range()
+            cursor_cell = int((self.editor.api.cursor.byte - offset) * self.map_size[1] * columns / max(1, length))
+            cursor_cell -= row * columns
+        run_starts = np.flatnonzero(np.diff(colors, prepend=-1))
+        run_ends = np.append(run_starts[1:], len(colors))
+        segments = []
+        for start, stop in zip(run_starts.tolist(), run_ends.tolist()):
+            style = palette[colors[start]]
+            if start <= cursor_cell < stop:
+                segments.append(Segment(" " * (cursor_cell - start), style))
+                segments.append(Segment("+", style + CURSOR_STYLE))
+                segments.append(Segment(" " * (stop - cursor_cell - 1), style))
+            else:
+                segments.append(Segment(" " * (stop - start), style))
+        return segments
+
+    def cell_offset(self, x: int, y: int) -> int:
+        """Return the data offset of the first byte summarized by a map cell."""
+        columns, rows = self.map_size
+        offset, length = self.view_range()
+        cell = (y - HEADER_LINES) * columns + x
+        return offset + int(cell * length / max(1, rows * columns))
+
+    def on_click(self, event: Click) -> None:
+        """Jump to clicked region or cycle metric."""
+        if self.editor is None:
+            return
+        if event.button == RIGHT_BUTTON:
+            self.metric = next(self._metrics)
+        elif event.button == LEFT_BUTTON and event.y >= HEADER_LINES:
+            self.editor.send_cmd(f"goto {self.cell_offset(event.x, event.y)}")
+
+    def on_mouse_scroll_down(self, event: MouseScrollDown) -> None:
+        """Zoom out."""
+        self.zoom = max(0, self.zoom - 1)
+        event.stop()
+
+    def on_mouse_scroll_up(self, event: MouseScrollUp) -> None:
+        """Zoom in around the cursor."""
+        columns, rows = self.map_size
+        if self.editor is not None and self.view_range()[1] > rows * columns:
+            self.zoom += 1
+        event.stop()
+
+    def on_resize(self) -> None:
+        """Handle resize events."""
+        self.refresh_map()
+
+    def refresh_map(self) -> None:
+        """Discard sampled map cells and redraw."""
+        self._grid = None
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        """Render a header or map line."""
+        width = self.size.width
+        if self.editor is None or self._overview is None:
+            return Strip.blank(width)
+        if y < HEADER_LINES:
+            offset, length = self.view_range()
+            status = "" if self._overview.complete else f" {self._overview.progress:.0%}"
+            header = f"{self.metric.value} x{ZOOM_FACTOR ** self.zoom} {offset:#x}-{offset + length:#x}{status}"
+            return Strip([Segment(header[:width].ljust(width), Style(bold=True))])
+        if self._grid is None:
+            self._grid = self._build_grid()
+        row = y - HEADER_LINES
+        if row >= len(self._grid):
+            return Strip.blank(width)
+        return Strip(self._row_segments(row), width)
+
+    def start_analysis(self) -> None:
+        """Build the overview of the selected editor data in the background."""
+        if self._overview is not None:
+            self._overview.cancel()
+        self._overview = None if self.editor is None else self.editor.api.overview
+        self.refresh_map()
+        if self.editor is not None and self._overview is not None and not self._overview.complete:
+            overview = self._overview
+            snapshot = self.editor.api.snapshot()
+            self.run_worker(lambda: self._analyze(overview, snapshot), thread=True, group="overview")
+
+    def update_cursor(self) -> None:
+        """React to cursor movement in the selected editor."""
+        if self.zoom:
+            self.refresh_map()
+        else:
+            self.refresh()
+
+    def update_data(self) -> None:
+        """React to modified editor data."""
+        self.start_analysis()
+
+    def view_range(self) -> tuple[int, int]:
+        """Return the offset and length of the data range displayed by the map."""
+        if self.editor is None:
+            return 0, 0
+        size = len(self.editor.api)
+        length = max(1, -(-size // ZOOM_FACTOR**self.zoom))
+        offset = min(max(0, self.editor.api.cursor.byte - length // 2), max(0, size - length))
+        return offset, length
+
+    def watch_editor(self) -> None:
+        """React to changed editor."""
+        self.zoom = 0
+        self.start_analysis()
+
+    def watch_metric(self) -> None:
+        """React to changed metric."""
+        self.refresh_map()
+
+    def watch_zoom(self) -> None:
+        """React to changed zoom."""
+        self.refresh_map()
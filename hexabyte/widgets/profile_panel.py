@@ -0,0 +1,73 @@
+"""Sidebar Profile Panel."""
+from rich.table import Table
+from textual.app import ComposeResult
+from textual.widgets import Static
+
+from ..profiling import profiler
+from ..widgets.sidebar_panel import SidebarVerticalPanel
+
+REFRESH_INTERVAL = 1.0
+MILLISECOND = 1e-3
+MICROSECOND = 1e-6
+
+
+def format_duration(seconds: float) -> str:
+    """Return a short human readable duration."""
+    if seconds >= 1:
+        return f"{seconds:.2f}s"
+    if seconds >= MILLISECOND:
+        return f"{seconds / MILLISECOND:.1f}ms"
+    return f"{seconds / MICROSECOND:.0f}us"
+
+
+class ProfilePanel(SidebarVerticalPanel):
+    """Display timing histograms of instrumented operations.
+
+    Profiling is toggled with the `profile` command. The refresh counts of the selected editor
+    are shown below the histograms.
+    """
+
+    DEFAULT_CSS = """
+    ProfilePanel {
+
+    }
+    ProfilePanel #profile-table {
+        padding: 1 1;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        """Compose child widgets."""
+        yield Static(id="profile-table")
+
+    def on_mount(self) -> None:
+        """Start periodic refresh."""
+        self.update_view()
+        self.set_interval(REFRESH_INTERVAL, self.update_view)
+
+    def update_view(self) -> None:
+        """Render the current histograms while the panel is displayed."""
+        if not self.display:
+            return
+        view = self.query_one("#profile-table", Static)
+        if not profiler.enabled and not profiler.histograms:
+            view.update("Profiling disabled.\nRun `profile on` to start.")
+            return
+        table = Table(title="Profiling" if profiler.enabled else "Profiling paused", expand=True, box=None)
+        table.add_column("Operation", overflow="fold")
+        for column in ("Count", "Mean", "P95", "Max"):
+            table.add_column(column, justify="right")
+        for name, histogram in sorted(profiler.histograms.items(), key=lambda item: item[1].total, reverse=True):
+            table.add_row(
+                name,
+                f"{histogram.count:,}",
+                format_duration(histogram.mean),
+                format_duration(histogram.percentile(0.95)),
+                format_duration(histogram.max),
+            )
+        if self.editor is not None:
+            scheduler = self.editor.refresh_scheduler
+            table.caption = (
+                f"{scheduler.flushes:,} frames, {scheduler.coalesced:,} coalesced, {scheduler.dropped:,} dropped"
+            )
+        view.update(table)
@@ -0,0 +1,110 @@
+"""Refresh Scheduler Module."""
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from textual.scroll_view import ScrollView
+
+DEFAULT_FPS = 60
+
+
+class RefreshScheduler:
+    """Refresh Scheduler Class.
+
+    Collects line repaints, full repaints and scroll changes of a scroll view, and applies them
+    together at most once per frame. Requests made while a frame is pending are coalesced into
+    it. Scroll targets replaced before they are applied, and line repaints made redundant by a
+    scroll or full repaint, are dropped.
+
+    Params
+    ------
+    view - The scroll view refreshed by the scheduler.
+    fps - Target frame rate. Requests are applied on the next loop iteration if not positive.
+    """
+
+    def __init__(self, view: ScrollView, fps: float = DEFAULT_FPS) -> None:
+        """Initialize the refresh scheduler."""
+        self.view = view
+        self.interval = 1 / fps if fps > 0 else 0.0
+        self._lines: set[int] = set()
+        self._full = False
+        self._scroll_y: int | None = None
+        self._scheduled = False
+        self._last_flush = 0.0
+        self.requests = 0
+        self.flushes = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    @property
+    def pending(self) -> bool:
+        """Return True if a frame is scheduled."""
+        return self._scheduled
+
+    @property
+    def scroll_y(self) -> int:
+        """Return the vertical scroll offset including a pending scroll change."""
+        return round(self.view.scroll_y) if self._scroll_y is None else self._scroll_y
+
+    def _request(self) -> None:
+        """Schedule a frame unless one is pending."""
+        self.requests += 1
+        if self._scheduled:
+            self.coalesced += 1
+            return
+        self._scheduled = True
+        delay = self._last_flush + self.interval - monotonic()
+        if delay > 0:
+            self.view.set_timer(delay, self.flush, name="refresh")
+        else:
+            self.view.call_later(self.flush)
+
+    def flush(self) -> None:
+        """Apply pending scroll changes and repaints."""
+        self._scheduled = False
+        self._last_flush = monotonic()
+        self.flushes += 1
+        lines, self._lines = self._lines, set()
+        full, self._full = self._full, False
+        scroll_y, self._scroll_y = self._scroll_y, None
+        if scroll_y is not None and scroll_y != round(self.view.scroll_y):
+            self.view.scroll_to(y=scroll_y, animate=False)
+            self.dropped += len(lines)
+            return
+        if full:
+            self.view.refresh()
+            return
+        start = previous = None
+        for line in sorted(lines):
+            if previous is not None and line == previous + 1:
+                previous = line
+                continue
+            if start is not None and previous is not None:
+                self.view.refresh_lines(start, previous - start + 1)
+            start = previous = line
+        if start is not None and previous is not None:
+            self.view.refresh_lines(start, previous - start + 1)
+
+    def refresh(self) -> None:
+        """Repaint the whole view in the next frame."""
+        self.dropped += len(self._lines)
+        self._lines.clear()
+        self._full = True
+        self._request()
+
+    def refresh_lines(self, start: int, count: int = 1) -> None:
+        """Repaint `count` lines from the virtual line `start` in the next frame."""
+        if self._full:
+            self.dropped += 1
+        else:
+            self._lines.update(range(start, start + count))
+        self._request()
+
+    def scroll_to(self, y: int) -> None:
+        """Scroll to the virtual line `y` in the next frame."""
+        if self._scroll_y is not None and self._scroll_y != y:
+            self.dropped += 1
+        self._scroll_y = y
+        self._request()
@@ -6,15 +6,34 @@ from textual.containers import Vertical
 from textual.reactive import reactive
 from textual.widgets import ContentSwitcher, Tab, Tabs
 
-from ..widgets.info_panel import InfoPanel
+from ..utils import import_object
 from ..widgets.sidebar_panel import SidebarPanel
 from .editor import Editor
 
-sidebar_panels: dict[str, type[SidebarPanel]] = {"info": InfoPanel}
+# Panels are registered as classes or as `module:Class` paths that are imported when first shown
+sidebar_panels: dict[str, Union[type[SidebarPanel], str]] = {
+    "info": f"{__package__}.info_panel:InfoPanel",
+    "analysis": f"{__package__}.analysis_panel:AnalysisPanel",
+    "overview": f"{__package__}.overview_panel:OverviewPanel",
+    "template": f"{__package__}.template_panel:TemplatePanel",
+    "profile": f"{__package__}.profile_panel:ProfilePanel",
+}
+
+
+def load_sidebar_panel(name: str) -> type[SidebarPanel]:
+    """Return the panel class registered under name, importing it if required."""
+    panel = sidebar_panels[name]
+    if isinstance(panel, str):
+        panel = import_object(panel)
+        sidebar_panels[name] = panel
+    return panel
 
 
 class Sidebar(Vertical):
-    """The tabbed sidebar container."""
+    """The tabbed sidebar container.
+
+    Panels are only created when their tab is first activated.
+    """
 
     DEFAULT_CSS = """
     Sidebar {
@@ -37,16 +56,31 @@ class Sidebar(Vertical):
         """Compose sidebar tabs."""
         tabs = [Tab(name.title(), id=f"{self.id}-{name}") for name in sidebar_panels]
         yield Tabs(*tabs)
-        with ContentSwitcher():
-            for name, panel in sidebar_panels.items():
-                yield panel(id=f"{self.id}-{name}-panel", classes="panel")
+        yield ContentSwitcher()
 
     def on_mount(self) -> None:
         """Prepare sidebar contents."""
 
-    def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
+    async def on_tabs_tab_activated(self, event: Tabs.TabActivated) -> None:
         """Handle TabActivated message sent by Tabs."""
-        self.query_one(ContentSwitcher).current = f"{event.tab.id}-panel"
+        switcher = self.query_one(ContentSwitcher)
+        panel_id = f"{event.tab.id}-panel"
+        if not switcher.query(f"#{panel_id}"):
+            name = event.tab.id.removeprefix(f"{self.id}-") if event.tab.id else ""
+            panel = load_sidebar_panel(name)(id=panel_id, classes="panel")
+            await switcher.mount(panel)
+            panel.editor = self.active_editor
+        switcher.current = panel_id
+
+    def update_cursor(self) -> None:
+        """Notify panels that the active editor cursor moved."""
+        for panel in self.query(".panel").results(SidebarPanel):
+            panel.update_cursor()
+
+    def update_panels(self) -> None:
+        """Notify panels that the active editor data was modified."""
+        for panel in self.query(".panel").results(SidebarPanel):
+            panel.update_data()
 
     def watch_active_editor(self, editor: Editor):
         """React to active api change."""
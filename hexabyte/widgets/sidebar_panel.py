@@ -22,6 +22,12 @@ class SidebarPanel(Widget):  # pylint: disable=too-few-public-methods
 
     editor: reactive[Union[Editor, None]] = reactive(None, init=False)
 
+    def update_cursor(self) -> None:
+        """React to cursor movement in the selected editor."""
+
+    def update_data(self) -> None:
+        """React to modified data in the selected editor."""
+
 
 class SidebarVerticalPanel(VerticalScroll, SidebarPanel):  # pylint: disable=too-few-public-methods
     """Generic sidebar panel class."""
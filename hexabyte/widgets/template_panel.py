@@ -0,0 +1,169 @@
+"""Sidebar Template Panel."""
+from typing import Union
+
+from rich.text import Text
+from textual.app import ComposeResult
+from textual.widgets import Static, Tree
+from textual.widgets.tree import TreeNode
+
+from ..templates import Array, Node, TemplateError, TemplateParser, detect_template, format_value
+from ..widgets.sidebar_panel import SidebarPanel
+
+ARRAY_PAGE_SIZE = 256
+CHECK_INTERVAL = 0.5
+MAGIC_LENGTH = 16
+
+# Tree node data is a template node, or the template node and index of the next array page
+TreeData = Union[Node, tuple[Node, int]]
+
+
+class TemplatePanel(SidebarPanel):
+    """Display the fields of the template overlaid on the selected editor data.
+
+    A template is detected from the leading bytes of the data unless one is applied with the
+    `template` command. Members are only parsed when their tree node is expanded, and large
+    arrays are listed in pages. Select a node to jump to it.
+    """
+
+    DEFAULT_CSS = """
+    TemplatePanel {
+        layout: vertical;
+        width: 100%;
+        height: 100%;
+    }
+    TemplatePanel Static {
+        padding: 0 1;
+    }
+    TemplatePanel Tree {
+        height: 1fr;
+        background: $accent;
+    }
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize TemplatePanel."""
+        super().__init__(*args, **kwargs)
+        self._parser: Union[TemplateParser, None] = None
+        self._detected: set[int] = set()
+
+    def compose(self) -> ComposeResult:
+        """Compose child widgets."""
+        yield Static(id="template-name")
+        yield Static(id="template-cursor")
+        yield Tree[TreeData]("", id="template-tree")
+
+    def _add_nodes(self, tree_node: TreeNode[TreeData], node: Node, start: int = 0) -> None:
+        """Add tree nodes for the children of a template node."""
+        if self._parser is None:
+            return
+        stop = start + ARRAY_PAGE_SIZE if node.count else None
+        for child in self._parser.children(node, start, stop):
+            tree_node.add(self._label(child), data=child, allow_expand=child.expandable)
+        if stop is not None and stop < node.count:
+            tree_node.add_leaf(f"... {node.count - stop} more", data=(node, stop))
+
+    def _label(self, node: Node) -> Text:
+        """Return the tree label of a template node."""
+        label = Text(node.name, style="bold")
+        if isinstance(node.member, Array):
+            label.append(f"[{node.count}]")
+        if not node.expandable and self._parser is not None:
+            label.append(f" = {format_value(self._parser.value(node))}")
+        label.append(f" @{node.offset:#x}", style="dim")
+        return label
+
+    def _relabel(self, tree_node: TreeNode[TreeData]) -> None:
+        """Refresh the labels of loaded tree nodes."""
+        for child in tree_node.children:
+            if isinstance(child.data, Node):
+                child.set_label(self._label(child.data))
+                self._relabel(child)
+
+    def check_template(self) -> None:
+        """Rebuild the tree if a different template was applied to the editor data."""
+        api = self.editor.api if self.editor is not None else None
+        if api is not None and api.template is None and id(api) not in self._detected:
+            self._detected.add(id(api))
+            try:
+                template = detect_template(bytes(api.read_at(0, MAGIC_LENGTH)))
+            except TemplateError as err:
+                self.query_one("#template-name", Static).update(f"Invalid template config - {err}")
+                return
+            if template is not None:
+                api.apply_template(template.name)
+        parser = api.template if api is not None else None
+        if parser is not self._parser:
+            self._parser = parser
+            self.rebuild()
+
+    def on_mount(self) -> None:
+        """Start watching for applied templates."""
+        self.check_template()
+        self.set_interval(CHECK_INTERVAL, self.check_template)
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded[TreeData]) -> None:
+        """Parse the children of an expanded node."""
+        if isinstance(event.node.data, Node) and not event.node.children:
+            self._add_nodes(event.node, event.node.data)
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected[TreeData]) -> None:
+        """Jump to the selected node or load the next array page."""
+        data = event.node.data
+        if isinstance(data, tuple):
+            parent = event.node.parent
+            event.node.remove()
+            if parent is not None:
+                self._add_nodes(parent, *data)
+        elif isinstance(data, Node) and self.editor is not None:
+            self.editor.send_cmd(f"goto {data.offset}")
+
+    def rebuild(self) -> None:
+        """Rebuild the tree from the template root."""
+        tree = self.query_one("#template-tree", Tree)
+        tree.clear()
+        if self._parser is None:
+            self.query_one("#template-name", Static).update("No template.\nApply one with `template NAME`.")
+            tree.display = False
+            self.update_cursor()
+            return
+        template = self._parser.template
+        self.query_one("#template-name", Static).update(f"{template.name} - {template.description}")
+        tree.display = True
+        root = self._parser.root
+        tree.root.set_label(self._label(root))
+        tree.root.data = root
+        self._add_nodes(tree.root, root)
+        tree.root.expand()
+        self.update_cursor()
+
+    def update_cursor(self) -> None:
+        """Show the field under the cursor."""
+        status = self.query_one("#template-cursor", Static)
+        if self._parser is None or self.editor is None:
+            status.update("")
+            return
+        path = self._parser.node_at(self.editor.api.cursor.byte)
+        if not path:
+            status.update("cursor: -")
+            return
+        node = path[-1]
+        value = "" if node.expandable else f" = {format_value(self._parser.value(node))}"
+        status.update(f"cursor: {node.path or node.name}{value}")
+
+    def update_data(self) -> None:
+        """React to modified editor data.
+
+        The tree is rebuilt if the modification moved or resized root members.
+        """
+        if self._parser is None:
+            return
+        tree = self.query_one("#template-tree", Tree)
+        if [child.data for child in tree.root.children] != self._parser.children(self._parser.root):
+            self.rebuild()
+            return
+        self._relabel(tree.root)
+        self.update_cursor()
+
+    def watch_editor(self) -> None:
+        """React to changed editor."""
+        self.check_template()
@@ -1,18 +1,24 @@
 """Workbench Class Module."""
-from typing import Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
 
 from textual.app import ComposeResult
 from textual.containers import Container, Vertical
 from textual.reactive import reactive
-from textual.widgets import Footer, Header
+from textual.widgets import Footer, Header, LoadingIndicator
 
 from ..api import DataAPI
 from ..constants import FileMode
 from ..constants.generic import DIFF_FILE_COUNT
 from ..context import context
+from ..data_types import DataSegment
 from .editor import Editor
 from .sidebar import Sidebar
 
+if TYPE_CHECKING:
+    from ..analysis import DiffEngine, DiffRange
+
 
 class Body(Container):  # pylint: disable=too-few-public-methods
     """Main container for workspace."""
@@ -47,6 +53,12 @@ class Workbench(Vertical):
     Workbench Editor.split.with-sidebar {
         column-span: 6;
     }
+    Workbench #loading {
+        column-span: 18;
+    }
+    Workbench #loading.with-sidebar {
+        column-span: 12;
+    }
     Workbench Sidebar {
         layer: base;
         column-span: 6;
@@ -55,49 +67,124 @@ class Workbench(Vertical):
     """
 
     show_sidebar: reactive[bool] = reactive(True)
-    active_editor: reactive[Union[Editor, None]] = reactive(None, init=False)
+    active_editor: reactive[Editor | None] = reactive(None, init=False)
 
     def __init__(
         self,
         **kwargs,
     ) -> None:
-        """Initialize Workbench."""
+        """Initialize Workbench.
+
+        Files are opened in the background once the workbench is mounted.
+        """
         super().__init__(**kwargs)
-        self.editors = []
-        if context.file_mode != FileMode.DIFF:
-            api = DataAPI(context.files[0])
-            if context.file_mode == FileMode.NORMAL:
-                self.sub_title = f"NORMAL MODE: {api.filepath.name}"
-                self.editors.append(Editor(api, id="primary"))
-            elif context.file_mode == FileMode.SPLIT:
-                self.sub_title = f"SPLIT MODE: {api.filepath.name} <-> {api.filepath.name}"
-                self.editors.append(Editor(api, classes="split", id="primary"))
-                self.editors.append(Editor(api, classes="split", id="secondary"))
+        self.editors: list[Editor] = []
+        self._diff_engine: DiffEngine | None = None
+        if context.file_mode == FileMode.DIFF and len(context.files) != DIFF_FILE_COUNT:
+            raise ValueError("Two files must be loaded for diff mode.")
+        names = [filepath.name for filepath in context.files]
+        if context.file_mode == FileMode.NORMAL:
+            self._title = f"NORMAL MODE: {names[0]}"
+        elif context.file_mode == FileMode.SPLIT:
+            self._title = f"SPLIT MODE: {names[0]} <-> {names[0]}"
         else:
-            if len(context.files) != DIFF_FILE_COUNT:
-                raise ValueError("Two files must be loaded for diff mode.")
-            api1 = DataAPI(context.files[0])
-            api2 = DataAPI(context.files[1])
-            self.sub_title = f"DIFF MODE: {api1.filepath.name} <-> {api2.filepath.name}"
-            self.editors.append(Editor(api1, classes="split", id="primary"))
-            self.editors.append(Editor(api2, classes="split", id="secondary"))
+            self._title = f"DIFF MODE: {names[0]} <-> {names[1]}"
+        self.sub_title = f"{self._title} (loading)"
+
+    def _apply_diff(self, engine: DiffEngine, versions: tuple[int, int], ranges: list[DiffRange]) -> None:
+        """Highlight differing data in both diff editors."""
+        primary, secondary = self.editors
+        if engine is not self._diff_engine or versions != (primary.api.version, secondary.api.version):
+            return
+        primary.api.set_diffs(diff_segments(ranges, len(primary.api), secondary=False))
+        secondary.api.set_diffs(diff_segments(ranges, len(secondary.api), secondary=True))
+        self.set_sub_title(f"{self._title} ({len(ranges):,} differences)")
+        primary.refresh_changes()
+        secondary.refresh_changes()
+
+    def _mount_editors(self, apis: list[DataAPI]) -> None:
+        """Replace the loading indicator with editors for the opened data."""
+        classes = "with-sidebar" if self.show_sidebar else ""
+        if context.file_mode == FileMode.NORMAL:
+            self.editors.append(Editor(apis[0], classes=classes, id="primary"))
+        else:
+            self.editors.append(Editor(apis[0], classes=f"split {classes}", id="primary"))
+            self.editors.append(Editor(apis[-1], classes=f"split {classes}", id="secondary"))
+        body = self.query_one(Body)
+        body.mount(*self.editors, before=self.query_one("#sidebar", Sidebar))
+        self.query_one("#loading", LoadingIndicator).remove()
+        self.set_sub_title(self._title)
+        self.editors[0].focus()
+        if context.file_mode == FileMode.DIFF:
+            self.update_diff()
+
+    def _open_files(self) -> None:
+        """Open data sources. Runs in a worker thread."""
+        filepaths = context.files[:DIFF_FILE_COUNT] if context.file_mode == FileMode.DIFF else context.files[:1]
+        try:
+            apis = [DataAPI(filepath) for filepath in filepaths]
+        except OSError as err:
+            self.app.call_from_thread(self._open_failed, err)
+            return
+        self.app.call_from_thread(self._mount_editors, apis)
+
+    def _open_failed(self, error: OSError) -> None:
+        """Replace the loading indicator with the reason data could not be opened."""
+        self.query_one("#loading", LoadingIndicator).remove()
+        self.set_sub_title(f"Unable to open {error.filename or ''} - {error.strerror or error}")
+        self.notify(str(error), title="Unable to open file", severity="error")
+
+    def _run_diff(self, engine: DiffEngine, versions: tuple[int, int]) -> None:
+        """Compare diff editor data. Runs in a worker thread."""
+        ranges = engine.diff()
+        if not engine.cancelled:
+            self.app.call_from_thread(self._apply_diff, engine, versions, ranges)
 
     def compose(self) -> ComposeResult:
         """Compose sidebar widgets."""
         yield Header(show_clock=True)
         with Body():
-            yield from self.editors
+            yield LoadingIndicator(id="loading")
             yield Sidebar(id="sidebar")
         yield Footer()
 
+    def on_editor_changed(self, message: Editor.Changed) -> None:
+        """Update sidebar panels when editor data changes."""
+        if message.editor is self.active_editor:
+            self.query_one("#sidebar", Sidebar).update_panels()
+        if context.file_mode == FileMode.DIFF:
+            self.update_diff()
+
+    def on_editor_moved(self, message: Editor.Moved) -> None:
+        """Keep linked editors at the same cursor and scroll offsets as the active editor."""
+        if message.editor is not self.active_editor:
+            return
+        self.query_one("#sidebar", Sidebar).update_cursor()
+        mode_config = context.config.settings.get(context.file_mode.value, {})
+        if not mode_config.get("linked-scroll", True):
+            return
+        source = message.editor
+        for editor in self.editors:
+            if editor is source:
+                continue
+            if editor.api is not source.api:
+                editor.api.cursor.bit = source.cursor
+            editor.cursor = editor.api.cursor.bit
+            editor.scroll_to_offset(source.top_offset)
+
     def on_editor_selected(self, message: Editor.Selected) -> None:
         """Update global state when switching editors."""
         self.active_editor = message.editor
 
     def on_mount(self) -> None:
         """Perform on_mount tasks."""
-        editor = self.query_one("#primary", Editor)
-        editor.focus()
+        self.app.sub_title = self.sub_title
+        self.run_worker(self._open_files, thread=True, group="open")
+
+    def set_sub_title(self, sub_title: str) -> None:
+        """Update the workbench and application sub title."""
+        self.sub_title = sub_title
+        self.app.sub_title = sub_title
 
     def watch_active_editor(self):
         """Watch active editor to update sidebar."""
@@ -112,12 +199,41 @@ class Workbench(Vertical):
         sidebar = self.query_one("#sidebar", Sidebar)
         sidebar.display = visibility
         if sidebar.display:
-            self.query("Editor").add_class("with-sidebar")
+            self.query("Editor, #loading").add_class("with-sidebar")
         else:
-            self.query("Editor").remove_class("with-sidebar")
+            self.query("Editor, #loading").remove_class("with-sidebar")
+
+    def update_diff(self) -> None:
+        """Compare snapshots of diff editor data in the background, cancelling any in-progress comparison."""
+        from ..analysis import DiffEngine  # pylint: disable=import-outside-toplevel
+
+        if self._diff_engine is not None:
+            self._diff_engine.cancel()
+        primary, secondary = (editor.api.snapshot() for editor in self.editors)
+        engine = DiffEngine(primary.read, len(primary), secondary.read, len(secondary))
+        self._diff_engine = engine
+        versions = (primary.version, secondary.version)
+        self.run_worker(lambda: self._run_diff(engine, versions), thread=True, group="diff")
 
     def update_view_styles(self) -> None:
         """Update text style of view component."""
         editors = self.query("Editor").results(Editor)
         for editor in editors:
             editor.update_view_style()
+
+
+def diff_segments(ranges: list[DiffRange], size: int, secondary: bool) -> list[DataSegment]:
+    """Convert diff ranges into data segments of one diff source.
+
+    Data only present in the other source is marked with a single byte at the insertion point.
+    """
+    segments = []
+    for diff_range in ranges:
+        offset, length = (
+            (diff_range.b_offset, diff_range.b_length) if secondary else (diff_range.a_offset, diff_range.a_length)
+        )
+        if length:
+            segments.append(DataSegment(offset, length))
+        elif size:
+            segments.append(DataSegment(min(offset, size - 1), 1))
+    return segments
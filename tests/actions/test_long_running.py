@@ -0,0 +1,106 @@
+"""Unit tests for long running actions."""
+from types import SimpleNamespace
+
+import pytest
+
+from hexabyte.actions import ActionError, CancelError
+from hexabyte.actions.api import replace
+from hexabyte.commands import CommandParser
+from hexabyte.hexabyte_app import HexabyteApp
+
+TEST_DATA = b"abc-hello-" * 100 + b"hel"
+
+
+@pytest.fixture
+def data():
+    """Provide the test data."""
+    return TEST_DATA
+
+
+def parse(cmd: str):
+    """Parse a single command."""
+    return CommandParser().parse_one(cmd)
+
+
+@pytest.mark.parametrize("chunk_size", [7, 64, replace.SCAN_CHUNK_SIZE])
+def test_replace_all(api, monkeypatch, chunk_size):
+    """Test every occurrence is replaced and restored by undo, including across scan chunks."""
+    monkeypatch.setattr(replace, "SCAN_CHUNK_SIZE", chunk_size)
+    api.seek(500)
+    api.do(parse("replaceall hello HI"))
+    assert api.read_at(0) == TEST_DATA.replace(b"hello", b"HI")
+    assert api.cursor.byte == TEST_DATA.index(b"hello")
+    api.action_handler.undo()
+    assert api.read_at(0) == TEST_DATA
+    assert api.cursor.byte == 500
+    api.action_handler.redo()
+    assert api.read_at(0) == TEST_DATA.replace(b"hello", b"HI")
+
+
+def test_replace_all_progress(api, monkeypatch):
+    """Test actions prepared from a snapshot report progress and apply through the handler."""
+    monkeypatch.setattr(replace, "SCAN_CHUNK_SIZE", 100)
+    action = parse("replaceall b'-' b'__'")
+    api.action_handler.start(action)
+    action.run()
+    assert action.prepared
+    assert action.progress.percent == 100
+    assert api.read_at(0) == TEST_DATA
+    api.do(action)
+    assert api.read_at(0) == TEST_DATA.replace(b"-", b"__")
+
+
+def test_replace_all_cancelled(api, monkeypatch):
+    """Test cancelled actions stop scanning and modify nothing."""
+    monkeypatch.setattr(replace, "SCAN_CHUNK_SIZE", 100)
+    action = parse("replaceall hello HI")
+    api.action_handler.start(action)
+    action.progress.cancel()
+    with pytest.raises(CancelError):
+        action.run()
+    assert action.progress.done == 100
+    assert not action.prepared
+    assert api.read_at(0) == TEST_DATA
+
+
+def test_replace_all_stale_snapshot(api):
+    """Test results prepared from modified data are discarded."""
+    action = parse("replaceall hello HI")
+    api.action_handler.start(action)
+    api.do(parse("set 0 0x41"))
+    with pytest.raises(ActionError):
+        action.run()
+    action = parse("replaceall hello HI")
+    api.action_handler.start(action)
+    action.run()
+    api.do(parse("set 0 0x42"))
+    with pytest.raises(ActionError):
+        api.do(action)
+    assert api.read_at(4, 5) == b"hello"
+
+
+def test_replace_all_single_change(api):
+    """Test every occurrence is replaced and restored by a single modification."""
+    changes = []
+    api.subscribe("test", changes.append)
+    api.do(parse("replaceall hello HI"))
+    api.action_handler.undo()
+    first = TEST_DATA.index(b"hello")
+    last = TEST_DATA.rindex(b"hello") + len(b"hello")
+    assert [(change.offset, change.old_length) for change in changes] == [
+        (first, last - first),
+        (first, len(TEST_DATA.replace(b"hello", b"HI")) - len(TEST_DATA) + last - first),
+    ]
+
+
+def test_run_action_unexpected_error(api, monkeypatch):
+    """Test unexpected errors of long running actions are reported so the action finishes."""
+    finished = []
+    app = SimpleNamespace(_finish_action=None, call_from_thread=lambda callback, *args: finished.append(args))
+    action = parse("replaceall hello HI")
+    api.action_handler.start(action)
+    monkeypatch.setattr(action, "run", lambda: 1 / 0)
+    HexabyteApp._run_action(app, None, action)  # pylint: disable=protected-access
+    assert len(finished) == 1
+    assert isinstance(finished[0][2], ActionError)
+    assert "ZeroDivisionError" in str(finished[0][2])
@@ -0,0 +1,120 @@
+"""Unit tests for action tracing."""
+import pytest
+
+from hexabyte.actions.app import Trace
+from hexabyte.api import DataAPI
+from hexabyte.commands import CommandParser, InvalidCommandError
+from hexabyte.tracing import ActionTracer, TraceRecord, load_trace, replay
+
+DATA = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def data():
+    """Provide the test data."""
+    return DATA
+
+
+@pytest.fixture
+def api(api):  # pylint: disable=redefined-outer-name
+    """Provide a data api with tracing enabled."""
+    api.action_handler.tracer = ActionTracer(enabled=True)
+    return api
+
+
+def do(api: DataAPI, cmd: str) -> None:
+    """Parse and perform a command."""
+    for action in CommandParser().parse(cmd):
+        api.do(action)
+
+
+def test_trace_records(api):
+    """Test commands, bytes touched and undo memory are recorded."""
+    do(api, "set 0x10 0xaa; delete 0x20 8; find b'\\xff'; undo")
+    records = list(api.action_handler.tracer)
+    assert [(record.cmd, record.operation) for record in records] == [
+        ("set", "do"),
+        ("delete", "do"),
+        ("find", "do"),
+        ("delete", "undo"),
+        ("undo", "do"),
+    ]
+    assert records[0].argv == ("0x10", "0xaa")
+    assert records[0].target == "api"
+    assert records[0].source == "data.bin"
+    assert records[1].bytes_touched == 16
+    # Search starts after the deleted bytes were read and ends after the match shifted by the delete
+    assert records[2].bytes_touched == (0xFF - 8 + 1) - 0x28
+    assert records[1].undo_memory > records[0].undo_memory > 0
+    assert records[3].undo_memory == records[1].undo_memory
+    assert all(record.error is None and record.duration >= 0 for record in records)
+
+
+def test_trace_errors_and_disabled(api):
+    """Test failed actions are recorded and nothing is recorded while disabled."""
+    tracer = api.action_handler.tracer
+    with pytest.raises(InvalidCommandError):
+        do(api, "find b'missing'")
+    assert tracer.records[-1].cmd == "find"
+    assert tracer.records[-1].error is not None
+    tracer.enabled = False
+    do(api, "set 0 0")
+    assert len(tracer) == 1
+
+
+def test_ring_buffer():
+    """Test the oldest records are discarded."""
+    tracer = ActionTracer(capacity=2, enabled=True)
+    for cmd in ("a", "b", "c"):
+        tracer.record(TraceRecord(cmd, duration=1.0))
+    assert [record.cmd for record in tracer] == ["b", "c"]
+    assert tracer.summary()["c"] == {"count": 1, "total": 1.0, "max": 1.0, "bytes_touched": 0}
+    tracer.clear()
+    assert not len(tracer)
+
+
+def test_export_and_replay(api, tmp_path):
+    """Test exported traces replay the same commands."""
+    do(api, "set 0x10 0xaa; insert 0 0xbb; undo")
+    trace_filepath = tmp_path / "trace.jsonl"
+    api.action_handler.tracer.export(trace_filepath)
+    records = load_trace(trace_filepath)
+    assert records == list(api.action_handler.tracer)
+
+    replay_filepath = tmp_path / "replay.bin"
+    replay_filepath.write_bytes(DATA)
+    replayed = replay(records, replay_filepath)
+    assert [record.command for record in replayed if record.operation == "do"] == [
+        "set 0x10 0xaa",
+        "insert 0 0xbb",
+        "undo",
+    ]
+    assert replay_filepath.read_bytes() == DATA
+
+
+@pytest.mark.parametrize("argv", [("on", "off"), ("export",), ("clear", "trace.jsonl"), ("dump", "trace.jsonl")])
+def test_trace_action_validation(argv):
+    """Test invalid trace subcommands and arguments are rejected."""
+    with pytest.raises(InvalidCommandError):
+        Trace(argv)
+
+
+def test_trace_action(tmp_path):
+    """Test the trace action parses subcommands and the export filepath."""
+    assert Trace(()).subcommand is None
+    action = Trace(("EXPORT", str(tmp_path / "trace.jsonl")))
+    assert action.subcommand == "export"
+    assert action.filepath == tmp_path / "trace.jsonl"
+
+
+def test_find_bytes_touched(api):
+    """Test searches count the bytes scanned, including searches that find nothing."""
+    touched = api.bytes_touched
+    assert api.find(b"missing", 0x10) == -1
+    assert api.bytes_touched - touched == len(DATA) - 0x10
+    touched = api.bytes_touched
+    assert api.find(b"missing", 0x10, reverse=True) == -1
+    assert api.bytes_touched - touched == 0x10
+    touched = api.bytes_touched
+    assert api.find(b"\x20\x21", 0x10) == 0x20
+    assert api.bytes_touched - touched == 0x22 - 0x10
@@ -0,0 +1,102 @@
+"""Unit tests for the binary diff engine."""
+import random
+
+import pytest
+
+from hexabyte.analysis.binary_diff import DiffEngine, DiffRange, rolling_checksums
+
+
+def make_engine(a_data: bytes, b_data: bytes, **kwargs) -> DiffEngine:
+    """Create a diff engine comparing two buffers."""
+    return DiffEngine(
+        lambda offset, length: a_data[offset : offset + length],
+        len(a_data),
+        lambda offset, length: b_data[offset : offset + length],
+        len(b_data),
+        **kwargs,
+    )
+
+
+def patch(a_data: bytes, b_data: bytes, ranges: list[DiffRange]) -> bytes:
+    """Rebuild the second buffer from the first buffer and diff ranges."""
+    result = bytearray()
+    a_offset = 0
+    for diff_range in ranges:
+        result += a_data[a_offset : diff_range.a_offset]
+        result += b_data[diff_range.b_offset : diff_range.b_offset + diff_range.b_length]
+        a_offset = diff_range.a_offset + diff_range.a_length
+    result += a_data[a_offset:]
+    return bytes(result)
+
+
+def test_diff_identical():
+    """Test identical buffers have no differences."""
+    data = bytes(range(256)) * 64
+    assert not make_engine(data, data, chunk_size=1000).diff()
+
+
+def test_diff_substitution():
+    """Test same length substitutions stay aligned."""
+    a_data = bytes(range(256)) * 64
+    b_data = bytearray(a_data)
+    b_data[1000:1004] = b"\xff\xff\xff\xff"
+    b_data[9000] ^= 0xFF
+    ranges = make_engine(a_data, bytes(b_data), chunk_size=4096).diff()
+    assert ranges == [DiffRange(1000, 4, 1000, 4), DiffRange(9000, 1, 9000, 1)]
+
+
+def test_diff_insert_and_delete():
+    """Test inserts and deletes resync both sources."""
+    rng = random.Random(1)
+    a_data = rng.randbytes(20000)
+    b_data = a_data[:5000] + b"inserted bytes" + a_data[5000:12000] + a_data[12100:]
+    ranges = make_engine(a_data, b_data, chunk_size=4096).diff()
+    assert ranges == [DiffRange(5000, 0, 5000, 14), DiffRange(12000, 100, 12014, 0)]
+
+
+def test_diff_tail():
+    """Test differing lengths produce a tail range."""
+    a_data = bytes(range(256)) * 4
+    b_data = a_data + b"tail"
+    assert make_engine(a_data, b_data).diff() == [DiffRange(1024, 0, 1024, 4)]
+    assert make_engine(b_data, a_data).diff() == [DiffRange(1024, 4, 1024, 0)]
+
+
+def test_diff_unrelated():
+    """Test completely different buffers."""
+    rng = random.Random(2)
+    a_data = rng.randbytes(10000)
+    b_data = rng.randbytes(8000)
+    ranges = make_engine(a_data, b_data, chunk_size=1024, lookahead=512).diff()
+    assert patch(a_data, b_data, ranges) == b_data
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_diff_random_edits(seed):
+    """Test diff ranges transform the first buffer into the second."""
+    rng = random.Random(seed)
+    a_data = rng.randbytes(50000)
+    b_data = bytearray(a_data)
+    for _ in range(20):
+        offset = rng.randrange(len(b_data))
+        b_data[offset : offset + rng.randrange(50)] = rng.randbytes(rng.randrange(50))
+    b_data = bytes(b_data)
+    ranges = make_engine(a_data, b_data, chunk_size=2048, lookahead=1024).diff()
+    assert patch(a_data, b_data, ranges) == b_data
+    assert sum(diff_range.b_length for diff_range in ranges) < 2000
+
+
+def test_diff_cancel():
+    """Test a cancelled diff stops producing ranges."""
+    engine = make_engine(b"a" * 100, b"b" * 100)
+    engine.cancel()
+    assert not engine.diff()
+
+
+def test_rolling_checksums():
+    """Test rolling checksums match for equal windows."""
+    data = b"abcdefgh" * 4
+    checksums = rolling_checksums(data, 8)
+    assert len(checksums) == len(data) - 7
+    assert checksums[0] == checksums[8] == checksums[16]
+    assert checksums[0] != checksums[1]
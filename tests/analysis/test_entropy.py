@@ -0,0 +1,105 @@
+"""Unit tests for the entropy analyzer."""
+import random
+
+import numpy as np
+import pytest
+
+from hexabyte.analysis import EntropyAnalyzer
+from hexabyte.analysis.entropy import block_entropy
+from hexabyte.data_sources import DataSnapshot
+
+ZERO_DATA = bytes(1024)
+COUNT_DATA = bytes(range(256)) * 4
+
+
+def make_analyzer(data: bytearray, **kwargs) -> EntropyAnalyzer:
+    """Create an analyzer over a mutable buffer."""
+    return EntropyAnalyzer(lambda offset, length: data[offset : offset + length], len(data), **kwargs)
+
+
+def test_block_entropy():
+    """Test entropy and histograms of uniform and constant blocks."""
+    entropy, histograms = block_entropy(ZERO_DATA + COUNT_DATA + b"ab", 1024)
+    assert entropy.tolist() == [0.0, 1.0, 0.125]
+    assert histograms[0][0] == 1024
+    assert (histograms[1] == 4).all()
+    assert histograms[2].sum() == 2
+    assert block_entropy(b"", 1024)[0].size == 0
+
+
+def test_block_entropy_large_blocks():
+    """Test large blocks produce the same results as small blocks."""
+    data = random.Random(3).randbytes(40000)
+    small_entropy, small_histograms = block_entropy(data, 1000)
+    large_entropy, large_histograms = block_entropy(data * 10, 10000)
+    assert large_histograms.sum() == len(data) * 10
+    assert (large_histograms[0] == small_histograms[:10].sum(axis=0)).all()
+    assert large_entropy.shape == (40,)
+    assert small_entropy.shape == (40,)
+
+
+def test_analyze():
+    """Test analyzing data in multiple chunks."""
+    rng = random.Random(0)
+    data = bytearray(ZERO_DATA * 8 + rng.randbytes(4096) + b"tail")
+    analyzer = make_analyzer(data, block_size=1024, chunk_size=2048)
+    assert not analyzer.complete
+    assert list(analyzer.analyze())[-1] == 1.0
+    assert analyzer.complete
+    assert analyzer.block_count == 13
+    assert (analyzer.entropy[:8] == 0).all()
+    assert (analyzer.entropy[8:12] > 0.9).all()
+    assert analyzer.histogram.sum() == len(data)
+    assert 0 < analyzer.total_entropy() < 1
+
+
+def test_analyze_snapshot():
+    """Test analysis reads the snapshot and stops once it is stale."""
+    data = bytearray(ZERO_DATA * 4)
+    versions = [0]
+    snapshot = DataSnapshot(
+        lambda offset, length: bytes(COUNT_DATA * 4)[offset : offset + length], len(data), 0, lambda: versions[0]
+    )
+    analyzer = make_analyzer(data, block_size=1024, chunk_size=1024)
+    progress = analyzer.analyze(snapshot)
+    next(progress)
+    assert analyzer.entropy[0] == 1.0
+    versions[0] += 1
+    assert not list(progress)
+    assert np.isnan(analyzer.entropy[1:]).all()
+
+
+def test_update_same_length():
+    """Test overwrites only invalidate touched blocks."""
+    data = bytearray(ZERO_DATA * 4)
+    analyzer = make_analyzer(data, block_size=1024)
+    list(analyzer.analyze())
+    data[1500:1600] = COUNT_DATA[:100]
+    analyzer.update(1500, 100, 100)
+    assert np.isnan(analyzer.entropy).tolist() == [False, True, False, False]
+    list(analyzer.analyze())
+    assert analyzer.entropy[1] > 0
+    assert analyzer.histogram.sum() == len(data)
+
+
+@pytest.mark.parametrize(("old_length", "new_length"), [(0, 2000), (1500, 0)])
+def test_update_resize(old_length, new_length):
+    """Test inserts and deletes invalidate following blocks."""
+    data = bytearray(COUNT_DATA * 4)
+    analyzer = make_analyzer(data, block_size=1024)
+    list(analyzer.analyze())
+    data[1100 : 1100 + old_length] = bytes(new_length)
+    analyzer.update(1100, old_length, new_length)
+    assert analyzer.block_count == -(-len(data) // 1024)
+    assert analyzer.entropy[0] == 1.0
+    assert np.isnan(analyzer.entropy[1:]).all()
+    list(analyzer.analyze())
+    assert analyzer.histogram.sum() == len(data)
+
+
+def test_for_size():
+    """Test block size selection."""
+    assert EntropyAnalyzer.for_size(bytes, 1000).block_size == 256
+    assert EntropyAnalyzer.for_size(bytes, 1 << 30, max_blocks=4096).block_size == 1 << 18
+    with pytest.raises(ValueError):
+        EntropyAnalyzer(bytes, 10, block_size=0)
@@ -0,0 +1,171 @@
+"""Unit tests for MerkleTree class."""
+import hashlib
+import random
+
+import pytest
+
+from hexabyte.analysis import MerkleTree
+from hexabyte.analysis.merkle_tree import LEAF_PREFIX, NODE_PREFIX
+from hexabyte.data_types import DataSegment
+
+LEAF_SIZE = 64
+
+
+def expected_root(data: bytearray, tree: MerkleTree) -> bytes:
+    """Compute the root digest of data using the leaf layout of tree."""
+    level = [hashlib.sha256(LEAF_PREFIX + data[leaf.start : leaf.after]).digest() for leaf in tree.leaves()]
+    if not level:
+        return hashlib.sha256(b"").digest()
+    while len(level) > 1:
+        pairs = [level[idx : idx + 2] for idx in range(0, len(level), 2)]
+        level = [hashlib.sha256(NODE_PREFIX + b"".join(pair)).digest() if len(pair) == 2 else pair[0] for pair in pairs]
+    return level[0]
+
+
+def make_tree(data: bytearray, leaf_size: int = LEAF_SIZE) -> MerkleTree:
+    """Create a merkle tree tracking data."""
+    return MerkleTree(lambda offset, length: data[offset : offset + length], len(data), leaf_size=leaf_size)
+
+
+def test_merkle_build():
+    """Test leaf layout and root of a new tree."""
+    data = bytearray(random.Random(1).randbytes(4096))
+    tree = make_tree(data)
+    lengths = [len(leaf) for leaf in tree.leaves()]
+    assert sum(lengths) == tree.size == len(data)
+    assert all(LEAF_SIZE // 4 <= length <= LEAF_SIZE * 4 for length in lengths[:-1])
+    assert len(data) // (LEAF_SIZE * 2) < len(tree) < len(data) // (LEAF_SIZE // 2)
+    assert tree.root == expected_root(data, tree)
+    assert not tree.modified_segments()
+
+
+def test_merkle_empty():
+    """Test tree of empty data."""
+    data = bytearray()
+    tree = make_tree(data)
+    assert len(tree) == 0
+    assert tree.root == hashlib.sha256(b"").digest()
+    data += b"abc"
+    tree.update(0, 0, 3)
+    assert tree.root == expected_root(data, tree)
+    assert tree.modified_segments() == [tree.leaves()[0]]
+
+
+def test_merkle_overwrite():
+    """Test overwrite only rehashes touched leaves and can be reverted."""
+    original = random.Random(2).randbytes(1024)
+    data = bytearray(original)
+    tree = make_tree(data)
+    original_root = tree.root
+    data[170:172] = b"\xff\xff"
+    tree.update(170, 2, 2)
+    assert tree.root != original_root
+    assert tree.root == expected_root(data, tree)
+    segments = tree.modified_segments()
+    assert len(segments) == 1 and 170 in segments[0]
+    assert len(segments[0]) <= LEAF_SIZE * 8
+    data[170:172] = original[170:172]
+    tree.update(170, 2, 2)
+    assert tree.root == original_root
+    assert not tree.modified_segments()
+
+
+def test_merkle_modified_duplicate_leaf():
+    """Test a modified leaf equal to a different clean leaf is modified."""
+    data = bytearray(random.Random(3).randbytes(1024))
+    tree = make_tree(data)
+    first, second = tree.leaves()[:2]
+    data[first.start : first.after] = data[second.start : second.after]
+    tree.update(first.start, len(first), len(second))
+    assert tree.leaves()[1] == DataSegment(len(second), len(second))
+    assert tree.modified_segments() == [tree.leaves()[0]]
+
+
+def test_merkle_modified_repeated_leaves():
+    """Test an overwrite of a leaf among equal leaves only modifies that leaf."""
+    data = bytearray(range(256)) * 64
+    tree = make_tree(data)
+    data[5] = 0xFF
+    tree.update(5, 1, 1)
+    assert tree.modified_segments() == [tree.leaves()[0]]
+
+
+def test_merkle_modified_overwrites():
+    """Test modified segments cover every overwritten byte and are cleared once data is restored."""
+    rng = random.Random(4321)
+    clean = bytearray(rng.randbytes(64)) * 32
+    data = bytearray(clean)
+    tree = make_tree(data)
+    for _ in range(50):
+        offset = rng.randrange(len(data))
+        new_data = rng.choice([rng.randbytes(rng.randrange(1, 100)), clean[offset : offset + 100]])
+        new_data = new_data[: len(data) - offset]
+        data[offset : offset + len(new_data)] = new_data
+        tree.update(offset, len(new_data), len(new_data))
+        segments = tree.modified_segments()
+        for idx, (value, clean_value) in enumerate(zip(data, clean)):
+            assert value == clean_value or any(idx in segment for segment in segments)
+    data[:] = clean
+    tree.update(0, len(data), len(data))
+    assert not tree.modified_segments()
+
+
+@pytest.mark.parametrize("offset", [0, 100, 512])
+def test_merkle_insert_delete(offset):
+    """Test inserts and deletes resize leaves and keep digests valid."""
+    data = bytearray(range(256)) * 2
+    tree = make_tree(data)
+    original_root = tree.root
+    data[offset:offset] = b"x" * 200
+    tree.update(offset, 0, 200)
+    assert tree.size == len(data)
+    assert tree.root == expected_root(data, tree)
+    assert sum(map(len, tree.leaves())) == len(data)
+    del data[offset : offset + 200]
+    tree.update(offset, 200, 0)
+    assert tree.root == expected_root(data, tree)
+    assert tree.root == original_root
+    assert not tree.modified_segments()
+
+
+def test_merkle_edit_undo():
+    """Test edits followed by undoing them restore the tree built from the clean data."""
+    data = bytearray(random.Random(5).randbytes(512))
+    tree = make_tree(data, leaf_size=256)
+    original_root = tree.root
+    deleted = data[240:304]
+    del data[240:304]
+    tree.update(240, 64, 0)
+    replaced = data[48:112]
+    data[48:112] = b"z" * 16
+    tree.update(48, 64, 16)
+    assert tree.modified_segments()
+    data[48:64] = replaced
+    tree.update(48, 16, 64)
+    data[240:240] = deleted
+    tree.update(240, 0, 64)
+    assert not tree.modified_segments()
+    assert tree.root == original_root == make_tree(data, leaf_size=256).root
+
+
+def test_merkle_random_edits():
+    """Test tree consistency after a series of random edits."""
+    rng = random.Random(1234)
+    data = bytearray(rng.randbytes(4096))
+    tree = make_tree(data)
+    for _ in range(200):
+        offset = rng.randrange(len(data) + 1)
+        old_length = rng.randrange(min(300, len(data) - offset) + 1)
+        new_data = rng.randbytes(rng.randrange(300))
+        data[offset : offset + old_length] = new_data
+        tree.update(offset, old_length, len(new_data))
+        assert tree.root == expected_root(data, tree)
+        assert tree.leaves() == make_tree(data).leaves()
+    tree.mark_clean()
+    assert not tree.modified_segments()
+
+
+def test_merkle_invalid_leaf_size():
+    """Test invalid leaf size."""
+    with pytest.raises(ValueError):
+        MerkleTree(lambda offset, length: b"", 0, leaf_size=0)
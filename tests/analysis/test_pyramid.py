@@ -0,0 +1,86 @@
+"""Unit tests for the overview pyramid."""
+import random
+
+import numpy as np
+import pytest
+
+from hexabyte.analysis import Metric, OverviewPyramid
+from hexabyte.data_sources import DataSnapshot
+
+LEVEL_SIZES = (256, 1024, 4096)
+
+
+def make_pyramid(data: bytearray) -> OverviewPyramid:
+    """Create a pyramid over a mutable buffer."""
+    return OverviewPyramid(lambda offset, length: data[offset : offset + length], len(data), LEVEL_SIZES)
+
+
+def test_pyramid_levels():
+    """Test statistics of every level."""
+    data = bytearray(bytes(4096) + bytes(range(256)) * 16 + b"\xff" * 100)
+    pyramid = make_pyramid(data)
+    assert [len(level) for level in pyramid.levels] == [33, 9, 3]
+    list(pyramid.analyze())
+    assert pyramid.complete
+    fine, middle, coarse = pyramid.levels
+    assert fine.zeros[:16].tolist() == [1.0] * 16
+    assert fine.entropy[16:32].tolist() == [1.0] * 16
+    assert fine.mean[32] == 1.0
+    assert middle.mean[4] == pytest.approx(0.5)
+    assert coarse.zeros.tolist() == pytest.approx([1.0, 1 / 256, 0.0])
+    assert coarse.entropy[1] == 1.0
+
+
+def test_pyramid_sample():
+    """Test sampling any range produces one value per cell."""
+    rng = random.Random(0)
+    data = bytearray(bytes(8192) + rng.randbytes(8192))
+    pyramid = make_pyramid(data)
+    list(pyramid.analyze())
+    whole = pyramid.sample(Metric.ENTROPY, 0, len(data), 4)
+    assert whole[:2].tolist() == [0.0, 0.0]
+    assert (whole[2:] > 0.9).all()
+    assert pyramid.level_for(len(data) / 4).block_size == 4096
+    zoomed = pyramid.sample(Metric.ZEROS, 8000, 400, 100)
+    assert zoomed.shape == (100,)
+    assert zoomed[0] == 1.0
+    assert zoomed[-1] < 0.1
+    assert pyramid.sample(Metric.MEAN, 0, 0, 10).tolist() == [0.0] * 10
+
+
+def test_pyramid_update():
+    """Test edits only invalidate touched top level blocks."""
+    data = bytearray(bytes(16384))
+    pyramid = make_pyramid(data)
+    list(pyramid.analyze())
+    data[5000:5010] = b"\xff" * 10
+    pyramid.update(5000, 10, 10)
+    assert pyramid.progress == 0.75
+    list(pyramid.analyze())
+    assert pyramid.levels[0].mean[19] > 0
+    data[100:100] = b"\x01" * 4096
+    pyramid.update(100, 0, 4096)
+    assert pyramid.progress == 0
+    assert len(pyramid.levels[-1]) == 5
+    list(pyramid.analyze())
+    assert np.count_nonzero(pyramid.levels[0].mean) == 18
+
+
+def test_pyramid_invalid_levels():
+    """Test level sizes must be multiples."""
+    with pytest.raises(ValueError):
+        OverviewPyramid(bytes, 10, (256, 1000))
+
+
+def test_pyramid_analyze_snapshot():
+    """Test analysis reads the snapshot and stops once it is stale."""
+    data = bytearray(bytes(8192))
+    versions = [0]
+    snapshot = DataSnapshot(lambda offset, length: b"\xff" * length, len(data), 0, lambda: versions[0])
+    pyramid = make_pyramid(data)
+    progress = pyramid.analyze(snapshot)
+    next(progress)
+    assert pyramid.levels[0].mean[0] == 1.0
+    versions[0] += 1
+    assert not list(progress)
+    assert not pyramid.complete
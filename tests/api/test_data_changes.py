@@ -0,0 +1,65 @@
+"""Unit tests for data change notifications."""
+import pytest
+
+from hexabyte.analysis import MerkleTree
+from hexabyte.api import DataAPI
+from hexabyte.commands import CommandParser
+from hexabyte.data_sources import DataChange, PagedDataSource, SimpleDataSource
+
+TEST_DATA = bytes(range(256))
+
+
+@pytest.fixture(params=[SimpleDataSource, PagedDataSource])
+def source_class(request):
+    """Provide each data source type."""
+    return request.param
+
+
+def do(api: DataAPI, cmd: str) -> None:
+    """Parse and perform a command."""
+    for action in CommandParser().parse(cmd):
+        api.do(action)
+
+
+def test_data_changes(api):
+    """Test subscribers receive the range and version of each modification once."""
+    changes: list[DataChange] = []
+    api.subscribe("test", changes.append)
+    do(api, "set 0x10 0xff")
+    api.read_at(0x10, 1)
+    do(api, "insert 0x20 0x00")
+    api.seek(0x30)
+    api.delete(4)
+    do(api, "goto 0x40")
+    assert [(change.offset, change.old_length, change.new_length) for change in changes] == [
+        (0x10, 1, 1),
+        (0x20, 0, 1),
+        (0x30, 4, 0),
+    ]
+    assert [change.version for change in changes] == list(range(api.version - 2, api.version + 1))
+    api.unsubscribe("test")
+    do(api, "set 0x10 0x00")
+    assert len(changes) == 3
+
+
+def test_derived_data_updates(api):
+    """Test derived data subscribed to modifications reads the modified data."""
+    merkle = api.merkle
+    digest = merkle.hexdigest()
+    assert api.viewport.read(0x80, 4) == TEST_DATA[0x80:0x84]
+    do(api, "set 0x80 0x00")
+    assert api.viewport.read(0x80, 4) == b"\x00" + TEST_DATA[0x81:0x84]
+    assert merkle.hexdigest() != digest
+    do(api, "set 0x80 0x80")
+    assert merkle.hexdigest() == digest
+
+
+def test_snapshot_merkle(api):
+    """Test a merkle tree built from a snapshot follows the data once set on the api."""
+    snapshot = api.snapshot()
+    merkle = MerkleTree(snapshot.read, len(snapshot))
+    assert not api.has_merkle
+    api.merkle = merkle
+    do(api, "insert 0x10 0xaa")
+    assert merkle.size == len(TEST_DATA) + 1
+    assert merkle.root == MerkleTree(api.read_at, len(api)).root
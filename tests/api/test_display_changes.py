@@ -0,0 +1,38 @@
+"""Unit tests for logged display changes."""
+import sys
+
+from hexabyte.api import DataAPI
+from hexabyte.commands import CommandParser
+
+
+def do(api: DataAPI, cmd: str) -> None:
+    """Parse and perform a command."""
+    for action in CommandParser().parse(cmd):
+        api.do(action)
+
+
+def test_changed_ranges(api):
+    """Test commands log the byte ranges they changed."""
+    count = api.change_count
+    assert api.changed_since(count) is None
+    do(api, "goto 0x80")
+    assert api.changed_since(count) is None
+    do(api, "set 0x10 0xff")
+    assert api.changed_since(count) == (0x10, 0x11)
+    do(api, "select 0x20 4")
+    assert api.changed_since(count) == (0x10, 0x24)
+    count = api.change_count
+    do(api, "select 0x30 2")
+    assert api.changed_since(count) == (0x20, 0x32)
+    count = api.change_count
+    do(api, "insert 0x40 0x00")
+    assert api.changed_since(count) == (0x40, sys.maxsize)
+
+
+def test_overflowed_log(api):
+    """Test the whole data range is returned once changes are no longer logged."""
+    count = api.change_count
+    for offset in range(DataAPI.CHANGE_LOG_SIZE + 1):
+        do(api, f"set {offset} 0")
+    assert api.changed_since(count) == (0, sys.maxsize)
+    assert api.changed_since(api.change_count - 2) == (DataAPI.CHANGE_LOG_SIZE - 1, DataAPI.CHANGE_LOG_SIZE + 1)
@@ -0,0 +1 @@
+"""Unit tests for command parsing and lazy registration."""
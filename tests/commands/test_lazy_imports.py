@@ -0,0 +1,88 @@
+"""Unit tests for lazy imports and the modules imported by the entry point."""
+import subprocess
+import sys
+
+import pytest
+
+from hexabyte.actions.api import API_ACTIONS
+from hexabyte.commands import CommandParser
+from hexabyte.utils import import_object
+from hexabyte.widgets.sidebar import load_sidebar_panel, sidebar_panels
+from hexabyte.widgets.sidebar_panel import SidebarPanel
+
+# Package modules imported by hexabyte.__main__ before any mode is selected
+ENTRY_POINT_MODULES = {
+    "hexabyte",
+    "hexabyte.__main__",
+    "hexabyte.constants",
+    "hexabyte.constants.enums",
+    "hexabyte.constants.generic",
+}
+ENTRY_POINT_EXCLUDED = ("textual", "numpy", "munch", "hexabyte.hexabyte_app")
+APP_EXCLUDED = ("numpy", "hilbertcurve", "markdown_it", "hexabyte.actions.api.find", "hexabyte.analysis.entropy")
+PATCH_EXCLUDED = ("textual", "numpy")
+
+
+def imported_modules(module: str) -> set[str]:
+    """Return the modules imported by a fresh interpreter importing module."""
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, check=True, text=True)
+    return set(result.stdout.split())
+
+
+def test_api_action_manifest():
+    """Test every manifest entry resolves to the action of its command."""
+    for cmd, path in API_ACTIONS.items():
+        assert import_object(path).CMD == cmd
+
+
+def test_create_manifest_action():
+    """Test actions listed in a manifest are imported on first use."""
+    parser = CommandParser()
+    parser.register_manifest({"lazygoto": "hexabyte.actions.api.goto:Goto"})
+    action = parser.parse_one("lazygoto 10")
+    assert type(action).__name__ == "Goto"
+    assert "lazygoto" not in parser._manifest  # pylint: disable=protected-access
+    assert type(parser.parse_one("lazygoto 20")) is type(action)
+    parser._cmd_map.pop("lazygoto")  # pylint: disable=protected-access
+
+
+def test_entry_point_imports():
+    """Test the entry point does not import the application."""
+    modules = imported_modules("hexabyte.__main__")
+    for module in ENTRY_POINT_EXCLUDED:
+        assert module not in modules
+
+
+def test_app_imports():
+    """Test analysis engines, unused actions and help text parsing are not imported with the application."""
+    modules = imported_modules("hexabyte.hexabyte_app")
+    for module in APP_EXCLUDED:
+        assert module not in modules
+
+
+def test_entry_point_package_imports():
+    """Test the entry point only imports the package modules needed for argument handling."""
+    modules = imported_modules("hexabyte.__main__")
+    assert {module for module in modules if module.split(".")[0] == "hexabyte"} == ENTRY_POINT_MODULES
+
+
+def test_import_object():
+    """Test importing objects from paths."""
+    assert import_object("hexabyte.utils:import_object") is import_object
+    assert import_object("hexabyte.utils").import_object is import_object
+    with pytest.raises(AttributeError):
+        import_object("hexabyte.utils:missing")
+
+
+def test_sidebar_panel_manifest():
+    """Test registered sidebar panels resolve to panel classes."""
+    for name in list(sidebar_panels):
+        assert issubclass(load_sidebar_panel(name), SidebarPanel)
+
+
+def test_patch_imports():
+    """Test batch patching does not import the TUI."""
+    modules = imported_modules("hexabyte.patch")
+    for module in PATCH_EXCLUDED:
+        assert module not in modules
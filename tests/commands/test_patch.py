@@ -0,0 +1,81 @@
+"""Unit tests for batch patching."""
+import pytest
+
+from hexabyte.patch import Patch, PatchResult, load_patches, patch_file, patch_files
+
+DATA = bytes(range(256)) * 4
+
+
+@pytest.fixture
+def filepaths(tmp_path):
+    """Create files of test data."""
+    paths = [tmp_path / f"data{idx}.bin" for idx in range(4)]
+    for path in paths:
+        path.write_bytes(DATA)
+    return paths
+
+
+def test_patch_validation():
+    """Test invalid patches are rejected."""
+    with pytest.raises(ValueError):
+        Patch(b"\x00")
+    with pytest.raises(ValueError):
+        Patch(b"\x00", offset=0, find=b"\x00")
+    with pytest.raises(ValueError):
+        Patch(b"\x00", find=b"")
+    with pytest.raises(ValueError):
+        Patch(b"\x00", offset=-1)
+
+
+def test_load_patches(tmp_path):
+    """Test patch specifications are parsed."""
+    spec = tmp_path / "patch.toml"
+    spec.write_text('[[patch]]\noffset = 0x10\ndata = "aa bb"\n\n[[patch]]\nfind = "0102"\nreplace = "ff"\ncount = 1\n')
+    assert load_patches(spec) == [Patch(b"\xaa\xbb", offset=0x10), Patch(b"\xff", find=b"\x01\x02", count=1)]
+
+
+def test_patch_file(filepaths):  # pylint: disable=redefined-outer-name
+    """Test offset and search/replace patches are applied and saved."""
+    patches = [Patch(b"\xaa\xbb", offset=0x10), Patch(b"\xff", find=b"\x01\x02", count=3)]
+    result = patch_file(patches, filepaths[0])
+    assert result.error is None
+    assert result.patched == 4
+    data = filepaths[0].read_bytes()
+    # The first replacement at offset 1 shortens the data before the offset patch
+    assert data[0xF:0x11] == b"\xaa\xbb"
+    assert data.count(b"\x00\xff\x03") == 3
+    assert len(data) == len(DATA) - 3
+
+
+def test_patch_file_errors(filepaths):  # pylint: disable=redefined-outer-name
+    """Test failed patches do not modify the file."""
+    result = patch_file([Patch(b"\xaa", offset=0), Patch(b"\xaa", offset=len(DATA))], filepaths[0])
+    assert result.error is not None
+    assert "error" in str(result)
+    assert filepaths[0].read_bytes() == DATA
+
+
+def test_patch_files(filepaths):  # pylint: disable=redefined-outer-name
+    """Test files are patched in parallel and results keep file order."""
+    results = list(patch_files([Patch(b"\xaa", offset=0)], filepaths, jobs=2))
+    assert [result.filepath for result in results] == filepaths
+    assert all(isinstance(result, PatchResult) and result.error is None for result in results)
+    assert all(path.read_bytes()[0] == 0xAA for path in filepaths)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        'offset = 0x10\ndata = "aa"\n\n[[patch]]\noffset = 0x20\n',
+        'offset = 0x10\ndata = "aa"\n\n[[patch]]\nfind = "01"\n',
+        'offset = 0x10\ndata = "aa"\n\n[[patch]]\noffset = "0x20"\ndata = "aa"\n',
+        'offset = 0x10\ndata = "aa"\n\n[[patch]]\noffset = 0x20\ndata = 0xaa\n',
+        'offset = 0x10\ndata = "aa"\n\n[[patch]]\nfind = "01"\nreplace = "ff"\ncount = "1"\n',
+    ],
+)
+def test_load_patches_malformed(tmp_path, spec):
+    """Test malformed patch specifications report the patch index."""
+    spec_filepath = tmp_path / "patch.toml"
+    spec_filepath.write_text(f"[[patch]]\n{spec}")
+    with pytest.raises(ValueError, match="Invalid patch 1"):
+        load_patches(spec_filepath)
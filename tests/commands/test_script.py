@@ -0,0 +1,55 @@
+"""Unit tests for headless script mode."""
+from pathlib import Path
+
+from hexabyte.script import ScriptResult, read_script, run_script, run_scripts
+
+DATA = bytes(range(256)) * 4
+
+
+def write_script(path: Path, text: str) -> list[tuple[int, str]]:
+    """Write and read a script file."""
+    path.write_text(text, encoding="utf8")
+    return read_script(path)
+
+
+def test_read_script(tmp_path):
+    """Test comments and blank lines are skipped."""
+    script = write_script(tmp_path / "cmds.hbx", "# comment\n\ngoto 0x10\n  set 0 1; save  \n")
+    assert script == [(3, "goto 0x10"), (4, "set 0 1; save")]
+
+
+def test_run_script(tmp_path):
+    """Test commands are applied and saved."""
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(DATA)
+    script = write_script(tmp_path / "cmds.hbx", "set 0x10 0xaa; set 0x11 0xbb\nsave\n")
+    result = run_script(script, filepath)
+    assert result == ScriptResult(filepath, actions=3)
+    assert filepath.read_bytes()[0x10:0x12] == b"\xaa\xbb"
+
+
+def test_run_script_errors(tmp_path):
+    """Test scripts stop at the first failed command without saving."""
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(DATA)
+    script = write_script(tmp_path / "cmds.hbx", "set 0 1\nbogus\nsave\n")
+    result = run_script(script, filepath)
+    assert result.actions == 1
+    assert result.error == "line 2: Invalid Command"
+    assert filepath.read_bytes() == DATA
+    result = run_script(write_script(tmp_path / "cmds.hbx", "set 0 1\n"), filepath)
+    assert result.modified
+    assert "discarded" in str(result)
+    assert run_script(script, tmp_path / "missing.bin").error is not None
+
+
+def test_run_scripts(tmp_path):
+    """Test files are processed in parallel and results keep file order."""
+    filepaths = [tmp_path / f"data{idx}.bin" for idx in range(4)]
+    for filepath in filepaths:
+        filepath.write_bytes(DATA)
+    script = write_script(tmp_path / "cmds.hbx", "set 0 0xff\nsave\n")
+    results = list(run_scripts(script, filepaths, jobs=2))
+    assert [result.filepath for result in results] == filepaths
+    assert all(result.error is None for result in results)
+    assert all(filepath.read_bytes()[0] == 0xFF for filepath in filepaths)
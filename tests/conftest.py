@@ -0,0 +1,33 @@
+"""Shared test fixtures."""
+import pytest
+
+from hexabyte.api import DataAPI
+from hexabyte.config import Config
+from hexabyte.context import context
+
+
+@pytest.fixture(autouse=True)
+def config() -> Config:
+    """Provide default settings to data apis."""
+    context.config = Config()
+    return context.config
+
+
+@pytest.fixture
+def data() -> bytes:
+    """Return the data of the file opened by the api fixture."""
+    return bytes(range(256))
+
+
+@pytest.fixture
+def source_class():
+    """Return the data source class used by the api fixture, or None to select it by file size."""
+    return None
+
+
+@pytest.fixture
+def api(tmp_path, data, source_class) -> DataAPI:  # pylint: disable=redefined-outer-name
+    """Provide a data api of a file containing data."""
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(data)
+    return DataAPI(filepath, source_class)
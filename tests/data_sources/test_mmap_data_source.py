@@ -0,0 +1,98 @@
+"""Unit tests for MmapDataSource class."""
+import mmap
+
+import pytest
+
+from hexabyte.data_sources import MmapDataSource
+from hexabyte.data_sources.mmap_data_source import PAGE_SIZE
+
+TEST_DATA = b"abcdefghijklmnopqrstuvwxyz\x0a\x0b\x0c\x0d\x0e\x0f\x00"
+
+
+@pytest.fixture
+def source(tmp_path):
+    """Create a memory mapped data source of test data."""
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(TEST_DATA)
+    return MmapDataSource(filepath)
+
+
+def test_source_read(source):  # pylint: disable=redefined-outer-name
+    """Test reads from a memory mapped data source."""
+    assert len(source) == len(TEST_DATA)
+    assert source.read() == TEST_DATA
+    assert source.read(0x10, 0x8) == TEST_DATA[0x10:0x18]
+    assert source.find(b"xyz") == TEST_DATA.find(b"xyz")
+    assert source.find(b"a", len(TEST_DATA), reverse=True) == 0
+
+
+def test_source_overwrite(source):  # pylint: disable=redefined-outer-name
+    """Test overwrites only modify the private mapping."""
+    source.write(0x8, b"ZZZ")
+    assert source.modified
+    assert source.read() == TEST_DATA[:8] + b"ZZZ" + TEST_DATA[11:]
+    assert source.filepath.read_bytes() == TEST_DATA
+
+
+def test_source_resize(source):  # pylint: disable=redefined-outer-name
+    """Test inserts, deletes and writes past the end."""
+    source.write(0x8, b"ZZZ", True)
+    assert source.read() == TEST_DATA[:8] + b"ZZZ" + TEST_DATA[8:]
+    source.replace(0x8, 3, b"")
+    assert source.read() == TEST_DATA
+    source.write(len(TEST_DATA), b"ZZZ")
+    assert source.read() == TEST_DATA + b"ZZZ"
+
+
+def test_source_save(source, tmp_path):  # pylint: disable=redefined-outer-name
+    """Test saving in place and to a new file."""
+    source.write(0, b"ZZZ")
+    source.save()
+    assert not source.modified
+    assert source.filepath.read_bytes() == b"ZZZ" + TEST_DATA[3:]
+    source.write(0, b"Y", True)
+    source.save(tmp_path / "new.bin")
+    assert source.filepath == tmp_path / "new.bin"
+    assert source.read() == b"YZZZ" + TEST_DATA[3:]
+
+
+def test_source_empty(tmp_path):
+    """Test empty files can be opened and extended."""
+    filepath = tmp_path / "empty.bin"
+    filepath.write_bytes(b"")
+    source = MmapDataSource(filepath)
+    assert not source.read()
+    source.write(0, b"ZZZ")
+    assert source.read() == b"ZZZ"
+
+
+def test_source_snapshot(source):  # pylint: disable=redefined-outer-name
+    """Test snapshots keep the mapped data of their version while the source is modified."""
+    snapshot = source.snapshot()
+    source.write(0, b"XY")
+    assert snapshot.read(0, 4) == TEST_DATA[:4]
+    assert source.read(0, 4) == b"XYcd"
+    snapshot = source.snapshot()
+    source.replace(0, 2, b"")
+    assert snapshot.read(0, 4) == b"XYcd"
+    assert source.read(0, 4) == TEST_DATA[2:6]
+    assert snapshot.stale
+
+
+def test_source_snapshot_pages(tmp_path):
+    """Test snapshots of mapped data only copy modified pages and the source stays mapped."""
+    data = bytes(range(256)) * (3 * PAGE_SIZE // 256)
+    filepath = tmp_path / "pages.bin"
+    filepath.write_bytes(data)
+    source = MmapDataSource(filepath)
+    source.write(PAGE_SIZE - 2, b"ZZZZ")
+    expected = data[: PAGE_SIZE - 2] + b"ZZZZ" + data[PAGE_SIZE + 2 :]
+    snapshot = source.snapshot()
+    source.write(0, b"YY")
+    source.write(2 * PAGE_SIZE, b"YY")
+    assert isinstance(source._data, mmap.mmap)  # pylint: disable=protected-access
+    assert snapshot.read(0, len(data)) == expected
+    assert snapshot.read(PAGE_SIZE - 4, 8) == expected[PAGE_SIZE - 4 : PAGE_SIZE + 4]
+    assert snapshot.read(2 * PAGE_SIZE, 4) == data[2 * PAGE_SIZE : 2 * PAGE_SIZE + 4]
+    source.save()
+    assert snapshot.read(0, 4) == expected[:4]
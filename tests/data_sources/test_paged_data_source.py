@@ -0,0 +1,141 @@
+"""Unit tests for PagedDataSource class."""
+import random
+
+import pytest
+
+from hexabyte.data_sources import PagedDataSource
+
+TEST_DATA = b"abcdefghijklmnopqrstuvwxyz\x0a\x0b\x0c\x0d\x0e\x0f\x00" * 20
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    """Create a test data file."""
+    filepath = tmp_path / "paged.data"
+    filepath.write_bytes(TEST_DATA)
+    return filepath
+
+
+def test_source_read(data_file):  # pylint: disable=redefined-outer-name
+    """Test reads spanning blocks."""
+    source = PagedDataSource(data_file, block_size=16)
+    assert len(source) == len(TEST_DATA)
+    assert source.read() == TEST_DATA
+    assert source.read(length=0x10) == TEST_DATA[:0x10]
+    assert source.read(0x10) == TEST_DATA[0x10:]
+    assert source.read(0xE, 0x28) == TEST_DATA[0xE:0x36]
+    assert source.read(len(TEST_DATA) + 1) == b""
+    with pytest.raises(ValueError):
+        source.read(-1)
+
+
+def test_source_reduce(data_file):  # pylint: disable=redefined-outer-name
+    """Test clean blocks are unloaded after the threshhold is reached."""
+    source = PagedDataSource(data_file, block_size=1)
+    assert source.read() == TEST_DATA
+    assert sum(block.loaded for block in source._blocks) <= 128  # pylint: disable=protected-access
+    source.reduce()
+    assert not any(block.loaded for block in source._blocks)  # pylint: disable=protected-access
+    assert source.read(100, 10) == TEST_DATA[100:110]
+
+
+@pytest.mark.parametrize("block_size", [1, 7, 64, 4096])
+def test_source_random_edits(data_file, block_size):  # pylint: disable=redefined-outer-name
+    """Test writes and replaces match bytearray behavior."""
+    rng = random.Random(block_size)
+    source = PagedDataSource(data_file, block_size=block_size)
+    expected = bytearray(TEST_DATA)
+    for _ in range(50):
+        offset = rng.randrange(len(expected) + 1)
+        data = rng.randbytes(rng.randrange(20))
+        choice = rng.randrange(3)
+        if choice == 0:
+            length = rng.randrange(20)
+            source.replace(offset, length, data)
+            expected[offset : offset + length] = data
+        else:
+            source.write(offset, data, insert=choice == 1)
+            if choice == 1:
+                expected[offset:offset] = data
+            else:
+                expected[offset : offset + len(data)] = data
+        assert len(source) == len(expected)
+    assert source.modified
+    assert source.read() == expected
+
+
+def test_source_replace_splits_blocks(data_file):  # pylint: disable=redefined-outer-name
+    """Test large replaces are split back into blocks bounded by the block size."""
+    source = PagedDataSource(data_file, block_size=16)
+    expected = bytearray(TEST_DATA)
+    source.replace(5, len(TEST_DATA) - 10, TEST_DATA[5:-5].replace(b"a", b"AA"))
+    expected[5:-5] = TEST_DATA[5:-5].replace(b"a", b"AA")
+    source.write(3, b"xyz", insert=True)
+    expected[3:3] = b"xyz"
+    assert source.read() == expected
+    assert max(len(block) for block in source._blocks) < 32  # pylint: disable=protected-access
+
+
+def test_source_find(data_file):  # pylint: disable=redefined-outer-name
+    """Test forward and reverse searches."""
+    source = PagedDataSource(data_file, block_size=5)
+    for start in (0, 10, 100, len(TEST_DATA)):
+        assert source.find(b"xyz", start) == TEST_DATA.find(b"xyz", start)
+        assert source.find(b"xyz", start, reverse=True) == TEST_DATA.rfind(b"xyz", 0, start)
+    assert source.find(b"missing") == -1
+    assert source.find(b"missing", len(TEST_DATA), reverse=True) == -1
+
+
+def test_source_save(data_file, tmp_path):  # pylint: disable=redefined-outer-name
+    """Test saving in place and to a new file."""
+    source = PagedDataSource(data_file, block_size=16)
+    source.write(0, b"ZZZ", insert=True)
+    source.save()
+    assert not source.modified
+    assert data_file.read_bytes() == b"ZZZ" + TEST_DATA
+    assert source.read() == b"ZZZ" + TEST_DATA
+    source.write(len(source), b"end")
+    new_filepath = tmp_path / "new.data"
+    source.save(new_filepath)
+    assert source.filepath == new_filepath
+    assert new_filepath.read_bytes() == b"ZZZ" + TEST_DATA + b"end"
+
+
+def test_source_is_loaded(data_file):  # pylint: disable=redefined-outer-name
+    """Test ranges are loaded once every overlapping block was read."""
+    source = PagedDataSource(data_file, block_size=16)
+    assert not source.is_loaded(0, 32)
+    source.read(0, 20)
+    assert source.is_loaded(0, 32)
+    assert not source.is_loaded(30, 4)
+
+
+def test_source_snapshot(data_file):  # pylint: disable=redefined-outer-name
+    """Test snapshots share unmodified blocks and survive edits, reduces and saves."""
+    source = PagedDataSource(data_file, block_size=16)
+    source.read(0, 32)
+    snapshot = source.snapshot()
+    source.replace(10, 20, b"")
+    source.write(0, b"XYZ", insert=True)
+    source.reduce()
+    assert snapshot.read(0, len(TEST_DATA)) == TEST_DATA
+    assert snapshot.read(5, 40) == TEST_DATA[5:45]
+    source.save()
+    assert snapshot.read(100, 40) == TEST_DATA[100:140]
+    assert snapshot.stale
+    assert source.read(0, 13) == b"XYZ" + TEST_DATA[:10]
+
+
+def test_source_changes(data_file):  # pylint: disable=redefined-outer-name
+    """Test subscribers are notified of modified ranges clamped to the data."""
+    source = PagedDataSource(data_file, block_size=16)
+    changes = []
+    source.subscribe("test", changes.append)
+    source.write(4, b"xyz", insert=True)
+    source.replace(len(source) - 2, 10, b"")
+    source.unsubscribe("test")
+    source.write(0, b"a")
+    assert [(change.offset, change.old_length, change.new_length, change.version) for change in changes] == [
+        (4, 0, 3, 1),
+        (len(TEST_DATA) + 1, 2, 0, 2),
+    ]
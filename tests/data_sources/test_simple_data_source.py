@@ -122,3 +122,17 @@ def test_source_save(
     file_mock.assert_called_once_with(Files.UTF8.value, "rb")
     # mock_handle = file_mock()
     # mock_handle.write.assert_called_once_with(TEST_DATA)
+
+
+def test_source_snapshot(file_mock):  # pylint: disable=unused-argument,redefined-outer-name
+    """Test snapshots keep the data of their version while the source is modified."""
+    source = SimpleDataSource(Files.UTF8.value)
+    snapshot = source.snapshot()
+    source.write(0, b"XYZ")
+    source.write(3, b"!", insert=True)
+    assert snapshot.read(0, 8) == TEST_DATA[:8]
+    assert len(snapshot) == len(TEST_DATA)
+    assert snapshot.stale
+    assert source.version == 2
+    assert source.read(0, 5) == b"XYZ!d"
+    assert not source.snapshot().stale
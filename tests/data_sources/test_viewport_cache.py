@@ -0,0 +1,123 @@
+"""Unit tests for ViewportCache class."""
+import threading
+
+import pytest
+
+from hexabyte.data_sources import ViewportCache
+
+TEST_DATA = bytes(range(256)) * 40
+
+
+class CountingReader:  # pylint: disable=too-few-public-methods
+    """Reader that records each read."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize reader."""
+        self.data = data
+        self.reads: list[tuple[int, int]] = []
+
+    def __call__(self, offset: int, length: int) -> bytes:
+        """Return data range."""
+        self.reads.append((offset, length))
+        return self.data[offset : offset + length]
+
+
+def test_viewport_cache_shared_window():
+    """Test views reserving spans are served by a single aligned read."""
+    reader = CountingReader(TEST_DATA)
+    cache = ViewportCache(reader, alignment=1024)
+    cache.reserve("primary", 512)
+    cache.reserve("secondary", 1500)
+    for offset in range(1100, 1100 + 512, 16):
+        assert cache.read(offset, 16) == TEST_DATA[offset : offset + 16]
+    for offset in range(1100, 1100 + 1500, 32):
+        assert cache.read(offset, 32) == TEST_DATA[offset : offset + 32]
+    assert reader.reads == [(1024, 2048)]
+    assert cache.window == (1024, 2048)
+    assert cache.misses == 1
+
+
+def test_viewport_cache_end_of_data():
+    """Test reads past the end of data do not refetch."""
+    reader = CountingReader(TEST_DATA)
+    cache = ViewportCache(reader, alignment=4096)
+    size = len(TEST_DATA)
+    assert cache.read(size - 8, 16) == TEST_DATA[-8:]
+    assert cache.read(size + 8, 16) == b""
+    assert len(reader.reads) == 1
+
+
+def test_viewport_cache_invalidate():
+    """Test invalidated windows are fetched again."""
+    data = bytearray(TEST_DATA)
+    reader = CountingReader(data)
+    cache = ViewportCache(reader)
+    assert cache.read(0, 4) == b"\x00\x01\x02\x03"
+    data[0] = 0xFF
+    assert cache.read(0, 4) == b"\x00\x01\x02\x03"
+    cache.invalidate()
+    assert cache.read(0, 4) == b"\xff\x01\x02\x03"
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_viewport_cache_release():
+    """Test released views no longer enlarge the window."""
+    cache = ViewportCache(CountingReader(TEST_DATA), alignment=16)
+    cache.reserve("view", 1000)
+    assert cache.span == 1000
+    cache.release("view")
+    assert cache.span == 0
+    with pytest.raises(ValueError):
+        ViewportCache(CountingReader(TEST_DATA), alignment=0)
+
+
+def test_viewport_cache_read_nowait():
+    """Test unloaded windows are fetched in the background and listeners are notified."""
+    reader = CountingReader(TEST_DATA)
+    loaded: set[tuple[int, int]] = set()
+    fetched = threading.Event()
+    cache = ViewportCache(reader, alignment=1024, loaded=lambda offset, length: (offset, length) in loaded)
+
+    def on_fetched(start: int, stop: int) -> None:
+        loaded.add((start, stop - start))
+        fetched.set()
+
+    cache.listen("primary", on_fetched)
+    assert cache.read_nowait(100, 16) is None
+    assert fetched.wait(5)
+    assert reader.reads == [(0, 1024)]
+    assert cache.read_nowait(100, 16) == TEST_DATA[100:116]
+    cache.release("primary")
+    fetched.clear()
+    assert cache.read_nowait(2048, 16) is None
+    assert not fetched.wait(0.2)
+
+
+def test_viewport_cache_loader():
+    """Test background fetches use the loader rather than the reader."""
+    reader = CountingReader(TEST_DATA)
+    loader = CountingReader(TEST_DATA)
+    fetched = threading.Event()
+    cache = ViewportCache(reader, alignment=1024, loaded=lambda offset, length: False, loader=loader)
+    cache.listen("primary", lambda start, stop: fetched.set())
+    assert cache.read_nowait(100, 16) is None
+    assert fetched.wait(5)
+    assert loader.reads == [(0, 1024)]
+    assert not reader.reads
+
+
+def test_viewport_cache_update():
+    """Test modifications only discard the window if they change it."""
+    reader = CountingReader(TEST_DATA)
+    cache = ViewportCache(reader, alignment=1024)
+    cache.read(1100, 16)
+    cache.update(0, 16, 16)
+    cache.update(2048, 1, 1)
+    assert cache.read(1100, 16) == TEST_DATA[1100:1116]
+    assert cache.misses == 1
+    cache.update(2047, 1, 1)
+    cache.read(1100, 16)
+    cache.update(4096, 0, 1)
+    cache.read(1100, 16)
+    assert cache.misses == 3
@@ -0,0 +1,104 @@
+"""Unit tests for WriteBackCache class."""
+import pytest
+
+from hexabyte.api import DataAPI
+from hexabyte.data_sources import WriteBackCache
+
+TEST_DATA = bytes(range(256)) * 40
+
+
+class Backing:
+    """Mutable data recording each read and write."""
+
+    def __init__(self, data: bytes) -> None:
+        """Initialize backing data."""
+        self.data = bytearray(data)
+        self.reads: list[tuple[int, int]] = []
+        self.writes: list[tuple[int, bytes]] = []
+
+    def read(self, offset: int, length: int) -> bytearray:
+        """Return data range."""
+        self.reads.append((offset, length))
+        return self.data[offset : offset + length]
+
+    def write(self, offset: int, data: memoryview) -> None:
+        """Overwrite data range."""
+        self.writes.append((offset, bytes(data)))
+        self.data[offset : offset + len(data)] = data
+
+
+def test_write_back_cache_coalesces_writes():
+    """Test edits within a block are written back as a single range."""
+    backing = Backing(TEST_DATA)
+    cache = WriteBackCache(backing.read, backing.write, block_size=1024)
+    for offset in (1030, 1100, 1050):
+        assert cache.get(offset) == TEST_DATA[offset]
+        cache.set(offset, 0xAA)
+    assert backing.reads == [(1024, 1024)]
+    assert not backing.writes
+    assert cache.dirty
+    cache.flush()
+    assert not cache.dirty
+    assert backing.writes == [(1030, backing.data[1030:1101])]
+    assert backing.data[1100] == 0xAA
+    assert cache.hits == 5
+    assert cache.misses == 1
+
+
+def test_write_back_cache_miss_flushes():
+    """Test moving to another block writes back modifications first."""
+    backing = Backing(TEST_DATA)
+    cache = WriteBackCache(backing.read, backing.write, block_size=1024)
+    cache.set(10, 1)
+    assert cache.get(5000) == TEST_DATA[5000]
+    assert backing.writes == [(10, b"\x01")]
+    with pytest.raises(IndexError):
+        cache.get(len(TEST_DATA))
+    cache.set(20, 2)
+    cache.invalidate()
+    assert not cache.dirty
+    assert backing.data[20] == TEST_DATA[20]
+
+
+def test_api_set_byte(tmp_path):
+    """Test cached edits are visible to reads, searches and saves."""
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(TEST_DATA)
+    api = DataAPI(filepath)
+    version = api.version
+    api.set_byte(0x10, 0xAA)
+    api.set_byte(0x11, 0xBB)
+    assert api.modified
+    assert api.version == version + 2
+    assert api.get_byte(0x11) == 0xBB
+    assert api.read_at(0x10, 2) == b"\xaa\xbb"
+    api.set_byte(0x20, 0xCC)
+    assert api.find(b"\xcc") == 0x20
+    api.save()
+    assert filepath.read_bytes()[0x10:0x21] == b"\xaa\xbb" + TEST_DATA[0x12:0x20] + b"\xcc"
+    api.set_byte(0, 0xFF)
+    api.open(filepath)
+    assert not api.modified
+    assert api.get_byte(0) == 0
+
+
+def test_api_set_byte_renders(tmp_path):
+    """Test reads between cached edits overlay them instead of writing them back."""
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(TEST_DATA)
+    api = DataAPI(filepath)
+    assert api.merkle.root
+    writes = []
+    write = api._source.write  # pylint: disable=protected-access
+    api._source.write = lambda *args, **kwargs: writes.append(args) or write(*args, **kwargs)
+    expected = bytearray(TEST_DATA)
+    for offset in range(0x10, 0x1A):
+        api.set_byte(offset, 0xEE)
+        expected[offset] = 0xEE
+        assert api.viewport.read(0, 0x100) == expected[:0x100]
+    assert api.snapshot().read(0, len(expected)) == expected
+    assert not writes
+    api.save()
+    assert len(writes) == 1
+    assert filepath.read_bytes() == expected
+    assert not api.merkle.modified_segments()
@@ -0,0 +1,151 @@
+"""Unit tests for data templates."""
+import struct
+from pathlib import Path
+
+import pytest
+
+from hexabyte.api import DataAPI
+from hexabyte.templates import (
+    Array,
+    Field,
+    Struct,
+    Template,
+    TemplateError,
+    TemplateParser,
+    detect_template,
+    format_value,
+    load_templates,
+)
+
+ELF_FILEPATH = Path(__file__).parent.parent / "data" / "hello_world_x86-64"
+RECORD_COUNT = 1_000_000
+RECORDS = Template(
+    "records",
+    Struct(
+        "records",
+        (
+            Field("magic", "4s"),
+            Field("count", "I"),
+            Array("records", Struct("record", (Field("id", "I"), Field("value", "h"), Field("tag", "2s"))), "count"),
+        ),
+        "<",
+    ),
+    b"RECS",
+)
+
+
+class CountingReader:  # pylint: disable=too-few-public-methods
+    """Reader that counts bytes read."""
+
+    def __init__(self, data: bytearray) -> None:
+        """Initialize reader."""
+        self.data = data
+        self.bytes_read = 0
+
+    def __call__(self, offset: int, length: int) -> bytes:
+        """Return data range."""
+        self.bytes_read += length
+        return bytes(self.data[offset : offset + length])
+
+
+@pytest.fixture(name="records")
+def fixture_records():
+    """Provide a parser over a million records."""
+    data = bytearray(b"RECS" + struct.pack("<I", RECORD_COUNT) + bytes(8 * RECORD_COUNT))
+    struct.pack_into("<Ih2s", data, 8 + 8 * 500_000, 7, -2, b"ok")
+    reader = CountingReader(data)
+    return TemplateParser(RECORDS, reader, lambda: len(data)), reader
+
+
+def test_definitions():
+    """Test invalid definitions are rejected."""
+    assert RECORDS.root.static_size is None
+    assert Struct("s", (Field("a", "I"), Field("b", "8s"))).static_size == 12
+    with pytest.raises(TemplateError):
+        Field("bad", "Z")
+    with pytest.raises(TemplateError):
+        Struct("dup", (Field("a", "B"), Field("a", "B")))
+    with pytest.raises(TemplateError):
+        Array("nested", RECORDS.root, 2)
+
+
+def test_lazy_array(records):
+    """Test only the accessed records are parsed."""
+    parser, reader = records
+    array = parser.children(parser.root)[-1]
+    assert array.count == RECORD_COUNT
+    assert array.size == 8 * RECORD_COUNT
+    assert reader.bytes_read == 4
+    page = parser.children(array, 500_000, 500_002)
+    assert [node.path for node in page] == ["records[500000]", "records[500001]"]
+    fields = parser.children(page[0])
+    assert [parser.value(field) for field in fields] == [7, -2, b"ok"]
+    assert reader.bytes_read == 4 + 8
+    assert [node.path for node in parser.node_at(8 + 8 * 500_000 + 5)] == [
+        "",
+        "records",
+        "records[500000]",
+        "records[500000].value",
+    ]
+
+
+def test_invalidate(records):
+    """Test cached values overlapping modified data are discarded."""
+    parser, reader = records
+    field = parser.children(parser.children(parser.children(parser.root)[-1], 0, 1)[0])[0]
+    assert parser.value(field) == 0
+    reader.data[8] = 5
+    assert parser.value(field) == 0
+    parser.invalidate(8, 1, 1)
+    assert parser.value(field) == 5
+    struct.pack_into("<I", reader.data, 4, 3)
+    parser.invalidate(4, 4, 4)
+    assert parser.children(parser.root)[-1].count == 3
+    del reader.data[8:16]
+    parser.invalidate(8, 8, 0)
+    assert parser.value(field) == 0
+
+
+def test_load_templates():
+    """Test templates defined in config reference other definitions."""
+    definitions = {
+        "header": {
+            "magic": "52 45 43 53",
+            "endian": ">",
+            "fields": [
+                {"name": "magic", "format": "4s"},
+                {"name": "count", "format": "I"},
+                {"name": "records", "struct": "record", "count": "count", "at": 16},
+            ],
+        },
+        "record": {"fields": [{"name": "id", "format": "H"}]},
+    }
+    header = load_templates(definitions)[0]
+    assert header.magic == b"RECS"
+    data = b"RECS" + struct.pack(">I", 2) + bytes(8) + struct.pack(">HH", 1, 2)
+    parser = TemplateParser(header, lambda offset, length: data[offset : offset + length], lambda: len(data))
+    records = parser.children(parser.root)[-1]
+    assert records.offset == 16
+    assert [parser.value(parser.children(node)[0]) for node in parser.children(records)] == [1, 2]
+    with pytest.raises(TemplateError):
+        load_templates({"loop": {"fields": [{"name": "self", "struct": "loop"}]}})
+
+
+def test_elf_template(tmp_path):
+    """Test the builtin ELF template is detected and applied through the api."""
+    filepath = tmp_path / "elf"
+    filepath.write_bytes(ELF_FILEPATH.read_bytes())
+    api = DataAPI(filepath)
+    template = detect_template(bytes(api.read_at(0, 16)))
+    assert template is not None and template.name == "elf64"
+    api.apply_template(template.name)
+    parser = api.template
+    assert parser is not None
+    header = {node.name: node for node in parser.children(parser.root)}
+    assert parser.value(header["e_machine"]) == 0x3E
+    assert header["program_headers"].offset == parser.value(header["e_phoff"])
+    api.seek(header["e_machine"].offset)
+    api.write(b"\xb7\x00")
+    assert format_value(parser.value(header["e_machine"])) == "0xb7"
+    api.apply_template(None)
+    assert api.template is None
@@ -0,0 +1,40 @@
+"""Unit tests for navigation history."""
+import pytest
+
+from hexabyte.navigation import NavigationHistory
+
+
+def test_back_and_forward():
+    """Test stepping through recorded jumps."""
+    history = NavigationHistory()
+    assert history.back() is None
+    assert history.current is None
+    history.record(0, 100)
+    history.record(100, 200)
+    history.record(250, 300)
+    assert len(history) == 5
+    assert history.back() == 250
+    assert history.back() == 200
+    history.record(history.current, 200)
+    assert history.back() == 100
+    assert history.back() == 0
+    assert history.back() is None
+    assert history.forward() == 100
+    assert history.forward() == 200
+    history.record(210, 5000)
+    assert history.forward() is None
+    assert [history.back(), history.back(), history.back()] == [210, 200, 100]
+
+
+def test_ring_overwrites_oldest():
+    """Test the oldest positions are overwritten once full."""
+    history = NavigationHistory(capacity=4)
+    for offset in range(0, 1000, 100):
+        history.record(offset, offset + 100)
+    assert len(history) == history.capacity == 4
+    assert history.current == 1000
+    assert [history.back(), history.back(), history.back(), history.back()] == [900, 800, 700, None]
+    history.clear()
+    assert len(history) == 0
+    with pytest.raises(ValueError):
+        NavigationHistory(capacity=1)
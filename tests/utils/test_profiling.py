@@ -0,0 +1,75 @@
+"""Unit tests for profiling hooks."""
+import json
+
+import pytest
+
+from hexabyte.profiling import BUCKET_COUNT, Histogram, Profiler, profiled, profiler
+
+
+@pytest.fixture
+def enabled_profiler():
+    """Enable the shared profiler for the duration of a test."""
+    profiler.reset()
+    profiler.enabled = True
+    yield profiler
+    profiler.enabled = False
+    profiler.reset()
+
+
+def test_histogram():
+    """Test histogram summaries."""
+    histogram = Histogram()
+    assert histogram.mean == 0.0
+    assert histogram.percentile(0.5) == 0.0
+    for _ in range(99):
+        histogram.record(10e-6)
+    histogram.record(0.5)
+    assert histogram.count == 100
+    assert histogram.max == 0.5
+    assert histogram.mean == pytest.approx((99 * 10e-6 + 0.5) / 100)
+    assert 10e-6 <= histogram.percentile(0.5) <= 20e-6
+    assert histogram.percentile(1.0) == 0.5
+    histogram.record(1e9)
+    assert histogram.buckets[BUCKET_COUNT - 1] == 1
+    summary = histogram.to_dict()
+    assert summary["count"] == 101
+    assert summary["buckets"]["<16us"] == 99
+
+
+def test_profiler_disabled():
+    """Test timers record nothing while profiling is disabled."""
+    local = Profiler()
+    with local.timer("noop"):
+        pass
+    assert not local.histograms
+
+
+def test_profiler_timer_and_dump(tmp_path):
+    """Test timers record durations and dumps are JSON."""
+    local = Profiler()
+    local.enabled = True
+    with local.timer("op"):
+        pass
+    with pytest.raises(RuntimeError), local.timer("op"):
+        raise RuntimeError
+    assert local.histograms["op"].count == 2
+    dump_filepath = tmp_path / "profile.json"
+    local.dump(dump_filepath)
+    assert json.loads(dump_filepath.read_text())["op"]["count"] == 2
+    local.reset()
+    assert not local.to_dict()
+
+
+def test_profiled(enabled_profiler):
+    """Test decorated functions record durations only while enabled."""
+
+    @profiled("test.double")
+    def double(value: int) -> int:
+        """Return twice value."""
+        return value * 2
+
+    assert double(2) == 4
+    assert enabled_profiler.histograms["test.double"].count == 1
+    enabled_profiler.enabled = False
+    assert double(3) == 6
+    assert enabled_profiler.histograms["test.double"].count == 1
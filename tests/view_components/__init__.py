@@ -0,0 +1 @@
+"""Test suite for view_components package."""
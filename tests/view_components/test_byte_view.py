@@ -0,0 +1,40 @@
+"""Unit tests for ByteView component."""
+from rich.console import Console
+
+from hexabyte.constants import DisplayMode
+from hexabyte.view_components import ByteView
+
+
+def test_layout_follows_length():
+    """Test the layout is recomputed only when the data size or a setting changes."""
+    data = bytearray(range(32))
+    view = ByteView(lambda offset, size: data[offset : offset + size], data.__len__, offsets=True)
+    layout = view.layout
+    assert view.line_count == 2
+    assert view.height == 3
+    assert view.offsets_column_width == len(hex(32)) + 3
+    assert view.layout is layout
+    data.extend(bytes(0x1000))
+    assert view.layout is not layout
+    assert view.line_count == 258
+    assert view.offsets_column_width == len(hex(0x1020)) + 3
+    view.view_mode = DisplayMode.BIN
+    assert view.layout.data_width == 132
+
+
+def test_reads_lines_on_demand():
+    """Test rendering reads each line through the reader."""
+    data = bytes(range(40))
+    reads = []
+
+    def reader(offset: int, size: int) -> bytes:
+        reads.append((offset, size))
+        return data[offset : offset + size]
+
+    view = ByteView(reader, data.__len__, view_mode=DisplayMode.HEX)
+    console = Console(width=80)
+    with console.capture() as capture:
+        console.print(view)
+    assert reads == [(0, 16), (16, 16), (32, 16)]
+    assert capture.get().splitlines()[0].startswith("00010203")
+    assert ByteView.from_data(data).line_count == 3
@@ -0,0 +1,41 @@
+"""Unit tests for HCView component."""
+from hilbertcurve.hilbertcurve import HilbertCurve
+from rich.console import Console
+
+from hexabyte.view_components import HCView
+from hexabyte.view_components.hc_view import hilbert_index_table, percent_to_red, style_palette
+
+
+def test_hilbert_index_table():
+    """Test index table matches the hilbert curve distances."""
+    curve = HilbertCurve(3, 2, 0)
+    table = hilbert_index_table(3)
+    assert table.shape == (8, 8)
+    for y in range(8):
+        for x in range(8):
+            assert table[y, x] == curve.distance_from_point([y, x])
+    assert hilbert_index_table(3) is table
+    assert not table.flags.writeable
+
+
+def test_style_palette():
+    """Test palette entries are shared styles."""
+    palette = style_palette(percent_to_red)
+    assert len(palette) == 256
+    assert palette[0].bgcolor == percent_to_red(0)
+    assert palette[255].bgcolor == percent_to_red(1)
+    assert style_palette(percent_to_red) is palette
+
+
+def test_generate_line():
+    """Test lines merge equal cells and pad missing data."""
+    view = HCView([1.0] * 16 + [0.0] * 4, hc_iterations=2)
+    console = Console()
+    segments = list(view.generate_line(0, console))
+    assert sum(len(segment.text) for segment in segments) == view.width
+    assert view.size.height == 8
+    for y in range(4, 8):
+        line = list(view.generate_line(y, console))
+        assert len(line) == 1
+        assert line[0].style == style_palette(percent_to_red)[0]
+    assert view.coord2idx(0, 4) == 16
@@ -0,0 +1,35 @@
+"""Unit tests for byte view layout."""
+from hexabyte.constants import DisplayMode
+from hexabyte.view_components import Layout
+
+
+def test_metrics():
+    """Test metrics computed from layout parameters."""
+    layout = Layout(0x1000, DisplayMode.HEX, 4, 4, offsets=True, hex_offsets=True)
+    assert layout.line_byte_length == 16
+    assert layout.line_bit_length == 128
+    assert layout.line_count == 0x100
+    assert layout.height == 0x101
+    assert layout.column_width == 9
+    assert layout.data_width == 36
+    assert layout.offsets_column_width == len("0x1000") + 3
+    assert layout.data_x == layout.offsets_column_width + 1
+    assert layout.width == layout.data_x + layout.data_width
+    assert Layout(0x1000, DisplayMode.HEX, 4, 4, offsets=True, hex_offsets=False).offsets_column_width == 7
+    assert Layout(0x1000, DisplayMode.UTF8, 1, 16).width == 17
+
+
+def test_bit_at():
+    """Test hit testing maps characters to bit offsets."""
+    layout = Layout(0x100, DisplayMode.HEX, 4, 4)
+    assert layout.bit_at(0, 0) == 0
+    assert layout.bit_at(1, 0) == 4
+    assert layout.bit_at(2, 0) == 8
+    assert layout.bit_at(8, 0) == layout.bit_at(7, 0) == 28
+    assert layout.bit_at(9, 1) == 128 + 32
+    assert layout.bit_at(100, 0) == 124
+    assert layout.bit_at(-1, 0) is None
+    binary = Layout(0x100, DisplayMode.BIN, 2, 1, offsets=True)
+    assert binary.bit_at(binary.data_x - 1, 0) is None
+    assert binary.bit_at(binary.data_x + 9 + 3, 2) == 2 * 16 + 8 + 3
+    assert binary.line_of(31) == 1
@@ -0,0 +1,103 @@
+"""Unit tests for the Editor widget."""
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import pytest
+from textual.app import App, ComposeResult
+
+from hexabyte.api import DataAPI
+from hexabyte.constants import FileMode
+from hexabyte.constants.sizes import BYTE_BITS
+from hexabyte.context import context
+from hexabyte.widgets.editor import Editor
+
+TEST_DATA = bytes(range(256))
+
+
+class EditorApp(App):
+    """Application displaying a single editor."""
+
+    def __init__(self, editor: Editor) -> None:
+        """Initialize the application."""
+        super().__init__()
+        self.editor = editor
+
+    def compose(self) -> ComposeResult:
+        """Compose the editor."""
+        yield self.editor
+
+
+@pytest.fixture
+def editor(tmp_path, monkeypatch):
+    """Provide an editor recording applied cursor moves and sent commands."""
+    context.file_mode = FileMode.NORMAL
+    filepath = tmp_path / "data.bin"
+    filepath.write_bytes(TEST_DATA)
+    editor = Editor(DataAPI(filepath), id="primary")
+    editor.moves = []
+    editor.cmds = []
+    apply_cursor_move = editor._apply_cursor_move  # pylint: disable=protected-access
+
+    def record_cursor_move() -> None:
+        if editor._pending_cursor is not None:  # pylint: disable=protected-access
+            editor.moves.append(editor._pending_cursor)  # pylint: disable=protected-access
+        apply_cursor_move()
+
+    monkeypatch.setattr(editor, "_apply_cursor_move", record_cursor_move)
+    monkeypatch.setattr(editor, "send_cmd", editor.cmds.append)
+    return editor
+
+
+def run(editor: Editor, test: Callable[[Any], Coroutine]) -> None:
+    """Run a test coroutine with the editor mounted in a headless application."""
+
+    async def run_test() -> None:
+        async with EditorApp(editor).run_test() as pilot:
+            await pilot.pause()
+            await test(pilot)
+
+    asyncio.run(run_test())
+
+
+def test_goto_coalesced(editor):  # pylint: disable=redefined-outer-name
+    """Test several moves before a refresh are applied as a single cursor update."""
+
+    async def test(pilot) -> None:
+        for offset in (8, 16, 24):
+            editor.goto(offset * BYTE_BITS)
+        assert editor.cursor == 0
+        await pilot.pause()
+        assert editor.moves == [24 * BYTE_BITS]
+        assert editor.cursor == editor.api.cursor.bit == 24 * BYTE_BITS
+
+    run(editor, test)
+
+
+def test_goto_clamped(editor):  # pylint: disable=redefined-outer-name
+    """Test moves are clamped to the data."""
+
+    async def test(pilot) -> None:
+        editor.goto(-BYTE_BITS)
+        await pilot.pause()
+        assert editor.cursor == 0
+        editor.goto((len(TEST_DATA) + 10) * BYTE_BITS)
+        await pilot.pause()
+        assert editor.cursor == len(TEST_DATA) * BYTE_BITS
+
+    run(editor, test)
+
+
+def test_insert_applies_pending_move(editor):  # pylint: disable=redefined-outer-name
+    """Test inserting at the cursor applies a pending move first."""
+
+    async def test(pilot) -> None:
+        editor.goto(16 * BYTE_BITS)
+        editor.insert_at_cursor("a")
+        assert editor.moves == [16 * BYTE_BITS]
+        assert editor.cmds == [f"set nibble 16 0 0xa; goto bit {16 * BYTE_BITS + editor.cursor_increment}"]
+        await pilot.pause()
+        assert editor.moves == [16 * BYTE_BITS]
+        assert editor.cursor == 16 * BYTE_BITS
+
+    run(editor, test)
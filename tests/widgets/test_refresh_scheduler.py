@@ -0,0 +1,66 @@
+"""Unit tests for the refresh scheduler."""
+from hexabyte.widgets.refresh_scheduler import RefreshScheduler
+
+
+class RecordingView:
+    """Record the refresh calls made by a scheduler."""
+
+    def __init__(self) -> None:
+        """Initialize recorded calls."""
+        self.scroll_y = 0.0
+        self.calls: list[tuple] = []
+        self.callbacks: list = []
+
+    def call_later(self, callback) -> None:
+        """Record scheduled callback."""
+        self.callbacks.append(callback)
+
+    def set_timer(self, _delay: float, callback, name: str = "") -> None:  # pylint: disable=unused-argument
+        """Record scheduled callback."""
+        self.callbacks.append(callback)
+
+    def refresh(self) -> None:
+        """Record full refresh."""
+        self.calls.append(("refresh",))
+
+    def refresh_lines(self, start: int, count: int) -> None:
+        """Record line refresh."""
+        self.calls.append(("lines", start, count))
+
+    def scroll_to(self, y: int, animate: bool) -> None:  # pylint: disable=unused-argument
+        """Record scroll."""
+        self.scroll_y = y
+        self.calls.append(("scroll", y))
+
+
+def test_coalesced_lines():
+    """Test requests made before a frame are applied together."""
+    view = RecordingView()
+    scheduler = RefreshScheduler(view)  # type: ignore[arg-type]
+    scheduler.refresh_lines(5)
+    scheduler.refresh_lines(3, 2)
+    scheduler.refresh_lines(9)
+    assert len(view.callbacks) == 1
+    assert scheduler.pending
+    view.callbacks.pop()()
+    assert view.calls == [("lines", 3, 3), ("lines", 9, 1)]
+    assert (scheduler.requests, scheduler.flushes, scheduler.coalesced) == (3, 1, 2)
+    assert not scheduler.pending
+
+
+def test_scroll_supersedes_repaints():
+    """Test scroll targets replace earlier targets and make line repaints redundant."""
+    view = RecordingView()
+    scheduler = RefreshScheduler(view, fps=0)  # type: ignore[arg-type]
+    scheduler.refresh_lines(1)
+    scheduler.scroll_to(10)
+    scheduler.scroll_to(20)
+    assert scheduler.scroll_y == 20
+    view.callbacks.pop()()
+    assert view.calls == [("scroll", 20)]
+    assert scheduler.dropped == 2
+    scheduler.refresh_lines(21)
+    scheduler.refresh()
+    view.callbacks.pop()()
+    assert view.calls[-1] == ("refresh",)
+    assert scheduler.dropped == 3